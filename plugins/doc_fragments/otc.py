@@ -100,6 +100,65 @@ options:
     type: str
     default: WARN
     choices: [ERROR, WARN, INFO, DEBUG]
+  auth_cache:
+    description:
+      - Reuse the authentication token across module runs.
+      - The token is stored in I(cache_dir) in a file only readable by the
+        current user and is renewed when it is about to expire.
+    type: bool
+    default: no
+  cache_dir:
+    description:
+      - Directory holding the on-disk caches of the collection.
+      - Defaults to C(opentelekomcloud.cloud) below C($XDG_CACHE_HOME) or
+        C(~/.cache).
+    type: path
+  discovery_cache:
+    description:
+      - Reuse service version discovery documents across module runs.
+      - Documents are stored in I(cache_dir) and refreshed after I(cache_ttl)
+        seconds. The service catalog itself is part of the token, see
+        I(auth_cache).
+    type: bool
+    default: no
+  resolve_cache:
+    description:
+      - Reuse the IDs of resources referenced by name, i.e. networks and
+        routers, across module runs.
+      - The mappings are stored in I(cache_dir) per cloud, project and
+        region and expire after I(cache_ttl) seconds. Modules creating or
+        deleting resources drop the mappings of that resource type.
+    type: bool
+    default: no
+  catalog_cache:
+    description:
+      - Reuse catalogs like compute flavors and images or RDS and DDS
+        flavors across module runs.
+      - The catalogs are stored in I(cache_dir) per cloud, project and
+        region and are listed again after I(cache_ttl) seconds, or when an
+        entry referenced by name or ID is missing.
+    type: bool
+    default: no
+  cache_ttl:
+    description:
+      - Lifetime in seconds of entries in the on-disk caches.
+    type: int
+    default: 3600
+  broker:
+    description:
+      - Send API requests through a local connection broker.
+      - The broker is started on first use and listens on a socket in
+        I(cache_dir) only accessible by the current user. It keeps
+        authenticated connections with keep-alive HTTP sessions across module
+        runs, so modules skip authentication and TLS handshakes.
+      - If the broker cannot be started the module connects directly.
+    type: bool
+    default: no
+  broker_idle_timeout:
+    description:
+      - Seconds after which an unused broker exits.
+    type: int
+    default: 600
 requirements:
   - python >= 3.6
   - openstacksdk >= 0.36.0
@@ -113,3 +172,64 @@ notes:
     plays. More information can be found at
     U(https://docs.openstack.org/openstacksdk/)
 '''
+
+    # Options shared by all info modules
+    INFO = r'''
+options:
+  fields:
+    description:
+      - Attributes to return for every resource of the result, all
+        attributes are returned if not set.
+      - Nested attributes are given as dotted path, i.e. C(status.status).
+    type: list
+    elements: str
+  compact:
+    description:
+      - Drop attributes without value from every resource of the result.
+    type: bool
+    default: no
+  output_file:
+    description:
+      - Path of a file on the target host the resources are written to as
+        JSON Lines, one resource per line, while they are fetched.
+      - The result then contains only the path as I(output_file) and the
+        number of resources written per result key as I(counts).
+    type: path
+  count_only:
+    description:
+      - Only count the resources, the result then contains the number of
+        resources per result key as I(counts).
+      - Where the API reports a total it is used instead of listing all
+        resources. Paging options like I(limit), I(marker) and I(offset)
+        are then ignored, the total covers all pages.
+    type: bool
+    default: no
+  ids_only:
+    description:
+      - Return only the IDs of the resources instead of their attributes.
+    type: bool
+    default: no
+  regions:
+    description:
+      - Query all of these regions at the same time instead of the region
+        of the connection. One connection is built per region with the
+        other connection parameters, so the credentials have to be valid in
+        every region.
+      - The results of all regions are merged, every resource gets a
+        I(region) attribute. With I(ids_only) the resources are returned as
+        I(id) and I(region) attributes.
+    type: list
+    elements: str
+  projects:
+    description:
+      - Query all of these projects, given by name or ID, at the same time
+        instead of the project of the connection.
+      - The connection of the module, usually scoped to the domain,
+        authenticates once and its token is exchanged for a token of every
+        project.
+      - The results of all projects are merged, every resource gets a
+        I(project) attribute holding the project name. Combined with
+        I(regions) every project is queried in every region.
+    type: list
+    elements: str
+'''
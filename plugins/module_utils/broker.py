@@ -0,0 +1,330 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Local connection broker shared by module runs.
+
+The broker is a daemon bound to a Unix socket of the current user. It keeps
+authenticated SDK connections and their keep-alive HTTP sessions warm, so
+modules neither authenticate nor do TLS handshakes themselves. Modules route
+the HTTP traffic of their SDK connection through the broker with
+`BrokerAdapter` and get their token from it.
+"""
+
+import base64
+import json
+import os
+import socket
+import struct
+import threading
+import time
+
+_HEADER = struct.Struct('!I')
+
+
+class BrokerError(Exception):
+    """Raised when the broker reports a failure."""
+
+
+def _read_exactly(fp, size):
+    data = b''
+    while len(data) < size:
+        chunk = fp.read(size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return data
+
+
+def _send_message(fp, message):
+    payload = json.dumps(message).encode('utf-8')
+    fp.write(_HEADER.pack(len(payload)) + payload)
+    fp.flush()
+
+
+def _recv_message(fp):
+    header = _read_exactly(fp, _HEADER.size)
+    if header is None:
+        return None
+    payload = _read_exactly(fp, _HEADER.unpack(header)[0])
+    if payload is None:
+        return None
+    return json.loads(payload.decode('utf-8'))
+
+
+class BrokerClient:
+    """Client side of the broker socket.
+
+    Args:
+        path: Path of the broker socket.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def call(self, message):
+        """Send a message to the broker and return its reply.
+        """
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(self.path)
+            with sock.makefile('rwb') as fp:
+                _send_message(fp, message)
+                reply = _recv_message(fp)
+        finally:
+            sock.close()
+        if reply is None:
+            raise BrokerError('Broker closed the connection')
+        if 'error' in reply:
+            raise BrokerError(reply['error'])
+        return reply
+
+    def available(self):
+        try:
+            self.call({'op': 'ping'})
+        except (OSError, BrokerError):
+            return False
+        return True
+
+    def auth_state(self, key, config, min_token_life):
+        """Return the auth state of the broker connection for `config`.
+
+        Arguments:
+            key {str} -- Cache key of the resolved cloud config.
+            config {dict} -- Arguments for `openstack.connect`.
+            min_token_life {int} -- Tokens expiring sooner are renewed.
+
+        Returns:
+            str -- Auth state suitable for `set_auth_state`.
+        """
+        return self.call(dict(
+            op='auth', key=key, config=config,
+            min_token_life=min_token_life))['auth_state']
+
+
+class BrokerAdapter:
+    """Requests transport adapter sending requests through the broker.
+
+    Mounted on the requests session of an SDK connection it replaces the
+    default HTTP adapter, the broker sends the request with its own pooled
+    session and the response is rebuilt locally.
+
+    Args:
+        client: BrokerClient to use.
+        key: Cache key of the resolved cloud config.
+        config: Arguments for `openstack.connect`.
+    """
+
+    def __init__(self, client, key, config):
+        self.client = client
+        self.key = key
+        self.config = config
+
+    def send(self, request, stream=False, timeout=None, verify=True,
+             cert=None, proxies=None):
+        from requests import exceptions
+        from requests.models import Response
+        from requests.structures import CaseInsensitiveDict
+        from requests.utils import get_encoding_from_headers
+
+        body = request.body
+        if body is None:
+            body = b''
+        elif isinstance(body, str):
+            body = body.encode('utf-8')
+        elif hasattr(body, 'read'):
+            body = body.read()
+        elif not isinstance(body, bytes):
+            body = b''.join(body)
+        try:
+            reply = self.client.call(dict(
+                op='request', key=self.key, config=self.config,
+                method=request.method, url=request.url,
+                headers=list(request.headers.items()),
+                body=base64.b64encode(body).decode('ascii'),
+                timeout=timeout, verify=verify, cert=cert))
+        except (OSError, BrokerError) as e:
+            raise exceptions.ConnectionError(e, request=request)
+
+        response = Response()
+        response.status_code = reply['status']
+        response.reason = reply['reason']
+        response.headers = CaseInsensitiveDict(reply['headers'])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = reply['url']
+        response.request = request
+        response.connection = self
+        response._content = base64.b64decode(reply['body'])
+        response._content_consumed = True
+        return response
+
+    def close(self):
+        pass
+
+
+class _Broker:
+
+    def __init__(self, idle_timeout):
+        self.idle_timeout = idle_timeout
+        self.last_used = time.time()
+        self.connections = {}
+        self.lock = threading.Lock()
+
+    def connection(self, key, config):
+        with self.lock:
+            conn = self.connections.get(key)
+            if conn is None:
+                import openstack
+                conn = self.connections[key] = openstack.connect(**config)
+        return conn
+
+    def idle(self):
+        return time.time() - self.last_used > self.idle_timeout
+
+    def dispatch(self, message):
+        self.last_used = time.time()
+        op = message.get('op')
+        if op == 'ping':
+            return {}
+        conn = self.connection(message['key'], message['config'])
+        if op == 'auth':
+            auth = conn.config.get_auth()
+            if (auth.auth_ref is not None
+                    and auth.auth_ref.will_expire_soon(
+                        message['min_token_life'])):
+                auth.invalidate()
+            conn.authorize()
+            return {'auth_state': auth.get_auth_state()}
+        if op == 'request':
+            return self.request(conn, message)
+        raise BrokerError('Unknown operation %s' % op)
+
+    def request(self, conn, message):
+        import requests
+
+        prepared = requests.Request(
+            method=message['method'], url=message['url'],
+            headers=dict(message['headers']),
+            data=base64.b64decode(message['body']) or None).prepare()
+        timeout = message['timeout']
+        if isinstance(timeout, list):
+            timeout = tuple(timeout)
+        cert = message['cert']
+        if isinstance(cert, list):
+            cert = tuple(cert)
+        response = conn.session.session.send(
+            prepared, timeout=timeout, verify=message['verify'], cert=cert,
+            allow_redirects=False)
+        return dict(
+            status=response.status_code,
+            reason=response.reason,
+            headers=list(response.headers.items()),
+            url=response.url,
+            body=base64.b64encode(response.content).decode('ascii'))
+
+
+def serve(path, idle_timeout):
+    """Run the broker until it was idle for `idle_timeout` seconds.
+
+    Only one broker serves a socket, a second one exits immediately.
+    """
+    import fcntl
+    import socketserver
+
+    lock = open(path + '.lock', 'a')
+    try:
+        fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock.close()
+        return
+    if os.path.exists(path):
+        # Left behind by a broker which did not shut down cleanly
+        os.unlink(path)
+
+    broker = _Broker(idle_timeout)
+
+    class Handler(socketserver.StreamRequestHandler):
+
+        def handle(self):
+            message = _recv_message(self.rfile)
+            if message is None:
+                return
+            try:
+                reply = broker.dispatch(message)
+            except Exception as e:
+                # Any failure is reported to the module instead of killing
+                # the handler thread
+                reply = {'error': '%s: %s' % (type(e).__name__, e)}
+            _send_message(self.wfile, reply)
+
+    # The socket hands out tokens, so it must never be accessible by other
+    # users, not even between bind() and a later chmod.
+    umask = os.umask(0o077)
+    try:
+        server = socketserver.ThreadingUnixStreamServer(path, Handler)
+    finally:
+        os.umask(umask)
+    server.daemon_threads = True
+
+    def watchdog():
+        while not broker.idle():
+            time.sleep(1)
+        server.shutdown()
+
+    threading.Thread(target=watchdog, daemon=True).start()
+    try:
+        server.serve_forever(poll_interval=1)
+    finally:
+        server.server_close()
+        os.unlink(path)
+        lock.close()
+
+
+def _daemonize(path, idle_timeout):
+    os.setsid()
+    if os.fork():
+        os._exit(0)
+    os.chdir('/')
+    # Ansible waits for the module output streams to be closed
+    devnull = os.open(os.devnull, os.O_RDWR)
+    for fd in (0, 1, 2):
+        os.dup2(devnull, fd)
+    os.closerange(3, os.sysconf('SC_OPEN_MAX'))
+    serve(path, idle_timeout)
+
+
+def start_broker(path, idle_timeout, wait=10):
+    """Return a client of the broker, starting the broker if needed.
+
+    Arguments:
+        path {str} -- Path of the broker socket.
+        idle_timeout {int} -- Seconds after which an unused broker exits.
+        wait {int} -- Seconds to wait for a new broker to listen.
+
+    Returns:
+        BrokerClient -- Client of the running broker.
+    """
+    client = BrokerClient(path)
+    if client.available():
+        return client
+    os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+    pid = os.fork()
+    if pid == 0:
+        try:
+            _daemonize(path, idle_timeout)
+        finally:
+            os._exit(0)
+    os.waitpid(pid, 0)
+    deadline = time.time() + wait
+    while time.time() < deadline:
+        if client.available():
+            return client
+        time.sleep(0.05)
+    raise BrokerError('Broker did not start listening on %s' % path)
@@ -0,0 +1,418 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import array
+import hashlib
+import json
+import math
+import os
+import tempfile
+import time
+
+
+def default_cache_dir():
+    """Return the directory used for on-disk caches if none is configured.
+    """
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+        os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'opentelekomcloud.cloud')
+
+
+def config_cache_key(cloud_region):
+    """Build a stable key for a resolved cloud configuration.
+
+    Only the values identifying who is authenticated against which project
+    and region take part in the key, secrets are never part of it. Configs
+    authenticating with the token of another connection carry the key of
+    that connection as `parent_cache_key`, it identifies the user.
+
+    Arguments:
+        cloud_region {CloudRegion} -- Resolved SDK cloud configuration.
+
+    Returns:
+        str -- Hex digest identifying the configuration.
+    """
+    auth = cloud_region.config.get('auth') or {}
+    parts = dict(
+        auth_url=auth.get('auth_url'),
+        domain=auth.get('domain_id') or auth.get('domain_name'),
+        project=auth.get('project_id') or auth.get('project_name'),
+        project_domain=(auth.get('project_domain_id')
+                        or auth.get('project_domain_name')),
+        user=auth.get('user_id') or auth.get('username'),
+        user_domain=(auth.get('user_domain_id')
+                     or auth.get('user_domain_name')),
+        region=cloud_region.get_region_name(),
+    )
+    parent = cloud_region.config.get('parent_cache_key')
+    if parent:
+        parts['parent'] = parent
+    return hashlib.sha256(
+        json.dumps(parts, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+class FileCache:
+    """JSON document persisted in a file readable only by its owner.
+
+    Writes go through a temporary file in the same directory, so concurrent
+    readers never see a partially written document.
+
+    Args:
+        path: Location of the cache file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def load(self):
+        """Return the cached document or None if it is missing or broken.
+        """
+        try:
+            with open(self.path) as fp:
+                return json.load(fp)
+        except (IOError, OSError, ValueError):
+            return None
+
+    def save(self, data):
+        """Persist the document with 0600 permissions.
+        """
+        directory = os.path.dirname(self.path)
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        # mkstemp creates the file with 0600 already
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'w') as fp:
+                json.dump(data, fp)
+            os.replace(tmp_path, self.path)
+        except (IOError, OSError):
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def remove(self):
+        """Drop the cached document if present.
+        """
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+
+class DiscoveryCache(dict):
+    """Version discovery cache shared by all module runs.
+
+    The object replaces the discovery cache of a keystoneauth session.
+    Discovery documents fetched by earlier runs and younger than `ttl`
+    seconds are served from the cache file instead of being requested from
+    the service again.
+
+    Args:
+        cache_file: FileCache holding the documents.
+        ttl: Lifetime of a cached document in seconds.
+    """
+
+    def __init__(self, cache_file, ttl):
+        super().__init__()
+        self.cache_file = cache_file
+        self.hits = 0
+        self.misses = 0
+        self._stored = {}
+        now = time.time()
+        for url, entry in (cache_file.load() or {}).items():
+            try:
+                if now - entry['fetched_at'] < ttl:
+                    self._stored[url] = entry
+            except (KeyError, TypeError):
+                continue
+
+    def get(self, url, default=None):
+        if url in self:
+            return super().get(url)
+        if url in self._stored:
+            self.hits += 1
+            self[url] = self._restore(url, self._stored[url]['versions'])
+            return self[url]
+        self.misses += 1
+        return default
+
+    @staticmethod
+    def _restore(url, versions):
+        from keystoneauth1 import discover
+        # Discover fetches the document in its constructor, so bypass it and
+        # set the state it would have built.
+        disc = discover.Discover.__new__(discover.Discover)
+        disc._url = url
+        disc._data = versions
+        return disc
+
+    def save(self):
+        """Persist documents fetched during this run.
+        """
+        if not self.misses:
+            return
+        entries = dict(self._stored)
+        now = time.time()
+        for url, disc in self.items():
+            if url in entries:
+                continue
+            entries[url] = dict(
+                fetched_at=now,
+                versions=disc.raw_version_data(
+                    allow_experimental=True, allow_deprecated=True,
+                    allow_unknown=True))
+        self.cache_file.save(entries)
+
+
+class ResolverCache:
+    """Name to ID mappings shared by module runs.
+
+    Entries are grouped by resource kind, i.e. `network.router`. Modules
+    creating or deleting resources of a kind invalidate all its entries, so
+    other runs resolve the names again.
+
+    Args:
+        cache_file: FileCache holding the mappings.
+        ttl: Lifetime of a mapping in seconds.
+    """
+
+    def __init__(self, cache_file, ttl):
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._added = {}
+        self._invalidated = set()
+        self._entries = self._load()
+
+    def _load(self):
+        entries = {}
+        now = time.time()
+        for kind, names in (self.cache_file.load() or {}).items():
+            try:
+                entries[kind] = dict(
+                    (name, entry) for name, entry in names.items()
+                    if now - entry['fetched_at'] < self.ttl)
+            except (AttributeError, KeyError, TypeError):
+                continue
+        return entries
+
+    def get(self, kind, name):
+        """Return the cached ID of resource `name` of `kind` or None.
+        """
+        entry = self._entries.get(kind, {}).get(name)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry['id']
+
+    def set(self, kind, name, resource_id):
+        """Remember that resource `name` of `kind` has ID `resource_id`.
+        """
+        entry = dict(id=resource_id, fetched_at=time.time())
+        self._entries.setdefault(kind, {})[name] = entry
+        self._added.setdefault(kind, {})[name] = entry
+
+    def invalidate(self, kind):
+        """Drop all mappings of resources of `kind`.
+
+        Kinds are matched by their resource name, so invalidating `subnet`
+        drops `vpc.subnet` and `network.subnet`.
+        """
+        self._invalidated.add(kind)
+        for mappings in (self._entries, self._added):
+            for cached in list(mappings):
+                if cached.rpartition('.')[2] == kind:
+                    del mappings[cached]
+
+    def save(self):
+        """Merge the changes of this run into the cache file.
+
+        The file is read again first, so mappings stored by concurrent runs
+        are kept unless their kind was invalidated by this run.
+        """
+        if not self._added and not self._invalidated:
+            return
+        entries = dict(
+            (kind, names) for kind, names in self._load().items()
+            if kind.rpartition('.')[2] not in self._invalidated)
+        for kind, names in self._added.items():
+            entries.setdefault(kind, {}).update(names)
+        self.cache_file.save(entries)
+
+
+def _number(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float('nan')
+
+
+class Catalog:
+    """Entries of a resource catalog indexed by their attributes.
+
+    Indexes are built on first use of an attribute, i.e. `id`, `name`,
+    `vcpus` or `ram`. `select` evaluates constraints column by column over
+    arrays of the attribute values instead of entry by entry.
+
+    Args:
+        entries: Serialized resources of the catalog.
+        cached: Whether the entries were served from the on-disk cache.
+    """
+
+    def __init__(self, entries, cached=False):
+        self.entries = entries
+        self.cached = cached
+        self._indexes = {}
+        self._columns = {}
+
+    def index(self, attribute):
+        """Return the entries grouped by the value of `attribute`.
+        """
+        index = self._indexes.get(attribute)
+        if index is None:
+            index = self._indexes[attribute] = {}
+            for entry in self.entries:
+                index.setdefault(entry.get(attribute), []).append(entry)
+        return index
+
+    def find(self, **attrs):
+        """Return the entries whose attributes equal all `attrs`.
+        """
+        if not attrs:
+            return list(self.entries)
+        attribute, value = next(iter(attrs.items()))
+        return [entry for entry in self.index(attribute).get(value, [])
+                if all(entry.get(key) == val for key, val in attrs.items())]
+
+    def column(self, attribute, numeric=False):
+        """Return the values of `attribute` of all entries in entry order.
+
+        Numeric columns are arrays of floats, values which are missing or
+        no number are NaN and fail every comparison.
+        """
+        key = (attribute, numeric)
+        column = self._columns.get(key)
+        if column is None:
+            values = (entry.get(attribute) for entry in self.entries)
+            if numeric:
+                column = array.array('d', (_number(value) for value in values))
+            else:
+                column = list(values)
+            self._columns[key] = column
+        return column
+
+    def select(self, attrs=None, minimum=None, available_in=None,
+               order_by=None, limit=None):
+        """Return the entries meeting all constraints, best first.
+
+        Arguments:
+            attrs {dict} -- Attributes the entries have to equal.
+            minimum {dict} -- Lower bounds of numeric attributes.
+            available_in {str} -- Availability zone the entries have to be
+                in status `normal` in, according to their `az_status`.
+            order_by {list} -- Numeric attributes to sort by, descending if
+                prefixed with `-`. Entries without a value go last.
+            limit {int} -- Maximum number of entries to return.
+
+        Returns:
+            list -- The matching entries.
+        """
+        rows = list(range(len(self.entries)))
+        for attribute, value in (attrs or {}).items():
+            column = self.column(attribute)
+            rows = [row for row in rows if column[row] == value]
+        for attribute, value in (minimum or {}).items():
+            column = self.column(attribute, numeric=True)
+            rows = [row for row in rows if column[row] >= value]
+        if available_in:
+            column = self.column('az_status')
+            rows = [row for row in rows
+                    if isinstance(column[row], dict)
+                    and column[row].get(available_in) == 'normal']
+        if order_by:
+            keys = []
+            for attribute in order_by:
+                sign = -1 if attribute.startswith('-') else 1
+                keys.append((sign, self.column(attribute.lstrip('-'),
+                                               numeric=True)))
+            # Entries without a value go last
+            rows.sort(key=lambda row: tuple(
+                (math.isnan(column[row]), sign * column[row])
+                for sign, column in keys))
+        if limit is not None:
+            rows = rows[:limit]
+        return [self.entries[row] for row in rows]
+
+    def lookup(self, name_or_id):
+        """Return the entries with the given ID or else with that name.
+        """
+        return self.find(id=name_or_id) or self.find(name=name_or_id)
+
+
+class CatalogCache:
+    """Resource catalogs like flavors and images shared by module runs.
+
+    Args:
+        cache_file: FileCache holding the catalogs.
+        ttl: Lifetime of a catalog in seconds.
+    """
+
+    def __init__(self, cache_file, ttl):
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._stored = self._load()
+        self._fetched = {}
+        self._catalogs = {}
+
+    def _load(self):
+        catalogs = {}
+        now = time.time()
+        for name, catalog in (self.cache_file.load() or {}).items():
+            try:
+                if now - catalog['fetched_at'] < self.ttl:
+                    catalogs[name] = catalog
+            except (KeyError, TypeError):
+                continue
+        return catalogs
+
+    def get(self, name):
+        """Return the cached catalog `name` or None.
+        """
+        if name in self._catalogs:
+            return self._catalogs[name]
+        stored = self._stored.get(name)
+        if stored is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        catalog = Catalog(stored['entries'], cached=True)
+        self._catalogs[name] = catalog
+        return catalog
+
+    def set(self, name, entries):
+        """Store the entries of catalog `name` and return the catalog.
+        """
+        self._fetched[name] = dict(fetched_at=time.time(), entries=entries)
+        catalog = self._catalogs[name] = Catalog(entries)
+        return catalog
+
+    def save(self):
+        """Merge the catalogs fetched during this run into the cache file.
+        """
+        if not self._fetched:
+            return
+        catalogs = self._load()
+        catalogs.update(self._fetched)
+        self.cache_file.save(catalogs)
@@ -11,17 +11,60 @@
 # limitations under the License.
 
 import abc
-
-try:
-    import openstack as sdk
-    import otcextensions
-    from otcextensions import sdk as otc_sdk
-    from pkg_resources import parse_version as V
-    HAS_LIBRARIES = True
-except ImportError:
-    HAS_LIBRARIES = False
+import concurrent.futures
+import json
+import os
+import re
+import threading
+import traceback
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils import broker
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.cache import (
+    Catalog,
+    CatalogCache,
+    DiscoveryCache,
+    FileCache,
+    ResolverCache,
+    config_cache_key,
+    default_cache_dir,
+)
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.waiter import Waiter
+
+# Cached tokens expiring sooner than this are not reused, so a long running
+# module does not hit token expiry halfway through.
+AUTH_CACHE_STALE_SECONDS = 300
+
+# Number of regions or projects an info module queries at the same time.
+FANOUT_WORKERS = 8
+
+UUID_RE = re.compile(
+    r'^[0-9a-f]{8}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{12}$',
+    re.IGNORECASE)
+
+
+def parse_version(version):
+    """Parse the release part of a version string into a comparable tuple.
+
+    Replaces pkg_resources.parse_version, which scans every installed
+    distribution on import. Pre-release and local suffixes are ignored.
+
+    Arguments:
+        version {str} -- Version string, i.e. `0.10.1`.
+
+    Returns:
+        tuple -- Version as tuple of integers, empty if not parsable.
+    """
+    match = re.match(r'\d+(\.\d+)*', str(version or ''))
+    if not match:
+        return ()
+    return tuple(int(part) for part in match.group(0).split('.'))
+
+
+def is_uuid(value):
+    """Check whether a value has the form of a UUID, with or without dashes.
+    """
+    return isinstance(value, str) and bool(UUID_RE.match(value))
 
 
 def openstack_full_argument_spec(**kwargs):
@@ -42,7 +85,15 @@ def openstack_full_argument_spec(**kwargs):
             aliases=['endpoint_type']),
         sdk_log_path=dict(default=None, type='str'),
         sdk_log_level=dict(
-            default='WARN', type='str', choices=['ERROR', 'WARN', 'INFO', 'DEBUG'])
+            default='WARN', type='str', choices=['ERROR', 'WARN', 'INFO', 'DEBUG']),
+        auth_cache=dict(default=False, type='bool'),
+        cache_dir=dict(default=None, type='path'),
+        discovery_cache=dict(default=False, type='bool'),
+        resolve_cache=dict(default=False, type='bool'),
+        catalog_cache=dict(default=False, type='bool'),
+        cache_ttl=dict(default=3600, type='int'),
+        broker=dict(default=False, type='bool'),
+        broker_idle_timeout=dict(default=600, type='int'),
     )
     spec.update(kwargs)
     return spec
@@ -74,17 +125,42 @@ class OTCModule:
         check_versioned: helper function to check that all arguments are known
             in the current SDK version.
         run: method that executes and shall be overriden in inherited classes.
+        waiter: Create a Waiter, the polls of all waiters are returned as
+            `polls` in the module result.
+        connect: Build a further connection set up like `conn`.
+        resolve_id: Find the ID of a resource by name, cached on disk if
+            `resolve_cache` is set.
+        find_by_name_or_id: Find a resource by ID or unique name with as
+            few requests as possible.
+        catalog, catalog_id: Query catalogs like flavors and images, cached
+            on disk if `catalog_cache` is set.
+        invalidate_resolved: Drop cached IDs of a resource kind after
+            creating or deleting resources of it.
+
+    Threads:
+        `conn` may be shared by threads of a module sending independent
+        requests, i.e. tagging different resources. Token requests are
+        serialized by keystoneauth and the SDK shares connections the same
+        way for segmented uploads. Requests a service rejects or serializes
+        while another one is in progress, like actions on the same AS group
+        or router, are sent from a single thread one after another. Runs
+        against further regions or projects use their own connection built
+        with `connect`.
 
     Args:
         deprecated_names: Should specify deprecated modules names for current
             module.
         argument_spec: Used for construction of Openstack common arguments.
         module_kwargs: Additional arguments for Ansible Module.
+        otce_services: Names of the otcextensions services used by the
+            module. Only those are registered on the connection, all of them
+            are registered if not set.
     """
 
     argument_spec = {}
     module_kwargs = {}
     otce_min_version = None
+    otce_services = None
 
     def __init__(self):
 
@@ -95,8 +171,12 @@ class OTCModule:
         self.module_name = self.ansible._name
         self.sdk_version = None
         self.results = {'changed': False}
-        self.exit = self.exit_json = self.ansible.exit_json
-        self.fail = self.fail_json = self.ansible.fail_json
+        self.exit = self.exit_json
+        self.fail = self.fail_json
+        self.discovery_cache = None
+        self.resolver_cache = None
+        self.catalog_cache = None
+        self.waiters = []
         self.sdk, self.conn = self.openstack_cloud_from_module()
         self.setup_sdk_logging()
 
@@ -118,11 +198,207 @@ class OTCModule:
             self.ansible.log(
                 " ".join(['[DEBUG]', msg]))
 
+    def waiter(self, timeout, resource_type=None):
+        """Create a waiter polling with backoff for `resource_type`.
+
+        Arguments:
+            timeout {int} -- Seconds to wait in total.
+            resource_type {str} -- Key of `waiter.WAIT_PROFILES`.
+
+        Returns:
+            Waiter -- Waiter whose polls are reported in the result.
+        """
+        waiter = Waiter(timeout, resource_type)
+        self.waiters.append(waiter)
+        return waiter
+
+    def exit_json(self, **kwargs):
+        """Exit the module returning `kwargs` as result.
+        """
+        if self.waiters:
+            kwargs.setdefault(
+                'polls', sum(waiter.polls for waiter in self.waiters))
+        self.save_caches()
+        self.ansible.exit_json(**kwargs)
+
+    def fail_json(self, **kwargs):
+        """Fail the module returning `kwargs` as result.
+        """
+        self.save_caches()
+        self.ansible.fail_json(**kwargs)
+
+    def save_caches(self, caches=None):
+        """Persist the on-disk caches filled during this run.
+
+        Arguments:
+            caches {list} -- Tuples of the name and the cache to save, all
+                caches of the module if not set.
+        """
+        if caches is None:
+            caches = (('Discovery', self.discovery_cache),
+                      ('Resolver', self.resolver_cache),
+                      ('Catalog', self.catalog_cache))
+        for name, cache in caches:
+            if cache is None:
+                continue
+            self.debug('%s cache: %d hits, %d misses' % (
+                name, cache.hits, cache.misses))
+            try:
+                cache.save()
+            except (IOError, OSError) as e:
+                self.debug('Unable to write %s cache: %s' % (
+                    name.lower(), e))
+
+    def find_by_name_or_id(self, get, list_resources, name_or_id,
+                           kind='resource', match=None):
+        """Return the resource with the given ID or unique name.
+
+        `get` is only tried if `name_or_id` has the form of a UUID, so a
+        name costs no failing request. Otherwise, or if no resource has
+        that ID, the listing is consumed only until a second match shows
+        up, which fails the module. Some endpoints reject IDs they do not
+        know with 400 instead of 404, both fall back to the listing.
+
+        Arguments:
+            get {callable} -- Fetches a resource by ID.
+            list_resources {callable} -- Called with the name, returns an
+                iterable of resources. It should filter by name on the
+                server where the API supports it.
+            name_or_id {str} -- ID or name of the resource.
+            kind {str} -- Name of the resource kind in error messages.
+            match {callable} -- Additional check a listed resource has to
+                pass.
+
+        Returns:
+            The resource or None if it does not exist.
+        """
+        if is_uuid(name_or_id):
+            try:
+                return get(name_or_id)
+            except (self.sdk.exceptions.ResourceNotFound,
+                    self.sdk.exceptions.BadRequestException):
+                pass
+        found = None
+        for resource in list_resources(name_or_id):
+            if resource.name != name_or_id:
+                continue
+            if match is not None and not match(resource):
+                continue
+            if found is not None:
+                self.fail_json(
+                    msg='More than one %s with name %s found, please use '
+                        'the ID instead' % (kind, name_or_id))
+            found = resource
+        return found
+
+    def catalog(self, name, list_resources, refresh=False):
+        """Return a catalog of resources like flavors or images.
+
+        With `catalog_cache` set the catalog is served from the on-disk
+        cache shared by all module runs of the same cloud, project and
+        region, and stored there after it was listed.
+
+        Arguments:
+            name {str} -- Name of the catalog, including everything the
+                listing depends on, i.e. `rds.flavors.mysql.8.0`.
+            list_resources {callable} -- Lists the resources of the catalog.
+            refresh {bool} -- List the resources even if cached.
+
+        Returns:
+            Catalog -- The serialized resources with attribute indexes.
+        """
+        if self.catalog_cache is not None and not refresh:
+            catalog = self.catalog_cache.get(name)
+            if catalog is not None:
+                return catalog
+        entries = []
+        for resource in list_resources():
+            entry = resource.to_dict()
+            entry.pop('location', None)
+            entries.append(entry)
+        if self.catalog_cache is None:
+            return Catalog(entries)
+        return self.catalog_cache.set(name, entries)
+
+    def catalog_id(self, name, list_resources, find, name_or_id):
+        """Return the ID of a catalog entry given by name or ID.
+
+        Without `catalog_cache` the entry is looked up with `find`, which
+        is cheaper than listing the catalog once. A cached catalog missing
+        the entry is listed again, the entry may be newer than the cache.
+
+        Arguments:
+            name {str} -- Name of the catalog.
+            list_resources {callable} -- Lists the resources of the catalog.
+            find {callable} -- Proxy method finding a single resource.
+            name_or_id {str} -- Name or ID of the entry.
+
+        Returns:
+            str -- ID of the entry, None if it does not exist.
+        """
+        if self.catalog_cache is None:
+            resource = find(name_or_id, ignore_missing=True)
+            return resource.id if resource else None
+        catalog = self.catalog(name, list_resources)
+        entries = catalog.lookup(name_or_id)
+        if not entries and catalog.cached:
+            entries = self.catalog(
+                name, list_resources, refresh=True).lookup(name_or_id)
+        if len(entries) > 1:
+            self.fail_json(
+                msg='More than one entry with name %s found in %s' % (
+                    name_or_id, name))
+        return entries[0]['id'] if entries else None
+
+    def resolve_id(self, find, name_or_id, ignore_missing=True, **kwargs):
+        """Return the ID of the resource with the given name or ID.
+
+        With `resolve_cache` set the mapping is served from the on-disk
+        cache shared by all module runs of the same cloud, project and
+        region, and stored there after a lookup.
+
+        Arguments:
+            find {callable} -- Proxy method finding the resource, i.e.
+                `conn.network.find_router`.
+            name_or_id {str} -- Name or ID of the resource.
+            ignore_missing {bool} -- Return None instead of raising if the
+                resource does not exist.
+            kwargs {dict} -- Further arguments for `find`, lookups with
+                them are not cached.
+
+        Returns:
+            str -- ID of the resource, None if it does not exist.
+        """
+        kind = None
+        if self.resolver_cache is not None and not kwargs:
+            kind = '%s.%s' % (find.__self__.service_type,
+                              find.__name__[len('find_'):])
+            resource_id = self.resolver_cache.get(kind, name_or_id)
+            if resource_id:
+                return resource_id
+        resource = find(name_or_id, ignore_missing=ignore_missing, **kwargs)
+        if resource is None:
+            return None
+        if kind:
+            self.resolver_cache.set(kind, name_or_id, resource.id)
+        return resource.id
+
+    def invalidate_resolved(self, *kinds):
+        """Drop the cached IDs of resources of the given kinds.
+
+        Arguments:
+            kinds {str} -- Resource names, i.e. `router` or `subnet`.
+        """
+        if self.resolver_cache is None:
+            return
+        for kind in kinds:
+            self.resolver_cache.invalidate(kind)
+
     def setup_sdk_logging(self):
         log_path = self.params.get('sdk_log_path')
         if log_path is not None:
             log_level = self.params.get('sdk_log_level')
-            sdk.enable_logging(
+            self.sdk.enable_logging(
                 debug=True if log_level == 'DEBUG' else False,
                 http_debug=True if log_level == 'DEBUG' else False,
                 path=log_path
@@ -132,15 +408,20 @@ class OTCModule:
         if self.otce_min_version:
             min_version = self.otce_min_version
 
-        if not HAS_LIBRARIES:
+        # The SDK libraries take most of the module start up time, so they
+        # are only imported once a connection is actually needed.
+        try:
+            import openstack as sdk
+            import otcextensions
+        except ImportError:
             self.fail_json(msg='openstacksdk and otcextensions are required for this self')
 
         if min_version:
-            min_version = max(V('0.6.9'), V(min_version))
+            min_version = max('0.6.9', min_version, key=parse_version)
         else:
-            min_version = V('0.6.9')
+            min_version = '0.6.9'
 
-        if V(otcextensions.__version__) < min_version:
+        if parse_version(otcextensions.__version__) < parse_version(min_version):
             self.fail_json(
                 msg="To utilize this self, the installed version of "
                     "the otcextensions library MUST be >={min_version}".format(
@@ -162,11 +443,9 @@ class OTCModule:
                 # For 'interface' parameter, fail if we receive a non-default value
                 if self.params['interface'] != 'public':
                     self.fail_json(msg=fail_message.format(param='interface'))
-                conn = sdk.connect(**cloud_config)
-                otc_sdk.load(conn)
-                return sdk, conn
+                connect_kwargs = cloud_config
             else:
-                conn = sdk.connect(
+                connect_kwargs = dict(
                     cloud=cloud_config,
                     auth_type=self.params['auth_type'],
                     auth=self.params['auth'],
@@ -177,12 +456,175 @@ class OTCModule:
                     api_timeout=self.params['api_timeout'],
                     interface=self.params['interface'],
                 )
-                otc_sdk.load(conn)
-                return sdk, conn
+            self.connect_kwargs = connect_kwargs
+            conn = self.connect(**connect_kwargs)
+            self.resolver_cache, self.catalog_cache = self.open_caches(conn)
+            return sdk, conn
         except sdk.exceptions.SDKException as e:
             # Probably a cloud configuration/login error
             self.fail_json(msg=str(e))
 
+    def connect(self, **connect_kwargs):
+        """Build a connection set up like the one of the module.
+
+        The auth cache, broker, discovery cache and otcextensions services
+        are applied as configured by the module parameters. Connections to
+        further regions or projects are built with it as well.
+
+        Arguments:
+            connect_kwargs {dict} -- Arguments for `openstack.connect`.
+
+        Returns:
+            Connection -- Authorized SDK connection.
+        """
+        import openstack as sdk
+
+        conn = sdk.connect(**connect_kwargs)
+        if self.params['auth_cache']:
+            self.load_auth_cache(conn)
+        if self.params['broker']:
+            self.attach_broker(conn, connect_kwargs)
+        if self.params['discovery_cache']:
+            if self.discovery_cache is None:
+                self.discovery_cache = self.setup_discovery_cache(conn)
+            else:
+                self.discovery_cache.update(conn.session._discovery_cache)
+                conn.session._discovery_cache = self.discovery_cache
+        self.register_services(conn)
+        if self.params['auth_cache']:
+            self.store_auth_cache(conn)
+        return conn
+
+    def open_caches(self, conn):
+        """Open the resolver and catalog caches of a connection.
+
+        Both depend on the project and region of the connection.
+
+        Arguments:
+            conn {Connection} -- SDK connection.
+
+        Returns:
+            tuple -- ResolverCache and CatalogCache, None if not enabled.
+        """
+        resolver_cache = catalog_cache = None
+        if self.params['resolve_cache']:
+            resolver_cache = ResolverCache(
+                self._cache_file(conn, 'resolve'), self.params['cache_ttl'])
+        if self.params['catalog_cache']:
+            catalog_cache = CatalogCache(
+                self._cache_file(conn, 'catalog'), self.params['cache_ttl'])
+        return resolver_cache, catalog_cache
+
+    def register_services(self, conn):
+        """Register the otcextensions services used by the module.
+
+        Arguments:
+            conn {Connection} -- SDK connection.
+        """
+        from otcextensions import sdk as otc_sdk
+
+        if (self.otce_services is None
+                or not hasattr(otc_sdk, 'register_single_service')
+                or not hasattr(otc_sdk, 'patch_openstack_resources')):
+            otc_sdk.load(conn)
+            return
+        project_id = conn.current_project_id
+        for service_name in self.otce_services:
+            otc_sdk.register_single_service(conn, service_name, project_id)
+        # Done by load() as well, OTC error responses are parsed by it
+        otc_sdk.patch_openstack_resources()
+
+    def attach_broker(self, conn, connect_kwargs):
+        """Route the HTTP traffic of the connection through the broker.
+
+        The broker is started if it is not running yet. If that fails the
+        connection is left untouched and talks to the cloud directly.
+
+        Arguments:
+            conn {Connection} -- Not yet authorized SDK connection.
+            connect_kwargs {dict} -- Arguments the connection was built with.
+        """
+        cache_dir = self.params['cache_dir'] or default_cache_dir()
+        key = config_cache_key(conn.config)
+        try:
+            client = broker.start_broker(
+                os.path.join(cache_dir, 'broker', 'broker.sock'),
+                self.params['broker_idle_timeout'])
+            auth_state = client.auth_state(
+                key, connect_kwargs, AUTH_CACHE_STALE_SECONDS)
+        except (OSError, broker.BrokerError) as e:
+            self.debug('Connection broker not available: %s' % e)
+            return
+        conn.config.get_auth().set_auth_state(auth_state)
+        adapter = broker.BrokerAdapter(client, key, connect_kwargs)
+        for prefix in ('https://', 'http://'):
+            conn.session.session.mount(prefix, adapter)
+        self.debug('Using connection broker')
+
+    def _cache_file(self, conn, kind):
+        cache_dir = self.params['cache_dir'] or default_cache_dir()
+        return FileCache(os.path.join(
+            cache_dir, kind, config_cache_key(conn.config) + '.json'))
+
+    def setup_discovery_cache(self, conn):
+        """Serve version discovery of the connection from the on-disk cache.
+
+        Arguments:
+            conn {Connection} -- SDK connection which did no discovery yet.
+
+        Returns:
+            DiscoveryCache -- Cache installed into the connection session.
+        """
+        cache = DiscoveryCache(
+            self._cache_file(conn, 'discovery'), self.params['cache_ttl'])
+        cache.update(conn.session._discovery_cache)
+        conn.session._discovery_cache = cache
+        return cache
+
+    def load_auth_cache(self, conn):
+        """Install a previously cached token into the connection.
+
+        Tokens close to their expiry are ignored, so the connection
+        authenticates again instead.
+
+        Arguments:
+            conn {Connection} -- Not yet authorized SDK connection.
+        """
+        auth = conn.config.get_auth()
+        data = self._cache_file(conn, 'auth').load()
+        if not auth or not data or not data.get('auth_state'):
+            return
+        try:
+            auth.set_auth_state(data['auth_state'])
+        except (KeyError, TypeError, ValueError):
+            self.debug('Ignoring malformed cached token')
+            auth.invalidate()
+            return
+        if auth.auth_ref.will_expire_soon(AUTH_CACHE_STALE_SECONDS):
+            self.debug('Cached token is about to expire, reauthenticating')
+            auth.invalidate()
+        else:
+            self.debug('Reusing cached token')
+
+    def store_auth_cache(self, conn):
+        """Persist the token of the authorized connection if it changed.
+
+        Arguments:
+            conn {Connection} -- Authorized SDK connection.
+        """
+        auth = conn.config.get_auth()
+        state = auth.get_auth_state() if auth else None
+        if not state:
+            return
+        cache = self._cache_file(conn, 'auth')
+        data = cache.load() or {}
+        if data.get('auth_state') == state:
+            return
+        try:
+            cache.save({'auth_state': state})
+        except (IOError, OSError) as e:
+            self.debug('Unable to write token cache: %s' % e)
+
     # Filter out all arguments that are not from current SDK version
     def check_versioned(self, **kwargs):
         """Check that provided arguments are supported by current SDK version
@@ -195,10 +637,12 @@ class OTCModule:
         versioned_result = {}
         for var_name in kwargs:
             if ('min_ver' in self.argument_spec[var_name]
-                    and V(self.sdk_version) < self.argument_spec[var_name]['min_ver']):
+                    and parse_version(self.sdk_version)
+                    < parse_version(self.argument_spec[var_name]['min_ver'])):
                 continue
             if ('max_ver' in self.argument_spec[var_name]
-                    and V(self.sdk_version) > self.argument_spec[var_name]['max_ver']):
+                    and parse_version(self.sdk_version)
+                    > parse_version(self.argument_spec[var_name]['max_ver'])):
                 continue
             versioned_result.update({var_name: kwargs[var_name]})
         return versioned_result
@@ -214,7 +658,7 @@ class OTCModule:
         try:
             results = self.run()
             if results and isinstance(results, dict):
-                self.ansible.exit_json(**results)
+                self.exit_json(**results)
 
         except self.sdk.exceptions.OpenStackCloudException as e:
             params = {
@@ -226,4 +670,478 @@ class OTCModule:
                                         'text', 'None')
                 }
             }
-            self.ansible.fail_json(**params)
+            self.fail_json(**params)
+
+
+def project_fields(item, fields):
+    """Return a copy of `item` with only the given attributes.
+
+    Arguments:
+        item {dict} -- Resource as returned by `to_dict`.
+        fields {list} -- Attribute names, nested ones as dotted path.
+
+    Returns:
+        dict -- The selected attributes, nested ones keep their structure.
+    """
+    result = {}
+    for field in fields:
+        head, _, rest = field.partition('.')
+        if head not in item:
+            continue
+        value = item[head]
+        if not rest:
+            result[head] = value
+            continue
+        if isinstance(value, dict):
+            projected = project_fields(value, [rest])
+        elif isinstance(value, list):
+            projected = [project_fields(element, [rest])
+                         if isinstance(element, dict) else element
+                         for element in value]
+        else:
+            continue
+        previous = result.get(head)
+        if isinstance(previous, dict) and isinstance(projected, dict):
+            previous.update(projected)
+        elif isinstance(previous, list) and isinstance(projected, list):
+            for merged, element in zip(previous, projected):
+                if isinstance(merged, dict) and isinstance(element, dict):
+                    merged.update(element)
+        else:
+            result[head] = projected
+    return result
+
+
+def drop_none(value):
+    """Recursively drop keys without value from dicts."""
+    if isinstance(value, dict):
+        return dict((key, drop_none(item)) for key, item in value.items()
+                    if item is not None)
+    if isinstance(value, list):
+        return [drop_none(item) for item in value]
+    return value
+
+
+class ResultList(list):
+    """List collecting the resources of an info module result.
+
+    Every appended resource is shaped by the module first, so `fields` and
+    `compact` apply while the result is built.
+
+    Args:
+        shape: Callable applied to every appended resource.
+        serialize: Whether `add` serializes SDK resources, not needed if
+            the module only returns their IDs.
+    """
+
+    def __init__(self, shape, serialize=True):
+        super().__init__()
+        self.shape = shape
+        self.serialize = serialize
+        self.count = 0
+
+    def append(self, item):
+        self.count += 1
+        super().append(self.shape(item))
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+
+    def add(self, resource, drop=('location',)):
+        """Append an SDK resource serialized without the `drop` attributes.
+        """
+        if not self.serialize:
+            self.append(resource)
+            return
+        dt = resource.to_dict()
+        for name in drop:
+            dt.pop(name, None)
+        self.append(dt)
+
+
+class CountResultList(ResultList):
+    """Result list only counting the appended resources.
+
+    The count may be set from a total reported by the API instead.
+    """
+
+    def append(self, item):
+        self.count += 1
+
+
+class JsonLinesResultList(ResultList):
+    """Result list writing every resource as one JSON line to a file.
+
+    Appended resources are written right away and not kept in memory.
+
+    Args:
+        shape: Callable applied to every appended resource.
+        fp: File object opened for writing.
+        serialize: Whether `add` serializes SDK resources.
+    """
+
+    def __init__(self, shape, fp, serialize=True, lock=None):
+        super().__init__(shape, serialize)
+        self.fp = fp
+        self.lock = lock or threading.Lock()
+
+    def append(self, item):
+        self.count += 1
+        line = json.dumps(self.shape(item), default=str) + '\n'
+        with self.lock:
+            self.fp.write(line)
+
+
+class _RunExit(Exception):
+    """Ends a run of the module for a single region or project."""
+
+    def __init__(self, result, failed=False):
+        super().__init__()
+        self.result = result
+        self.failed = failed
+
+
+def merge_results(results):
+    """Merge the results of several runs of a module.
+
+    Lists are concatenated, dicts merged, `counts` summed up and `changed`
+    is true if it is for any run. Other values are taken from the first
+    run returning them.
+
+    Arguments:
+        results {list} -- Results of the runs.
+
+    Returns:
+        dict -- The merged result.
+    """
+    merged = {}
+    for result in results:
+        for key, value in result.items():
+            current = merged.get(key)
+            if key == 'changed':
+                merged[key] = bool(current) or bool(value)
+            elif key == 'counts' and isinstance(value, dict):
+                counts = merged.setdefault(key, {})
+                for name, count in value.items():
+                    counts[name] = counts.get(name, 0) + count
+            elif isinstance(value, list):
+                merged[key] = (current or []) + list(value)
+            elif isinstance(value, dict):
+                merged[key] = merge_results([current or {}, value])
+            elif current is None:
+                merged[key] = value
+    return merged
+
+
+class OTCInfoModule(OTCModule):
+    """Base class for info modules.
+
+    Adds the `fields`, `compact`, `output_file`, `count_only`, `ids_only`,
+    `regions` and `projects` options. Modules collect the resources of their
+    result in lists created by `result_list`, these apply the options while
+    resources are appended. Plain lists of resources in the result are
+    handled by `exit_json` as well.
+
+    With `regions` or `projects` set, `run` is executed once per region and
+    project in a thread pool. `conn`, `resolver_cache` and `catalog_cache`
+    are those of the run of the current thread and `exit_json` or
+    `fail_json` only end that run, the results of all runs are merged.
+    """
+
+    info_argument_spec = dict(
+        fields=dict(type='list', elements='str'),
+        compact=dict(type='bool', default=False),
+        output_file=dict(type='path'),
+        count_only=dict(type='bool', default=False),
+        ids_only=dict(type='bool', default=False),
+        regions=dict(type='list', elements='str'),
+        projects=dict(type='list', elements='str'),
+    )
+    info_mutually_exclusive = [
+        ('count_only', 'ids_only'),
+        ('count_only', 'fields'),
+        ('count_only', 'output_file'),
+        ('ids_only', 'fields'),
+    ]
+
+    def __init__(self):
+        self.argument_spec = dict(self.info_argument_spec,
+                                  **self.argument_spec)
+        self.module_kwargs = dict(
+            self.module_kwargs,
+            mutually_exclusive=(
+                list(self.module_kwargs.get('mutually_exclusive', []))
+                + self.info_mutually_exclusive))
+        self.output = None
+        self.output_lock = threading.Lock()
+        self._local = threading.local()
+        super().__init__()
+
+    @property
+    def conn(self):
+        return getattr(self._local, 'conn', None) or self._conn
+
+    @conn.setter
+    def conn(self, value):
+        self._conn = value
+
+    @property
+    def resolver_cache(self):
+        return (getattr(self._local, 'resolver_cache', None)
+                or self._resolver_cache)
+
+    @resolver_cache.setter
+    def resolver_cache(self, value):
+        self._resolver_cache = value
+
+    @property
+    def catalog_cache(self):
+        return (getattr(self._local, 'catalog_cache', None)
+                or self._catalog_cache)
+
+    @catalog_cache.setter
+    def catalog_cache(self, value):
+        self._catalog_cache = value
+
+    def __call__(self):
+        """Execute `run`, once per region and project if they are set.
+        """
+        if not self.params['regions'] and not self.params['projects']:
+            return super().__call__()
+        scopes = [({}, {})]
+        if self.params['projects']:
+            try:
+                scopes = self.project_scopes(self.params['projects'])
+            except self.sdk.exceptions.SDKException as e:
+                self.fail_json(msg=str(e))
+        targets = []
+        for scope_annotations, scope_kwargs in scopes:
+            for region in self.params['regions'] or [None]:
+                annotations = dict(scope_annotations)
+                connect_kwargs = dict(self.connect_kwargs, **scope_kwargs)
+                if region:
+                    annotations['region'] = region
+                    connect_kwargs['region_name'] = region
+                targets.append((annotations, connect_kwargs))
+        self.run_targets(targets)
+
+    def project_scopes(self, projects):
+        """Return the connection scopes of the given projects.
+
+        The project connections authenticate with the token of the module
+        connection, which is usually scoped to the domain, instead of
+        authenticating with the credentials once per project.
+
+        Arguments:
+            projects {list} -- Names or IDs of projects.
+
+        Returns:
+            list -- Tuples of the attributes added to the resources of a
+                project and the connection arguments scoped to it.
+        """
+        conn = self._conn
+        response = conn.identity.get('/auth/projects')
+        self.sdk.exceptions.raise_from_response(response)
+        available = {}
+        for project in response.json().get('projects', []):
+            available[project['id']] = project
+            available[project['name']] = project
+        auth_url = conn.config.get_auth().auth_url
+        token = conn.auth_token
+        # The token does not name its user, so the on-disk caches of the
+        # project connections are keyed by the module connection as well.
+        parent_cache_key = config_cache_key(conn.config)
+        scopes = []
+        for name_or_id in projects:
+            project = available.get(name_or_id)
+            if project is None:
+                self.fail_json(
+                    msg='Project %s is not available for the user' % (
+                        name_or_id))
+            scopes.append((
+                dict(project=project['name']),
+                dict(auth_type='v3token', auth=dict(
+                    auth_url=auth_url, token=token,
+                    project_id=project['id']),
+                    parent_cache_key=parent_cache_key)))
+        return scopes
+
+    def run_targets(self, targets):
+        """Run the module for several targets and exit with all results.
+
+        Arguments:
+            targets {list} -- Tuples of the attributes added to every
+                resource of the target, i.e. its region, and the arguments
+                for the connection to the target.
+        """
+        workers = min(len(targets), FANOUT_WORKERS)
+        with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+            runs = [executor.submit(self._run_target, annotations, kwargs)
+                    for annotations, kwargs in targets]
+            outcomes = [run.result() for run in runs]
+        for (annotations, _), (result, failed) in zip(targets, outcomes):
+            if failed:
+                target = ', '.join(
+                    '%s %s' % item for item in annotations.items())
+                result['msg'] = '%s: %s' % (target, result.get('msg'))
+                self.fail_json(**result)
+        result = merge_results([result for result, _ in outcomes])
+        result.setdefault('changed', False)
+        self._exit(result)
+
+    def _run_target(self, annotations, connect_kwargs):
+        self._local.annotations = annotations
+        try:
+            conn = self._local.conn = self.connect(**connect_kwargs)
+            (self._local.resolver_cache,
+             self._local.catalog_cache) = self.open_caches(conn)
+            results = self.run()
+            if results and isinstance(results, dict):
+                self.exit_json(**results)
+            return {}, False
+        except _RunExit as e:
+            return e.result, e.failed
+        except self.sdk.exceptions.SDKException as e:
+            return dict(msg=str(e)), True
+        except Exception as e:
+            # Fail like a failed run instead of escaping with a traceback
+            # through the executor, e.g. connection errors of one region
+            return dict(msg='%s: %s' % (type(e).__name__, e),
+                        exception=traceback.format_exc()), True
+        finally:
+            self.save_caches((
+                ('Resolver', getattr(self._local, 'resolver_cache', None)),
+                ('Catalog', getattr(self._local, 'catalog_cache', None))))
+            self._local.__dict__.clear()
+
+    def shape_item(self, item):
+        """Apply `ids_only`, `fields` and `compact` to a single resource.
+
+        Resources of a region or project run get its attributes added.
+        """
+        if self.params['ids_only']:
+            item = item.get('id')
+        if self.params['fields']:
+            item = project_fields(item, self.params['fields'])
+        if self.params['compact']:
+            item = drop_none(item)
+        annotations = getattr(self._local, 'annotations', None)
+        if annotations:
+            if not isinstance(item, dict):
+                item = dict(id=item)
+            item = dict(item, **annotations)
+        return item
+
+    def result_list(self):
+        """Return a list to collect resources of the result in.
+
+        With `output_file` set the resources are streamed to the file
+        instead of being kept for the result, with `count_only` set they
+        are only counted.
+
+        Returns:
+            ResultList -- List to append resources to.
+        """
+        serialize = not self.params['ids_only']
+        if self.params['count_only']:
+            return CountResultList(self.shape_item, serialize=False)
+        if not self.params['output_file']:
+            return ResultList(self.shape_item, serialize)
+        with self.output_lock:
+            if self.output is None:
+                try:
+                    self.output = open(self.params['output_file'], 'w')
+                except (IOError, OSError) as e:
+                    self.fail_json(
+                        msg='Unable to open output file: %s' % e)
+        return JsonLinesResultList(
+            self.shape_item, self.output, serialize, self.output_lock)
+
+    def api_total(self, proxy, resource_type, total_key, base_path=None,
+                  **query):
+        """Return the number of resources reported by a listing API.
+
+        The listing of `resource_type` translates the query, only its first
+        page holding a single resource is requested. The total is read from
+        the `total_key` attribute of the response. Paging parameters of the
+        query are ignored, the total covers all pages.
+
+        Arguments:
+            proxy {Proxy} -- Service proxy to send the request with.
+            resource_type {type} -- Resource class listed.
+            total_key {str} -- Response attribute holding the total.
+            base_path {str} -- Listing path if it differs from the one of
+                the resource class.
+            query {dict} -- Query of the listing, client side names.
+
+        Returns:
+            int -- Number of resources, None if the API did not report it.
+        """
+        query = dict((key, value) for key, value in query.items()
+                     if key not in ('limit', 'marker', 'offset'))
+        responses = []
+
+        def capture(response, *args, **kwargs):
+            responses.append(response)
+
+        hooks = proxy.session.session.hooks['response']
+        hooks.append(capture)
+        try:
+            for _ in resource_type.list(
+                    proxy, paginated=False, base_path=base_path,
+                    **dict(query, limit=1)):
+                break
+        finally:
+            hooks.remove(capture)
+        if not responses:
+            return None
+        try:
+            total = responses[-1].json().get(total_key)
+        except (AttributeError, ValueError):
+            return None
+        return total if isinstance(total, int) else None
+
+    def _result_lists(self, result, top_level=True):
+        """Yield (container, key) of every resource list in the result.
+
+        Top level lists of dicts are resource lists, in nested dicts only
+        lists created by `result_list` are.
+        """
+        for key, value in result.items():
+            if isinstance(value, ResultList):
+                yield result, key
+            elif (top_level and isinstance(value, list) and value
+                    and all(isinstance(item, dict) for item in value)):
+                yield result, key
+            elif top_level and type(value) is dict:
+                for item in self._result_lists(value, top_level=False):
+                    yield item
+
+    def exit_json(self, **kwargs):
+        for container, key in list(self._result_lists(kwargs)):
+            value = container[key]
+            if not isinstance(value, ResultList):
+                collected = self.result_list()
+                collected.extend(value)
+                container[key] = value = collected
+            if isinstance(value, (CountResultList, JsonLinesResultList)):
+                del container[key]
+                kwargs.setdefault('counts', {})[key] = value.count
+        if hasattr(self._local, 'annotations'):
+            raise _RunExit(kwargs)
+        self._exit(kwargs)
+
+    def _exit(self, kwargs):
+        if self.output is not None:
+            self.output.close()
+            kwargs['output_file'] = self.params['output_file']
+            kwargs.setdefault('counts', {})
+        super().exit_json(**kwargs)
+
+    def fail_json(self, **kwargs):
+        if hasattr(self._local, 'annotations'):
+            raise _RunExit(kwargs, failed=True)
+        if self.output is not None:
+            self.output.close()
+        super().fail_json(**kwargs)
@@ -0,0 +1,328 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Polling with exponential backoff shared by all modules.
+
+Transitions of most resources finish within seconds while cluster and
+database creation takes many minutes. Polling starts after a short,
+resource specific delay and the interval grows exponentially up to a cap,
+so fast transitions are noticed quickly and long ones cause few requests.
+Resources already in the desired status are returned without polling.
+"""
+
+import email.utils
+import inspect
+import random
+import time
+
+# Resource type -> (first delay, max interval) in seconds. A first delay of
+# 0 polls right away, for resources usually already in the desired state.
+# No first delay exceeds the fixed interval the modules polled with before.
+WAIT_PROFILES = {
+    None: (1, 30),
+    'as_group': (2, 15),
+    'as_instance': (2, 30),
+    'cbr_checkpoint': (2, 30),
+    'cce_job': (5, 60),
+    'css_cluster': (5, 120),
+    'css_snapshot': (5, 30),
+    'dws_cluster': (5, 120),
+    'loadbalancer': (2, 10),
+    'nat_rule': (1, 10),
+    'rds_backup': (2, 30),
+    'sfsturbo_share': (2, 30),
+    'subnet': (1, 5),
+    'swr': (1, 5),
+    'volume_backup': (2, 30),
+    'vpc': (0, 5),
+}
+
+
+def _retry_after(exc):
+    """Return the delay requested by a `Retry-After` header or None."""
+    response = getattr(exc, 'response', None)
+    headers = getattr(response, 'headers', None) or {}
+    value = headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, date.timestamp() - time.time())
+
+
+def _get_attribute(resource, attribute):
+    value = resource
+    for name in attribute.split('.'):
+        if value is None:
+            return None
+        if isinstance(value, dict):
+            value = value.get(name)
+        else:
+            value = getattr(value, name, None)
+    return value
+
+
+def _fetch(resource, session):
+    """Fetch a resource, bypassing the response cache of the connection.
+
+    Resources overriding `fetch` without a `skip_cache` argument are
+    fetched without it.
+    """
+    try:
+        parameters = inspect.signature(resource.fetch).parameters
+    except (TypeError, ValueError):
+        parameters = {}
+    if 'skip_cache' in parameters:
+        return resource.fetch(session, skip_cache=True)
+    return resource.fetch(session)
+
+
+def _name(resource):
+    return getattr(resource, 'name', None) or resource.id
+
+
+def _reached(resource, status, failures, attribute):
+    """Return whether `resource` is in `status`, raise on a failure status."""
+    from openstack import exceptions
+
+    value = _get_attribute(resource, attribute)
+    value = value.lower() if isinstance(value, str) else value
+    if value in failures:
+        raise exceptions.ResourceFailure(
+            '{name} transitioned to failure state {value}'.format(
+                name=_name(resource), value=value))
+    return value == status
+
+
+class Waiter:
+    """Poll until a condition is met or the timeout expires.
+
+    Args:
+        timeout: Seconds to wait in total.
+        resource_type: Key of `WAIT_PROFILES` selecting the first delay and
+            the maximum interval.
+        factor: Growth of the interval after every poll.
+        jitter: Relative random deviation of every interval, so parallel
+            waiters do not poll in lockstep.
+
+    Attributes:
+        polls: Number of polls done so far.
+    """
+
+    def __init__(self, timeout, resource_type=None, factor=2.0, jitter=0.2):
+        self.timeout = timeout
+        self.delay, self.max_interval = WAIT_PROFILES.get(
+            resource_type, WAIT_PROFILES[None])
+        self.factor = factor
+        self.jitter = jitter
+        self.polls = 0
+
+    def _next_delay(self, delay):
+        delay = min(delay, self.max_interval)
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def wait(self, poll, message='Timeout waiting for the resource'):
+        """Call `poll` until it returns a value other than None.
+
+        A poll answered with a `Retry-After` header is retried after the
+        requested delay, other errors are raised.
+
+        Arguments:
+            poll {callable} -- Returns None while the condition is not met.
+            message {str} -- Message of the timeout exception.
+
+        Returns:
+            The first value returned by `poll` which is not None.
+        """
+        from openstack import exceptions
+
+        deadline = time.time() + self.timeout
+        delay = self.delay
+        wait = self._next_delay(delay)
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise exceptions.ResourceTimeout(message)
+            time.sleep(min(wait, remaining))
+            self.polls += 1
+            try:
+                result = poll()
+            except exceptions.HttpException as e:
+                retry_after = _retry_after(e)
+                if retry_after is None:
+                    raise
+                wait = retry_after
+                continue
+            if result is not None:
+                return result
+            delay = min(max(delay * self.factor, 1), self.max_interval)
+            wait = self._next_delay(delay)
+
+    def wait_for_status(self, session, resource, status, failures=None,
+                        attribute='status'):
+        """Wait for a resource to reach `status`.
+
+        Arguments:
+            session -- Proxy used to fetch the resource.
+            resource -- Resource to watch.
+            status {str} -- Desired status, compared case insensitive.
+            failures {list} -- Statuses meaning the transition failed.
+            attribute {str} -- Name of the status attribute, nested
+                attributes are separated by dots, i.e. `status.status`.
+
+        Returns:
+            The resource in the desired status.
+        """
+        status = status.lower()
+        failures = [failure.lower() for failure in failures or []]
+        # Like the SDK, a resource already in the status is returned
+        # without a request
+        if _reached(resource, status, failures, attribute):
+            return resource
+
+        def poll():
+            current = _fetch(resource, session)
+            if _reached(current, status, failures, attribute):
+                return current
+            return None
+
+        return self.wait(
+            poll, 'Timeout waiting for {name} to transition to {status}'.format(
+                name=_name(resource), status=status))
+
+    def wait_for_all_status(self, session, resources, status, failures=None,
+                            attribute='status'):
+        """Wait for several resources to reach `status` at once.
+
+        Resources already in the status are not fetched, every poll fetches
+        the resources which did not reach the status yet. The wait fails as
+        soon as one of them reaches a failure status.
+
+        Arguments:
+            session -- Proxy used to fetch the resources.
+            resources {list} -- Resources to watch.
+            status {str} -- Desired status, compared case insensitive.
+            failures {list} -- Statuses meaning the transition failed.
+            attribute {str} -- Name of the status attribute, nested
+                attributes are separated by dots, i.e. `status.status`.
+
+        Returns:
+            list -- The resources in the desired status, in input order.
+        """
+        status = status.lower()
+        failures = [failure.lower() for failure in failures or []]
+        done = dict(
+            (index, resource) for index, resource in enumerate(resources)
+            if _reached(resource, status, failures, attribute))
+
+        def poll():
+            for index, resource in enumerate(resources):
+                if index in done:
+                    continue
+                current = _fetch(resource, session)
+                if _reached(current, status, failures, attribute):
+                    done[index] = current
+            if len(done) == len(resources):
+                return [done[index] for index in range(len(resources))]
+            return None
+
+        if len(done) == len(resources):
+            return list(resources)
+        return self.wait(
+            poll, 'Timeout waiting for {count} resources to transition to '
+                  '{status}'.format(count=len(resources), status=status))
+
+    def wait_for_list_status(self, list_resources, ids, status,
+                             failures=None, attribute='status'):
+        """Wait for several resources to reach `status` using one listing.
+
+        Every poll lists the resources once and checks all `ids` against
+        that listing, instead of fetching every resource on its own.
+
+        Arguments:
+            list_resources {callable} -- Returns an iterable of resources.
+            ids {list} -- IDs of the resources to watch.
+            status {str} -- Desired status, compared case insensitive.
+            failures {list} -- Statuses meaning the transition failed.
+            attribute {str} -- Name of the status attribute, nested
+                attributes are separated by dots.
+
+        Returns:
+            list -- The resources in the desired status.
+        """
+        status = status.lower()
+        failures = [failure.lower() for failure in failures or []]
+        ids = set(ids)
+
+        def poll():
+            found = []
+            for resource in list_resources():
+                if resource.id not in ids:
+                    continue
+                if _reached(resource, status, failures, attribute):
+                    found.append(resource)
+            if len(found) == len(ids):
+                return found
+            return None
+
+        return self.wait(
+            poll, 'Timeout waiting for {count} resources to transition to '
+                  '{status}'.format(count=len(ids), status=status))
+
+    def wait_for_list_delete(self, list_resources, ids):
+        """Wait for several resources to disappear from a listing.
+
+        Arguments:
+            list_resources {callable} -- Returns an iterable of resources.
+            ids {list} -- IDs of the resources to watch.
+
+        Returns:
+            list -- The IDs passed in.
+        """
+        ids = set(ids)
+
+        def poll():
+            if any(resource.id in ids for resource in list_resources()):
+                return None
+            return list(ids)
+
+        return self.wait(
+            poll, 'Timeout waiting for {count} resources to '
+                  'delete'.format(count=len(ids)))
+
+    def wait_for_delete(self, session, resource):
+        """Wait for a resource to disappear.
+
+        Arguments:
+            session -- Proxy used to fetch the resource.
+            resource -- Resource to watch.
+
+        Returns:
+            The resource passed in.
+        """
+        from openstack import exceptions
+
+        def poll():
+            try:
+                _fetch(resource, session)
+            except exceptions.ResourceNotFound:
+                return resource
+            return None
+
+        return self.wait(
+            poll, 'Timeout waiting for {name} to delete'.format(
+                name=_name(resource)))
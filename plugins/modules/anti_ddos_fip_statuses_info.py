@@ -16,7 +16,9 @@ DOCUMENTATION = '''
 ---
 module: anti_ddos_fip_statuses_info
 short_description: Get Anti-DDoS statuses info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.2.1"
 author: "Irina Pereiaslavskaia (@irina-pereiaslavskaia)"
 description:
@@ -69,10 +71,10 @@ EXAMPLES = '''
   register: anti_ddos_fip_statuses
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class AntiDDoSFIPStatusesInfoModule(OTCModule):
+class AntiDDoSFIPStatusesInfoModule(OTCInfoModule):
     argument_spec = dict(
         ip=dict(type='str', required=False),
         status=dict(type='str',
@@ -84,12 +86,14 @@ class AntiDDoSFIPStatusesInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('anti_ddos',)
+
     def run(self):
 
         ip_filter = self.params['ip']
         status_filter = self.params['status']
 
-        data = []
+        data = self.result_list()
         query = {}
 
         if ip_filter:
@@ -99,9 +103,7 @@ class AntiDDoSFIPStatusesInfoModule(OTCModule):
             query['status'] = status_filter
 
         for raw in self.conn.anti_ddos.floating_ips(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
 
         self.exit(changed=False, anti_ddos_statuses=data)
 
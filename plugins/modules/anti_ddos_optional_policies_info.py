@@ -16,7 +16,9 @@ DOCUMENTATION = '''
 ---
 module: anti_ddos_optional_policies_info
 short_description: Get Anti-DDoS optional defense policies info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.4.0"
 author: "Irina Pereiaslavskaia (@irina-pereiaslavskaia)"
 description:
@@ -115,23 +117,23 @@ EXAMPLES = '''
   register: anti_ddos_optional_policies_info
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class AntiDDoSOptionalPoliciesInfoModule(OTCModule):
+class AntiDDoSOptionalPoliciesInfoModule(OTCInfoModule):
     argument_spec = dict()
     module_kwargs = dict(
         supports_check_mode=True
     )
 
+    otce_services = ('anti_ddos',)
+
     def run(self):
 
-        data = []
+        data = self.result_list()
 
         for raw in self.conn.anti_ddos.configs():
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
 
         self.exit(changed=False, anti_ddos_optional_policies_info=data)
 
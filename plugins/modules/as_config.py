@@ -266,6 +266,8 @@ class ASConfigModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('auto_scaling',)
+
     def _parse_disk_metadata(self, metadata):
         m = metadata
         parsed_metadata = {}
@@ -370,18 +372,22 @@ class ASConfigModule(OTCModule):
             if self.params['instance_id']:
                 attrs['instance_id'] = self.params['instance_id']
             if self.params['flavor']:
-                flavor = self.conn.compute.find_flavor(self.params['flavor'], ignore_missing=True)
-                if flavor:
-                    attrs['flavorRef'] = flavor.id
+                flavor_id = self.catalog_id(
+                    'compute.flavors', self.conn.compute.flavors,
+                    self.conn.compute.find_flavor, self.params['flavor'])
+                if flavor_id:
+                    attrs['flavorRef'] = flavor_id
                 else:
                     self.fail_json(msg="Flavor not found")
             else:
                 self.fail_json(msg="Flavor is mandatory for creating AS configuration "
                                    "through creating new specifications template.")
             if self.params['image']:
-                image = self.conn.compute.find_image(self.params['image'], ignore_missing=True)
-                if image:
-                    attrs['imageRef'] = image.id
+                image_id = self.catalog_id(
+                    'compute.images', self.conn.compute.images,
+                    self.conn.compute.find_image, self.params['image'])
+                if image_id:
+                    attrs['imageRef'] = image_id
                 else:
                     self.fail_json(msg="Image not found")
             else:
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: as_config_info
 short_description: Get AutoScaling configs
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.1"
 author: "Artem Goncharov (@gtema)"
 description:
@@ -58,10 +60,10 @@ EXAMPLES = '''
   register: as
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class AutoScalingConfigInfoModule(OTCModule):
+class AutoScalingConfigInfoModule(OTCInfoModule):
     argument_spec = dict(
         name=dict(required=False),
         image_id=dict(required=False)
@@ -70,11 +72,13 @@ class AutoScalingConfigInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('auto_scaling',)
+
     def run(self):
         name_filter = self.params['name']
         image_id_filter = self.params['image_id']
 
-        data = []
+        data = self.result_list()
         # TODO: Pass filters into SDK
         for raw in self.conn.auto_scaling.configs():
             if name_filter and raw.name != name_filter:
@@ -82,9 +86,7 @@ class AutoScalingConfigInfoModule(OTCModule):
             if (image_id_filter
                     and raw.instance_config['image_id'] != image_id_filter):
                 continue
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
 
         self.exit(
             changed=False,
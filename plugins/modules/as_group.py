@@ -262,6 +262,12 @@ as_group:
       description: Specifies the AS group ID.
       type: str
       sample: "39007a7e-ee4f-4d13-8283-b4da2e037c69"
+polls:
+  description: Number of status polls done while waiting for the instances and
+    the state of the AS group, or for its deletion.
+  returned: When I(wait=true) and the group was resumed, paused or deleted
+  type: int
+  sample: 7
 '''
 
 EXAMPLES = '''
@@ -395,6 +401,8 @@ class ASGroupModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('auto_scaling',)
+
     def _is_as_config_find(self, as_config):
         return self.conn.auto_scaling.find_config(as_config)
 
@@ -421,9 +429,9 @@ class ASGroupModule(OTCModule):
             )
 
     def _attrs_id_router(self, attrs, router):
-        rtr = self.conn.network.find_router(router)
-        if rtr:
-            attrs['router_id'] = rtr.id
+        router_id = self.resolve_id(self.conn.network.find_router, router)
+        if router_id:
+            attrs['router_id'] = router_id
             return attrs
         else:
             self.fail(
@@ -461,9 +469,10 @@ class ASGroupModule(OTCModule):
             netwrks = []
             netwrk = {}
             for network in networks:
-                net = self.conn.network.find_network(network['id'])
-                if net:
-                    netwrk['id'] = net.id
+                net_id = self.resolve_id(
+                    self.conn.network.find_network, network['id'])
+                if net_id:
+                    netwrk['id'] = net_id
                     netwrks.append(netwrk)
                 else:
                     self.fail(
@@ -488,11 +497,12 @@ class ASGroupModule(OTCModule):
             if len(security_groups) == 1:
                 sec_groups = []
                 sec_group = {}
-                security_group = self.conn.network.find_security_group(
-                    name_or_id=security_groups[0]["id"]
+                security_group_id = self.resolve_id(
+                    self.conn.network.find_security_group,
+                    security_groups[0]["id"]
                 )
-                if security_group:
-                    sec_group['id'] = security_group.id
+                if security_group_id:
+                    sec_group['id'] = security_group_id
                     sec_groups.append(sec_group)
                 attrs['security_groups'] = sec_groups
                 return attrs
@@ -733,19 +743,24 @@ class ASGroupModule(OTCModule):
         return attrs
 
     def _wait_for_instances(self, as_group, timeout, desire_instance_number=0):
-        for count in self.sdk.utils.iterate_timeout(
-            timeout=timeout,
-            message="Timeout waiting for AS Instances"
-        ):
+
+        def poll():
             instances = list(self.conn.auto_scaling.instances(
                 group=as_group
             ))
-            instances_with_id = [instance.id for instance in instances
-                                 if instance.id]
-            if (len(instances) == len(instances_with_id) == desire_instance_number):
-                for instance in instances:
-                    self.conn.auto_scaling.wait_for_instance(instance=instance)
-                return
+            for instance in instances:
+                if instance.lifecycle_state == 'ERROR':
+                    raise self.sdk.exceptions.ResourceFailure(
+                        'AS Instance %s transitioned to ERROR' % instance.id)
+            if (len(instances) == desire_instance_number
+                    and all(instance.id and instance.lifecycle_state == 'INSERVICE'
+                            for instance in instances)):
+                return instances
+            return None
+
+        # A single listing per poll tracks the state of all instances
+        return self.waiter(timeout, 'as_instance').wait(
+            poll, "Timeout waiting for AS Instances")
 
     def _resume_group(self, group, wait, timeout, desire_instance_number=0):
         result_group = group
@@ -758,10 +773,9 @@ class ASGroupModule(OTCModule):
                         timeout=timeout,
                         desire_instance_number=desire_instance_number
                     )
-                result_group = self.conn.auto_scaling.wait_for_group(
-                    group=group,
-                    wait=timeout
-                )
+                result_group = self.waiter(
+                    timeout, 'as_group').wait_for_status(
+                        self.conn.auto_scaling, group, 'INSERVICE', ['ERROR'])
             except self.sdk.exceptions.ResourceTimeout:
                 self.fail(
                     msg="Timeout failure waiting for AS Group"
@@ -773,11 +787,9 @@ class ASGroupModule(OTCModule):
         self.conn.auto_scaling.pause_group(group=group)
         if wait:
             try:
-                result_group = self.conn.auto_scaling.wait_for_group(
-                    group=group,
-                    status='PAUSED',
-                    wait=timeout
-                )
+                result_group = self.waiter(
+                    timeout, 'as_group').wait_for_status(
+                        self.conn.auto_scaling, group, 'PAUSED', ['ERROR'])
             except self.sdk.exceptions.ResourceTimeout:
                 self.fail(
                     msg="Timeout failure waiting for AS Group"
@@ -897,10 +909,8 @@ class ASGroupModule(OTCModule):
         )
         if wait:
             try:
-                self.conn.auto_scaling.wait_for_delete_group(
-                    group=as_group,
-                    wait=timeout
-                )
+                self.waiter(timeout, 'as_group').wait_for_delete(
+                    self.conn.auto_scaling, as_group)
             except self.sdk.exceptions.ResourceTimeout:
                 self.fail(
                     msg="Timeout failure waiting for delete AS Group"
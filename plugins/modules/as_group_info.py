@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: as_group_info
 short_description: Get AutoScaling groups
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.1"
 author: "Artem Goncharov (@gtema)"
 description:
@@ -57,10 +59,10 @@ EXAMPLES = '''
 '''
 
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class AutoScalingGroupInfoModule(OTCModule):
+class AutoScalingGroupInfoModule(OTCInfoModule):
 
     argument_spec = dict(
         name=dict(required=False),
@@ -71,12 +73,14 @@ class AutoScalingGroupInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('auto_scaling',)
+
     def run(self):
 
         name_filter = self.params['name']
         status_filter = self.params['status']
 
-        data = []
+        data = self.result_list()
         # TODO: Pass filters into SDK
         attrs = {}
         if name_filter:
@@ -84,9 +88,7 @@ class AutoScalingGroupInfoModule(OTCModule):
         if status_filter:
             attrs['scaling_group_status'] = status_filter.upper()
         for raw in self.conn.auto_scaling.groups(**attrs):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
 
         self.exit_json(
             changed=False,
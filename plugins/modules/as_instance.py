@@ -63,7 +63,13 @@ requirements: ["openstacksdk", "otcextensions"]
 '''
 
 RETURN = '''
-# This module does not return anything.
+polls:
+  description: Number of status polls done while waiting for the AS group to
+    return to service between batches and for the instances to be in service or
+    removed.
+  returned: When batches waited for the AS group or I(wait=true)
+  type: int
+  sample: 7
 '''
 
 EXAMPLES = '''
@@ -128,6 +134,8 @@ class ASInstanceModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('auto_scaling',)
+
     def _system_state_change(self, instances, as_instances, state, action):
         if state == 'present':
             if action is None:
@@ -185,17 +193,40 @@ class ASInstanceModule(OTCModule):
             result.extend(element)
         return result
 
+    def _index(self, resources):
+        """Index resources by ID and by name for repeated lookups."""
+        by_id = {}
+        by_name = {}
+        for resource in resources:
+            by_id[resource.id] = resource
+            by_name.setdefault(resource.name, []).append(resource)
+        return by_id, by_name
+
+    def _lookup(self, index, name_or_id):
+        """Resolve a name or ID against an index like find_* would."""
+        by_id, by_name = index
+        if name_or_id in by_id:
+            return by_id[name_or_id]
+        matches = by_name.get(name_or_id, [])
+        if len(matches) > 1:
+            self.fail(
+                changed=False,
+                msg='More than one resource with name {0} found'.format(
+                    name_or_id)
+            )
+        return matches[0] if matches else None
+
+    def _group_instances_index(self, group):
+        return self._index(self.conn.auto_scaling.instances(group=group))
+
     def _get_instances_id_for_adding(self, group, as_instances):
         instances = []
         max_instances = self._max_number_of_instances_for_adding(group)
+        servers = self._index(self.conn.compute.servers())
+        group_instances = self._group_instances_index(group)
         for as_instance in as_instances:
-            instance_ecs = self.conn.compute.find_server(
-                name_or_id=as_instance
-            )
-            instance_as_group = self.conn.auto_scaling.find_instance(
-                group=group,
-                name_or_id=as_instance
-            )
+            instance_ecs = self._lookup(servers, as_instance)
+            instance_as_group = self._lookup(group_instances, as_instance)
             if (instance_ecs
                     and instance_ecs.availability_zone in group.availability_zones
                     and not instance_as_group):
@@ -207,11 +238,9 @@ class ASInstanceModule(OTCModule):
     def _get_instances_id_for_removing(self, group, as_instances):
         instances = []
         max_instances = self._max_number_of_instances_for_removing(group)
+        group_instances = self._group_instances_index(group)
         for as_instance in as_instances:
-            instance = self.conn.auto_scaling.find_instance(
-                group=group,
-                name_or_id=as_instance
-            )
+            instance = self._lookup(group_instances, as_instance)
             if instance and self._is_instance_in_inservice_state(instance):
                 instances.append(instance.id)
         if len(instances) <= max_instances:
@@ -221,11 +250,9 @@ class ASInstanceModule(OTCModule):
     def _get_instances_id_for_protection(self, group, as_instances):
         instances = []
         max_instances = self._max_number_of_instances_for_protecting(group)
+        group_instances = self._group_instances_index(group)
         for as_instance in as_instances:
-            instance = self.conn.auto_scaling.find_instance(
-                group=group,
-                name_or_id=as_instance
-            )
+            instance = self._lookup(group_instances, as_instance)
             if instance and self._is_instance_in_inservice_state(instance):
                 instances.append(instance.id)
         if len(instances) <= max_instances:
@@ -256,17 +283,39 @@ class ASInstanceModule(OTCModule):
     def _batch_instances_action(
             self, instances, group, timeout, action, instance_delete=False
     ):
-        for instance_group in instances:
+        # The AS API rejects batch actions while the group is scaling and
+        # every accepted batch starts scaling, so batches can not be
+        # submitted concurrently. One poll loop submits the next batch as
+        # soon as the group is back in service and the timeout covers all
+        # batches. The group just found is used as is for the first batch.
+        pending = list(instances)
+
+        def submit(current):
             self.conn.auto_scaling.batch_instance_action(
-                group=self._wait_for_group_inservice_status(
-                    as_group=group,
-                    timeout=timeout
-                ),
-                instances=instance_group,
+                group=current,
+                instances=pending.pop(0),
                 action=action,
                 delete_instance=instance_delete
             )
 
+        def poll():
+            current = self.conn.auto_scaling.get_group(group)
+            if current.status.lower() == 'error':
+                raise self.sdk.exceptions.ResourceFailure(
+                    'AS group {0} transitioned to failure state '
+                    'ERROR'.format(current.name))
+            if not self._is_group_in_inservice_state(current):
+                return None
+            submit(current)
+            return None if pending else current
+
+        if pending and self._is_group_in_inservice_state(group):
+            submit(group)
+        if pending:
+            self.waiter(timeout, 'as_group').wait(
+                poll, 'Timeout waiting for AS group {0} to transition to '
+                      'INSERVICE'.format(group.name))
+
     def _delete_single_instance(self, instance, delete_instance=False):
         if isinstance(instance, list):
             instance = self._join_lists(instance).pop()
@@ -274,47 +323,18 @@ class ASInstanceModule(OTCModule):
             instance=instance, delete_instance=delete_instance
         )
 
-    def _wait_for_group_inservice_status(self, as_group, timeout, interval=2):
-        return self.conn.auto_scaling.wait_for_group(
-            group=as_group, interval=interval, wait=timeout
-        )
-
     def _wait_for_instances_inservice_status(
-            self, timeout, interval, group, instances_id
+            self, timeout, group, instances_id
     ):
-        inst_ids = self._join_lists(instances_id)
-        for count in self.sdk.utils.iterate_timeout(
-            timeout=timeout,
-            wait=interval,
-            message="Timeout waiting for instance to be in inservice state"
-        ):
-            all_instances = list(self.conn.auto_scaling.instances(group=group))
-            instances = [instance for instance in all_instances
-                         if instance.id in inst_ids]
-            for instance in instances:
-                self.conn.auto_scaling.wait_for_instance(instance)
-            return
-
-    def _wait_for_delete_instances(self, group, instances_id, timeout,
-                                   interval=5):
-        inst_ids = self._join_lists(instances_id)
-        for count in self.sdk.utils.iterate_timeout(
-                timeout=timeout,
-                wait=interval,
-                message="Timeout waiting for instance to be deleted"
-        ):
-            all_instances = list(
-                self.conn.auto_scaling.instances(group=group)
-            )
-            if all_instances:
-                instances = [instance for instance in all_instances
-                             if instance.id in inst_ids]
-                if not instances:
-                    return
-                else:
-                    for instance in instances:
-                        self.conn.auto_scaling.wait_for_delete_instance(instance)
-                    return
+        return self.waiter(timeout, 'as_instance').wait_for_list_status(
+            lambda: self.conn.auto_scaling.instances(group=group),
+            self._join_lists(instances_id), 'INSERVICE', ['ERROR'],
+            attribute='lifecycle_state')
+
+    def _wait_for_delete_instances(self, group, instances_id, timeout):
+        return self.waiter(timeout, 'as_instance').wait_for_list_delete(
+            lambda: self.conn.auto_scaling.instances(group=group),
+            self._join_lists(instances_id))
 
     def run(self):
         as_group = self.params['scaling_group']
@@ -388,7 +408,6 @@ class ASInstanceModule(OTCModule):
                         if wait:
                             self._wait_for_instances_inservice_status(
                                 timeout=timeout,
-                                interval=5,
                                 group=group,
                                 instances_id=instances_id
                             )
@@ -417,7 +436,6 @@ class ASInstanceModule(OTCModule):
                         if wait:
                             self._wait_for_instances_inservice_status(
                                 timeout=timeout,
-                                interval=5,
                                 group=group,
                                 instances_id=instances_id
                             )
@@ -467,7 +485,6 @@ class ASInstanceModule(OTCModule):
                         if wait:
                             self._wait_for_delete_instances(
                                 timeout=timeout,
-                                interval=15,
                                 group=group,
                                 instances_id=instances_id
                             )
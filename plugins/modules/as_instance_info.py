@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: as_instance_info
 short_description: Query Instances in an AS Group.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.8.0"
 author: "Irina Pereiaslavskaia (@irina-pereiaslavskaia)"
 description:
@@ -169,10 +171,10 @@ EXAMPLES = '''
   register: as_instances
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class ASInstanceInfoModule(OTCModule):
+class ASInstanceInfoModule(OTCInfoModule):
     argument_spec = dict(
         scaling_group=dict(type='str', required=True),
         lifecycle_state=dict(type='str', required=False,
@@ -187,6 +189,8 @@ class ASInstanceInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('auto_scaling',)
+
     def run(self):
         as_group = self.params['scaling_group']
         lifecycle_state = self.params['lifecycle_state']
@@ -194,7 +198,7 @@ class ASInstanceInfoModule(OTCModule):
         start_number = self.params['start_number']
         limit = self.params['limit']
 
-        data = []
+        data = self.result_list()
         query = {}
 
         try:
@@ -211,7 +215,7 @@ class ASInstanceInfoModule(OTCModule):
             )
 
         if lifecycle_state:
-            query['lifecycle_state'] = lifecycle_state.upper()
+            query['lifecycle_status'] = lifecycle_state.upper()
 
         if health_status:
             query['health_status'] = health_status
@@ -228,10 +232,20 @@ class ASInstanceInfoModule(OTCModule):
                 msg='Limit is out of range'
             )
 
+        if self.params['count_only']:
+            from otcextensions.sdk.auto_scaling.v1 import instance
+            total = self.api_total(
+                self.conn.auto_scaling, instance.Instance, 'total_number',
+                base_path='/scaling_group_instance/{id}/list'.format(
+                    id=group.id),
+                **dict((key, value) for key, value in query.items()
+                       if key != 'group'))
+            if total is not None:
+                data.count = total
+                self.exit(changed=False, scaling_instances=data)
+
         for raw in self.conn.auto_scaling.instances(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
 
         self.exit(
             changed=False,
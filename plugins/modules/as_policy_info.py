@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: as_policy_info
 short_description: Query AS policies based on search criteria.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.6.0"
 author: "Irina Pereiaslavskaia (@irina-pereiaslavskaia)"
 description:
@@ -164,10 +166,10 @@ EXAMPLES = '''
   register: as_policies
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class ASPolicyInfoModule(OTCModule):
+class ASPolicyInfoModule(OTCInfoModule):
     argument_spec = dict(
         scaling_group=dict(type='str', required=True),
         scaling_policy=dict(type='str', required=False),
@@ -181,6 +183,8 @@ class ASPolicyInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('auto_scaling',)
+
     def run(self):
         as_group = self.params['scaling_group']
         as_policy = self.params['scaling_policy']
@@ -188,7 +192,7 @@ class ASPolicyInfoModule(OTCModule):
         start_number = self.params['start_number']
         limit = self.params['limit']
 
-        data = []
+        data = self.result_list()
         query = {}
         if as_group:
             group = self.conn.auto_scaling.find_group(
@@ -232,9 +236,7 @@ class ASPolicyInfoModule(OTCModule):
             )
 
         for raw in self.conn.auto_scaling.policies(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
 
         self.exit(
             changed=False,
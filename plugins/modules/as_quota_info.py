@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: as_quota_info
 short_description: Get information about auto scaling quotas
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.8.1"
 author: "Polina Gubina (@Polina-Gubina)"
 description:
@@ -75,10 +77,10 @@ EXAMPLES = '''
 '''
 
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class ASQuotaInfoModule(OTCModule):
+class ASQuotaInfoModule(OTCInfoModule):
     argument_spec = dict(
         scaling_group=dict(required=False)
     )
@@ -87,8 +89,10 @@ class ASQuotaInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('auto_scaling',)
+
     def run(self):
-        data = []
+        data = self.result_list()
 
         scaling_group_id = None
         if self.params['scaling_group']:
@@ -99,9 +103,7 @@ class ASQuotaInfoModule(OTCModule):
                 self.fail_json(msg="Auto scaling group not found")
 
         for raw in self.conn.auto_scaling.quotas(group=scaling_group_id):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
 
         self.exit_json(
             changed=False,
@@ -163,6 +163,8 @@ class AssociateBandwidth(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('vpc',)
+
     def _system_state_change(self, bandwidth):
         changed = False
         publicip_id = self.params['publicip_id']
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: availability_zone_info
 short_description: Get AZ info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.7.0"
 author: "Artem Goncharov (@gtema)"
 description:
@@ -51,10 +53,10 @@ EXAMPLES = '''
   register: az
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class AvailabilityZoneInfoModule(OTCModule):
+class AvailabilityZoneInfoModule(OTCInfoModule):
     argument_spec = dict(
         name=dict(type='str', required=False),
         service=dict(type='str', default='compute')
@@ -64,17 +66,17 @@ class AvailabilityZoneInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ()
+
     def run(self):
-        data = []
+        data = self.result_list()
 
         raw_data = []
         if self.params['service'] == 'compute':
             raw_data = self.conn.compute.availability_zones()
         if raw_data:
             for raw in raw_data:
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.add(raw)
 
         self.exit(
             changed=False,
@@ -140,6 +140,8 @@ class Bandwidth(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('vpc',)
+
     def _system_state_change(self, bandwidth):
         state = self.params['state']
         changed = False
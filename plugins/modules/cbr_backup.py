@@ -177,6 +177,8 @@ class CBRBackupModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('cbr',)
+
     def _parse_mappings(self):
         mappings = self.params['mappings']
         parsed_mappings = []
@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: cbr_backup_info
 short_description: Get cbr backup resource list
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.12.4"
 author: "Gubina Polina (@Polina-Gubina)"
 description:
@@ -246,10 +248,10 @@ EXAMPLES = '''
     vault: "name-or-id-vault"
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class CBRBackupsModule(OTCModule):
+class CBRBackupsModule(OTCInfoModule):
     argument_spec = dict(
         name=dict(required=False),
         checkpoint_id=dict(required=False),
@@ -283,8 +285,10 @@ class CBRBackupsModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('cbr',)
+
     def run(self):
-        data = []
+        data = self.result_list()
         query = {}
         backup = None
 
@@ -339,10 +343,16 @@ class CBRBackupsModule(OTCModule):
                 self.fail_json(msg="Vault not found")
             query['vault_id'] = vault.id
 
+        if self.params['count_only']:
+            from otcextensions.sdk.cbr.v3 import backup
+            total = self.api_total(
+                self.conn.cbr, backup.Backup, 'count', **query)
+            if total is not None:
+                data.count = total
+                self.exit(changed=False, backups=data)
+
         for raw in self.conn.cbr.backups(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
 
         self.exit(
             changed=False,
@@ -247,6 +247,8 @@ class CBRPolicyModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('cbr',)
+
     def _require_update(self, policy):
         require_update = False
         if policy:
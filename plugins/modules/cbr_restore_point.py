@@ -160,6 +160,12 @@ checkpoint:
           retention_duration:
             description: Number of days that backups can be retained.
             type: int
+polls:
+    description: Number of status polls done while waiting for the restore
+        point to become available.
+    returned: When a restore point was created
+    type: int
+    sample: 7
 '''
 
 EXAMPLES = '''
@@ -190,6 +196,8 @@ class CBRRestorePointModule(OTCModule):
                               )
     )
 
+    otce_services = ('cbr',)
+
     def _parse_resource_details(self):
         resource_details = self.params['resource_details']
         parsed_resource_details = []
@@ -222,7 +230,8 @@ class CBRRestorePointModule(OTCModule):
             attrs['resource_details'] = self._parse_resource_details()
 
         checkpoint = self.conn.cbr.create_checkpoint(**attrs)
-        self.conn.cbr.wait_for_checkpoint(checkpoint)
+        self.waiter(300, 'cbr_checkpoint').wait_for_status(
+            self.conn.cbr, checkpoint, 'available', ['error'])
         self.exit(changed=True, checkpoint=checkpoint)
 
 
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: cce_cluster_cert_info
 short_description: Get Certificates of a CCE cluster
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.1"
 author: "Artem Goncharov (@gtema)"
 description:
@@ -55,10 +57,10 @@ EXAMPLES = '''
 '''
 
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class CceClusterCertInfoModule(OTCModule):
+class CceClusterCertInfoModule(OTCInfoModule):
     argument_spec = dict(
         cluster=dict(required=True),
     )
@@ -66,6 +68,8 @@ class CceClusterCertInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('cce',)
+
     def run(self):
         cluster = self.params['cluster']
 
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: cce_cluster_info
 short_description: Get information about CCE clusters
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.1"
 author: "Artem Goncharov (@gtema)"
 description:
@@ -65,10 +67,10 @@ EXAMPLES = '''
   register: data
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class CceClusterInfoModule(OTCModule):
+class CceClusterInfoModule(OTCInfoModule):
     argument_spec = dict(
         name=dict(required=False),
         status=dict(required=False, choices=['available', 'creating',
@@ -78,22 +80,20 @@ class CceClusterInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('cce',)
+
     def run(self):
 
         name_filter = self.params['name']
         status_filter = self.params['status']
 
-        data = []
+        data = self.result_list()
         for raw in self.conn.cce.clusters():
             if name_filter and raw.name != name_filter:
                 continue
             if status_filter and raw.status != status_filter.lower():
                 continue
-            dt = raw.to_dict()
-            dt.pop('location')
-            dt.pop('api_version')
-            dt.pop('kind')
-            data.append(dt)
+            data.add(raw, drop=('location', 'api_version', 'kind'))
 
         self.exit_json(
             changed=False,
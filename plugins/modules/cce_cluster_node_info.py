@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: cce_cluster_node_info
 short_description: Get CCE node info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.4.0"
 author: "Tino Schreiber (@tischrei)"
 description:
@@ -124,10 +126,10 @@ EXAMPLES = '''
   register: node
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class CCEClusterNodeInfoModule(OTCModule):
+class CCEClusterNodeInfoModule(OTCInfoModule):
     argument_spec = dict(
         cce_cluster=dict(required=True),
         name=dict(required=False),
@@ -136,11 +138,13 @@ class CCEClusterNodeInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('cce',)
+
     otce_min__version = '0.12.1'
 
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
 
         cluster = self.conn.cce.find_cluster(
@@ -169,9 +173,7 @@ class CCEClusterNodeInfoModule(OTCModule):
                 )
         else:
             for raw in self.conn.cce.cluster_nodes(cluster=cluster):
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.add(raw)
 
         self.exit(
             changed=False,
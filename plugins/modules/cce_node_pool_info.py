@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: cce_node_pool_info
 short_description: Get CCE node pool info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.5.0"
 author: "Tino Schreiber (@tischrei)"
 description:
@@ -157,10 +159,10 @@ EXAMPLES = '''
   register: pool
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class CCENodePoolInfoModule(OTCModule):
+class CCENodePoolInfoModule(OTCInfoModule):
     argument_spec = dict(
         cce_cluster=dict(required=True),
         name=dict(required=False),
@@ -170,10 +172,11 @@ class CCENodePoolInfoModule(OTCModule):
     )
 
     otce_min_version = '0.13.0'
+    otce_services = ('cce',)
 
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
 
         cluster = self.conn.cce.find_cluster(
@@ -202,9 +205,7 @@ class CCENodePoolInfoModule(OTCModule):
                 )
         else:
             for raw in self.conn.cce.node_pools(cluster=cluster):
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.add(raw)
 
         self.exit(
             changed=False,
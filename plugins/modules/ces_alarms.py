@@ -220,6 +220,8 @@ class CesAlarmsModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('ces',)
+
     def run(self):
         changed = False
 
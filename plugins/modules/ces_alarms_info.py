@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: ces_alarms_info
 short_description: Get Alarms
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.3.0"
 author: "Sebastian Gode (@SebastianGode)"
 description:
@@ -82,10 +84,10 @@ EXAMPLES = '''
     name: test-alarm
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class CesAlarmsInfoModule(OTCModule):
+class CesAlarmsInfoModule(OTCInfoModule):
     argument_spec = dict(
         name=dict(required=False),
     )
@@ -93,9 +95,11 @@ class CesAlarmsInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('ces',)
+
     def run(self):
 
-        data = []
+        data = self.result_list()
 
         if self.params['name']:
             alarm = self.conn.ces.find_alarm(self.params['name'])
@@ -105,9 +109,7 @@ class CesAlarmsInfoModule(OTCModule):
             )
 
         for raw in self.conn.ces.alarms():
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
 
         self.exit(
             changed=False,
@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: ces_event_data_info
 short_description: Get Event Data
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.3.0"
 author: "Sebastian Gode (@SebastianGode)"
 description:
@@ -91,10 +93,10 @@ EXAMPLES = '''
     time_to: "1605523441322"
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class CesEventDataInfoModule(OTCModule):
+class CesEventDataInfoModule(OTCInfoModule):
     argument_spec = dict(
         namespace=dict(required=True),
         type=dict(required=True),
@@ -108,9 +110,11 @@ class CesEventDataInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('ces',)
+
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
 
         query['namespace'] = self.params['namespace']
@@ -124,9 +128,7 @@ class CesEventDataInfoModule(OTCModule):
                 query['dim.2'] = self.params['dim2']
 
         for raw in self.conn.ces.event_data(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
 
         self.exit(
             changed=False,
@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: ces_metric_data_info
 short_description: Get Metric Data
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.3.0"
 author: "Sebastian Gode (@SebastianGode)"
 description:
@@ -144,10 +146,10 @@ EXAMPLES = '''
     dim0: "instance_id,123456789-6c9d-4594-9d6b-80da84491bec"
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class CesMetricDataInfoModule(OTCModule):
+class CesMetricDataInfoModule(OTCInfoModule):
     argument_spec = dict(
         namespace=dict(required=True),
         metric_name=dict(required=True),
@@ -163,9 +165,11 @@ class CesMetricDataInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('ces',)
+
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
 
         query['namespace'] = self.params['namespace']
@@ -181,9 +185,7 @@ class CesMetricDataInfoModule(OTCModule):
                 query['dim.2'] = self.params['dim2']
 
         for raw in self.conn.ces.metric_data(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
 
         self.exit(
             changed=False,
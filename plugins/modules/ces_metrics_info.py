@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: ces_metrics_info
 short_description: Get Metrics
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.3.0"
 author: "Sebastian Gode (@SebastianGode)"
 description:
@@ -107,10 +109,10 @@ EXAMPLES = '''
     namespace: "SYS.AS"
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class CesMetricsInfoModule(OTCModule):
+class CesMetricsInfoModule(OTCInfoModule):
     argument_spec = dict(
         metric_name=dict(required=False),
         namespace=dict(required=False),
@@ -122,9 +124,11 @@ class CesMetricsInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('ces',)
+
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
 
         if self.params['namespace']:
@@ -136,9 +140,7 @@ class CesMetricsInfoModule(OTCModule):
         query['order'] = self.params['order']
 
         for raw in self.conn.ces.metrics(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
 
         self.exit(
             changed=False,
@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: ces_quotas_info
 short_description: Get ressource Quotas
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.3.0"
 author: "Sebastian Gode (@SebastianGode)"
 description:
@@ -51,24 +53,24 @@ EXAMPLES = '''
 - opentelekomcloud.cloud.ces_quotas_info:
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class CesQuotasInfoModule(OTCModule):
+class CesQuotasInfoModule(OTCInfoModule):
     argument_spec = dict()
     module_kwargs = dict(
         supports_check_mode=True
     )
 
+    otce_services = ('ces',)
+
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
 
         for raw in self.conn.ces.quotas(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
 
         self.exit(
             changed=False,
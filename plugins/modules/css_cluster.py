@@ -200,6 +200,12 @@ cluster:
             }
         }
     ]
+polls:
+    description: Number of status polls done while waiting for the CSS cluster
+        to become available.
+    returned: When I(wait=true) and a cluster was created
+    type: int
+    sample: 7
 '''
 
 EXAMPLES = '''
@@ -292,13 +298,26 @@ class CssClusterModule(OTCModule):
         supports_check_mode=True,
     )
 
+    otce_services = ('css', 'vpc')
+
     class _StateMachine(StateMachine):
 
         def _create(self, attributes, timeout, wait, **kwargs):
             resource = self.create_function(**attributes)
-            wait_function = getattr(self.session, 'wait_for_cluster')
-            wait_function(resource, timeout=timeout)
-            return self.get_function(resource.id)
+
+            def poll():
+                cluster = self.get_function(resource.id)
+                if cluster.error:
+                    raise self.sdk.exceptions.SDKException(cluster.error)
+                # status 100 means the cluster is still being created
+                if (cluster.status_code != 100 and not cluster.actions
+                        and not cluster.action_progress):
+                    return cluster
+                return None
+
+            return self.waiter(timeout, 'css_cluster').wait(
+                poll, 'Timeout waiting for CSS cluster {0} to become'
+                      ' available'.format(resource.id))
 
     def run(self):
         service_name = 'css'
@@ -325,6 +344,7 @@ class CssClusterModule(OTCModule):
             type_name=type_name,
             sdk=self.sdk,
             crud_functions=crud,
+            waiter=self.waiter,
         )
 
         kwargs = dict(
@@ -335,17 +355,19 @@ class CssClusterModule(OTCModule):
         kwargs['attributes'] = {'name': self.params['name']}
 
         if self.params['state'] == 'present':
-            vpc_id = self.conn.vpc.find_vpc(
-                self.params['router'], ignore_missing=False).id
-            network = self.conn.vpc.find_subnet(
-                self.params['net'], ignore_missing=True)
-            if not network:
-                network = self.conn.network.find_network(
-                    self.params['net'], ignore_missing=False)
-            net_id = network.id
+            vpc_id = self.resolve_id(
+                self.conn.vpc.find_vpc, self.params['router'],
+                ignore_missing=False)
+            net_id = self.resolve_id(
+                self.conn.vpc.find_subnet, self.params['net'])
+            if not net_id:
+                net_id = self.resolve_id(
+                    self.conn.network.find_network, self.params['net'],
+                    ignore_missing=False)
 
-            security_group_id = self.conn.network.find_security_group(
-                self.params['security_group'], ignore_missing=False).id
+            security_group_id = self.resolve_id(
+                self.conn.network.find_security_group,
+                self.params['security_group'], ignore_missing=False)
             attrs = {
                 'datastore': {
                     'type': self.params['datastore_type'],
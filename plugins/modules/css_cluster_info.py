@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: css_cluster_info
 short_description: Get info about CSS clusters.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.9.0"
 author:
     - "Yustina Kvrivishvili (@YustinaKvr)"
@@ -182,10 +184,10 @@ EXAMPLES = '''
   register: result
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class CSSClusterInfoModule(OTCModule):
+class CSSClusterInfoModule(OTCInfoModule):
     argument_spec = dict(
         name=dict(),
         start=dict(type='int', default=1),
@@ -196,26 +198,23 @@ class CSSClusterInfoModule(OTCModule):
     )
 
     otce_min_version = '0.24.1'
+    otce_services = ('css',)
 
     def run(self):
-        data = []
+        data = self.result_list()
         if self.params['name']:
             raw = self.conn.css.find_cluster(
                 name_or_id=self.params['name'], ignore_missing=True
             )
             if raw:
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.add(raw)
         else:
             kwargs = {k: self.params[k]
                       for k in ['start', 'limit']
                       if self.params[k] is not None}
 
             for raw in self.conn.css.clusters(**kwargs):
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.add(raw)
 
         self.exit_json(changed=False, css_clusters=data)
 
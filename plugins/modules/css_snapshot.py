@@ -77,6 +77,12 @@ css_snapshot:
         returned: On success when C(state=present)
         type: str
         sample: "snapshot_101"
+polls:
+  description: Number of status polls done while waiting for the CSS cluster to
+    finish the snapshot or for the snapshot to be deleted.
+  returned: When I(wait=true) and a snapshot was created or deleted
+  type: int
+  sample: 7
 """
 
 EXAMPLES = """
@@ -113,12 +119,26 @@ class CssSnapshotModule(OTCModule):
     )
     module_kwargs = dict(supports_check_mode=True)
 
+    otce_services = ('css',)
+
     class _StateMachine(StateMachine):
         def _create(self, attributes, timeout, wait, **kwargs):
             cluster = attributes['cluster']
             resource = self.create_function(**attributes)
-            wait_function = getattr(self.session, 'wait_for_cluster')
-            wait_function(cluster, timeout=timeout)
+
+            def poll():
+                obj = self.session.get_cluster(cluster)
+                if obj.error:
+                    raise self.sdk.exceptions.SDKException(obj.error)
+                # status 100 means the cluster is still being changed
+                if (obj.status_code != 100 and not obj.actions
+                        and not obj.action_progress):
+                    return obj
+                return None
+
+            self.waiter(timeout, 'css_snapshot').wait(
+                poll, 'Timeout waiting for CSS cluster {0} to become'
+                      ' available'.format(cluster.id))
             return self.find_function(cluster, resource.id)
 
         def _find(self, attributes, **kwargs):
@@ -143,12 +163,9 @@ class CssSnapshotModule(OTCModule):
             self.delete_function(cluster, resource['id'])
 
             if wait:
-                for count in self.sdk.utils.iterate_timeout(
-                    timeout=timeout,
-                    message="Timeout waiting for resource to be absent"
-                ):
-                    if self._find(attributes) is None:
-                        break
+                self.waiter(timeout, 'css_snapshot').wait(
+                    lambda: True if self._find(attributes) is None else None,
+                    "Timeout waiting for resource to be absent")
 
         def _build_update(self, resource, attributes, updateable_attributes,
                           non_updateable_attributes, **kwargs):
@@ -177,7 +194,8 @@ class CssSnapshotModule(OTCModule):
             sdk=self.sdk,
             type_name=type_name,
             service_name=service_name,
-            crud_functions=crud_functions
+            crud_functions=crud_functions,
+            waiter=self.waiter,
         )
 
         kwargs = dict(
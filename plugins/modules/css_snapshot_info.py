@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: css_snapshot_info
 short_description: Get CSS snapshot info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.9.0"
 author: "Vladimir Vshivkov (@enrrou)"
 description:
@@ -109,10 +111,10 @@ EXAMPLES = '''
 '''
 
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class CssSnapshotInfoModule(OTCModule):
+class CssSnapshotInfoModule(OTCInfoModule):
 
     argument_spec = dict(
         cluster=dict(required=False),
@@ -123,8 +125,10 @@ class CssSnapshotInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('css',)
+
     def run(self):
-        data = []
+        data = self.result_list()
 
         if self.params['cluster']:
             cluster = self.conn.css.find_cluster(
@@ -139,15 +143,11 @@ class CssSnapshotInfoModule(OTCModule):
                 cluster, self.params['name'], ignore_missing=True
             )
             if raw:
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.add(raw)
 
         else:
             for raw in self.conn.css.snapshots(cluster):
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.add(raw)
 
         self.exit_json(
             changed=False,
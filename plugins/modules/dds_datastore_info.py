@@ -8,7 +8,9 @@
 DOCUMENTATION = '''
 module: dds_datastore_info
 short_description: Obtain database version information about a specified type of a DB instance.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.9.0"
 author: "Yustina Kvrivishvili (@YustinaKvr)"
 description:
@@ -46,10 +48,10 @@ EXAMPLES = '''
   register: result
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class DDSDatastoreInfo(OTCModule):
+class DDSDatastoreInfo(OTCInfoModule):
     argument_spec = dict(
         datastore_name=dict(required=True)
     )
@@ -57,16 +59,14 @@ class DDSDatastoreInfo(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('dds',)
+
     def run(self):
         datastore_name = self.params['datastore_name']
 
-        data = []
+        data = self.result_list()
         for raw in self.conn.dds.datastores(datastore_name):
-            dt = raw.to_dict()
-            dt.pop('location')
-            dt.pop('id')
-            dt.pop('name')
-            data.append(dt)
+            data.add(raw, drop=('location', 'id', 'name'))
 
         self.exit(
             changed=False,
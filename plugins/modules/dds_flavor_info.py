@@ -8,7 +8,9 @@
 DOCUMENTATION = '''
 module: dds_flavor_info
 short_description: Obtain flavor type information about a specified region and DB type.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.9.0"
 author: "Yustina Kvrivishvili (@YustinaKvr)"
 description:
@@ -25,6 +27,35 @@ options:
     type: str
     required: false
     default: 'DDS-Community'
+  node_type:
+    description:
+      - Return only flavors of this node type.
+    type: str
+    choices: [mongos, shard, config, replica, single]
+  min_vcpus:
+    description:
+      - Return only flavors with at least this number of vCPUs.
+    type: int
+  min_ram:
+    description:
+      - Return only flavors with at least this amount of RAM in GB.
+    type: int
+  availability_zone:
+    description:
+      - Return only flavors available in this availability zone.
+    type: str
+  order_by:
+    description:
+      - Attributes to sort the flavors by, prefix an attribute with C(-)
+        to sort descending.
+    type: list
+    elements: str
+    choices: [vcpus, -vcpus, ram, -ram]
+  limit:
+    description:
+      - Return at most this number of flavors, the first ones according
+        to I(order_by).
+    type: int
 requirements: ["openstacksdk", "otcextensions"]
 '''
 
@@ -65,29 +96,63 @@ EXAMPLES = '''
 - opentelekomcloud.cloud.dds_flavor_info:
     region: "eu-de"
   register: result
+
+# Get the two largest shard flavors with at least 8 GB RAM in an AZ
+- opentelekomcloud.cloud.dds_flavor_info:
+    region: "eu-de"
+    node_type: "shard"
+    min_ram: 8
+    availability_zone: "eu-de-01"
+    order_by: [-vcpus, -ram]
+    limit: 2
+  register: result
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class DDSFlavorInfo(OTCModule):
+class DDSFlavorInfo(OTCInfoModule):
     argument_spec = dict(
         region=dict(required=True),
         engine_name=dict(default='DDS-Community'),
+        node_type=dict(
+            choices=['mongos', 'shard', 'config', 'replica', 'single']),
+        min_vcpus=dict(type='int'),
+        min_ram=dict(type='int'),
+        availability_zone=dict(),
+        order_by=dict(type='list', elements='str',
+                      choices=['vcpus', '-vcpus', 'ram', '-ram']),
+        limit=dict(type='int'),
     )
     module_kwargs = dict(
         supports_check_mode=True
     )
 
+    otce_services = ('dds',)
+
     def run(self):
         region = self.params['region']
         engine_name = self.params['engine_name']
 
-        data = []
-        for raw in self.conn.dds.flavors(region=region, engine_name=engine_name):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+        data = self.result_list()
+        catalog = self.catalog(
+            'dds.flavors.%s.%s' % (region, engine_name),
+            lambda: self.conn.dds.flavors(region=region,
+                                          engine_name=engine_name))
+        query = {}
+        if self.params['node_type']:
+            query['type'] = self.params['node_type']
+        minimum = {}
+        if self.params['min_vcpus'] is not None:
+            minimum['vcpus'] = self.params['min_vcpus']
+        if self.params['min_ram'] is not None:
+            minimum['ram'] = self.params['min_ram']
+        flavors = catalog.select(
+            attrs=query, minimum=minimum,
+            available_in=self.params['availability_zone'],
+            order_by=self.params['order_by'], limit=self.params['limit'])
+        for flavor in flavors:
+            data.append(flavor)
 
         self.exit(
             changed=False,
@@ -8,7 +8,9 @@
 DOCUMENTATION = '''
 module: dds_instance_info
 short_description: Obtain information about a specified DB instance.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.9.0"
 author: "Yustina Kvrivishvili (@YustinaKvr)"
 description:
@@ -252,10 +254,10 @@ EXAMPLES = '''
   register: result
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class DDSInstanceInfo(OTCModule):
+class DDSInstanceInfo(OTCInfoModule):
     argument_spec = dict(
         instance=dict(),
         mode=dict(choices=['sharding', 'replicaset']),
@@ -267,9 +269,11 @@ class DDSInstanceInfo(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('dds',)
+
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
 
         instance = self.params['instance']
@@ -300,9 +304,7 @@ class DDSInstanceInfo(OTCModule):
                 query['subnet_id'] = subnet.id
 
         for raw in self.conn.dds.instances(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
 
         self.exit(
             changed=False,
@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: deh_host_info
 short_description: Get Dedicated host info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.1.2"
 author: "Tino Schreiber (@tischrei)"
 description:
@@ -159,10 +161,10 @@ EXAMPLES = '''
 
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class DehHostInfoModule(OTCModule):
+class DehHostInfoModule(OTCInfoModule):
     argument_spec = dict(
         availability_zone=dict(required=False),
         changes_since=dict(required=False),
@@ -181,9 +183,11 @@ class DehHostInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('deh',)
+
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
 
         if self.params['host']:
@@ -220,9 +224,7 @@ class DehHostInfoModule(OTCModule):
             query['tags'] = self.params['tags']
 
         for raw in self.conn.deh.hosts(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
 
         self.exit(
             changed=False,
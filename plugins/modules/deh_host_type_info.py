@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: deh_host_type_info
 short_description: Get info about all available host types in a AZ
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.1.2"
 author: "Tino Schreiber (@tischrei)"
 description:
@@ -81,10 +83,10 @@ EXAMPLES = '''
   register: deh
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class DehHostTypeInfoModule(OTCModule):
+class DehHostTypeInfoModule(OTCInfoModule):
     argument_spec = dict(
         az=dict(required=True)
     )
@@ -92,18 +94,18 @@ class DehHostTypeInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('deh',)
+
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
 
         if self.params['az']:
             query['az'] = self.params['az']
 
         for raw in self.conn.deh.host_types(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
 
         self.exit(
             changed=False,
@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: deh_server_info
 short_description: Get info about ECSs on a Dedicated host
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.1.2"
 author: "Tino Schreiber (@tischrei)"
 description:
@@ -115,10 +117,10 @@ EXAMPLES = '''
   register: server
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class DehServerInfoModule(OTCModule):
+class DehServerInfoModule(OTCInfoModule):
     argument_spec = dict(
         dedicated_host=dict(required=True)
     )
@@ -126,9 +128,11 @@ class DehServerInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('deh',)
+
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
 
         if self.params['dedicated_host']:
@@ -146,9 +150,7 @@ class DehServerInfoModule(OTCModule):
                 )
 
         for raw in self.conn.deh.servers(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
 
         self.exit(
             changed=False,
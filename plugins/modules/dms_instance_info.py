@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: dms_instance_info
 short_description: Get info about DMS instances
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.1.2"
 author: "Sebastian Gode (@SebastianGode)"
 description:
@@ -111,10 +113,10 @@ EXAMPLES = '''
     status: createfailed
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class DmsInstanceInfoModule(OTCModule):
+class DmsInstanceInfoModule(OTCInfoModule):
     argument_spec = dict(
         engine=dict(required=False),
         name=dict(required=False),
@@ -128,9 +130,11 @@ class DmsInstanceInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('dms',)
+
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
 
         if self.params['engine']:
@@ -147,9 +151,7 @@ class DmsInstanceInfoModule(OTCModule):
             query['exactMatchName'] = self.params['exactMatchName']
 
         for raw in self.conn.dms.instances(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
         self.exit(
             changed=False,
             dms_instances=data
@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: dms_instance_topic_info
 short_description: Get info about DMS instance topics
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.1.2"
 author: "Sebastian Gode (@SebastianGode)"
 description:
@@ -87,10 +89,10 @@ EXAMPLES = '''
     instance: 'test'
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class DmsInstanceTopicInfoModule(OTCModule):
+class DmsInstanceTopicInfoModule(OTCInfoModule):
     argument_spec = dict(
         instance=dict(required=True),
     )
@@ -98,16 +100,16 @@ class DmsInstanceTopicInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('dms',)
+
     def run(self):
 
-        data = []
+        data = self.result_list()
         instance = self.conn.dms.find_instance(name_or_id=self.params['instance'], ignore_missing=True)
 
         if instance:
             for raw in self.conn.dms.topics(instance):
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.add(raw)
             self.exit(
                 changed=False,
                 dms_instances=data
@@ -130,6 +130,8 @@ class DmsMessageModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('dms',)
+
     def run(self):
         attrs = {}
         queue = self.conn.dms.find_queue(name_or_id=self.params['queue'])
@@ -95,6 +95,8 @@ class DmsQueueModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('dms',)
+
     def run(self):
         attrs = {}
         queue = self.conn.dms.find_queue(name_or_id=self.params['queue_name'])
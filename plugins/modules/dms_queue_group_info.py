@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: dms_queue_group_info
 short_description: Get info about DMS queue groups
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.1.2"
 author: "Sebastian Gode (@SebastianGode)"
 description:
@@ -60,10 +62,10 @@ EXAMPLES = '''
   register: dms-queue
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class DmsQueueInfoModule(OTCModule):
+class DmsQueueInfoModule(OTCInfoModule):
     argument_spec = dict(
         queue=dict(required=True),
         include_deadletter=dict(required=False, type='bool', default='false')
@@ -72,9 +74,11 @@ class DmsQueueInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('dms',)
+
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
 
         queue = self.conn.dms.find_queue(
@@ -84,9 +88,7 @@ class DmsQueueInfoModule(OTCModule):
             query['include_deadletter'] = self.params['include_deadletter']
         if queue:
             for raw in self.conn.dms.groups(queue.id, **query):
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.add(raw)
             self.exit(
                 changed=False,
                 dms_queues=data
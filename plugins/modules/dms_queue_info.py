@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: dms_queue_info
 short_description: Get info about DMS queues
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.1.2"
 author: "Sebastian Gode (@SebastianGode)"
 description:
@@ -54,10 +56,10 @@ EXAMPLES = '''
   register: dms-queue
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class DmsQueueInfoModule(OTCModule):
+class DmsQueueInfoModule(OTCInfoModule):
     argument_spec = dict(
         queue=dict(required=False)
     )
@@ -65,9 +67,11 @@ class DmsQueueInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('dms',)
+
     def run(self):
 
-        data = []
+        data = self.result_list()
 
         if self.params['queue']:
             queue = self.conn.dms.find_queue(
@@ -86,9 +90,7 @@ class DmsQueueInfoModule(OTCModule):
                 )
         else:
             for raw in self.conn.dms.queues():
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.add(raw)
 
         self.exit(
             changed=False,
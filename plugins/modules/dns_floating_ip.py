@@ -101,6 +101,8 @@ class DNSFloatingIpModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('dns',)
+
     def run(self):
         changed = False
 
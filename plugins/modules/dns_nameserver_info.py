@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: dns_nameserver_info
 short_description: Get info about DNS nameservers.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.12.2"
 author: "Anton Sidelnikov (@anton-sidelnikov)"
 description:
@@ -55,10 +57,10 @@ EXAMPLES = '''
   register: nameservers
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class DNSNameserverInfoModule(OTCModule):
+class DNSNameserverInfoModule(OTCInfoModule):
 
     argument_spec = dict(
         zone=dict(required=True),
@@ -67,9 +69,11 @@ class DNSNameserverInfoModule(OTCModule):
         supports_check_mode=True,
     )
 
+    otce_services = ('dns',)
+
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
 
         if self.params['zone']:
@@ -80,11 +84,7 @@ class DNSNameserverInfoModule(OTCModule):
                 self.fail_json(msg="Zone not found")
 
         for raw in self.conn.dns.nameservers(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            dt.pop('name')
-            dt.pop('id')
-            data.append(dt)
+            data.add(raw, drop=('location', 'name', 'id'))
 
         self.exit(
             changed=False,
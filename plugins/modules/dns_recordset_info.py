@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: dns_recordset_info
 short_description: Get info about DNS recordsets.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.8.1"
 author: "Yustina Kvrivishvili (@YustinaKvr)"
 description:
@@ -91,10 +93,10 @@ EXAMPLES = '''
   register: recordsets
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class DNSRecordsetInfoModule(OTCModule):
+class DNSRecordsetInfoModule(OTCInfoModule):
 
     argument_spec = dict(
         zone=dict(required=False),
@@ -110,9 +112,11 @@ class DNSRecordsetInfoModule(OTCModule):
         required_if=[('name', not None, ['zone'])]
     )
 
+    otce_services = ('dns',)
+
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
         recordset = None
 
@@ -150,9 +154,7 @@ class DNSRecordsetInfoModule(OTCModule):
             query['type'] = self.params['type'].upper()
 
         for raw in self.conn.dns.recordsets(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
 
         self.exit(
             changed=False,
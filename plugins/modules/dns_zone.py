@@ -131,6 +131,8 @@ class DNSZonesModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('dns',)
+
     def run(self):
         changed = False
         attrs = {}
@@ -176,14 +178,13 @@ class DNSZonesModule(OTCModule):
                             changed=False,
                             message='No Router specified, but needed for creation'
                         )
-                    ro = self.conn.network.find_router(
-                        name_or_id=self.params['router'],
-                        ignore_missing=True
+                    ro_id = self.resolve_id(
+                        self.conn.network.find_router, self.params['router']
                     )
-                    if ro:
+                    if ro_id:
                         # Somehow the API wants a dict with router_id in it
                         routerdict = {
-                            'router_id': ro.id
+                            'router_id': ro_id
                         }
                         attrs['router'] = routerdict
                     else:
@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: dns_zone_info
 short_description: Get DNS Zones info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.13.1"
 author: "Vladimir Vshivkov (@vladimirvshivkov)"
 description:
@@ -85,10 +87,10 @@ EXAMPLES = '''
     zone_type: private
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class DNSZonesInfoModule(OTCModule):
+class DNSZonesInfoModule(OTCInfoModule):
     argument_spec = dict(
         name=dict(required=True),
         zone_type=dict()
@@ -97,6 +99,8 @@ class DNSZonesInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('dns',)
+
     def run(self):
         query = {
             'type': self.params['zone_type'],
@@ -235,6 +235,8 @@ class dwsClusterModule(OTCModule):
         supports_check_mode=True,
     )
 
+    otce_services = ('dws', 'vpc')
+
     class _StateMachine(StateMachine):
         def _create(self, attributes, timeout, wait, **kwargs):
             resource = self.create_function(**attributes)
@@ -277,23 +279,23 @@ class dwsClusterModule(OTCModule):
         kwargs['attributes'] = {'name': self.params['name']}
 
         if self.params['state'] == 'present':
-            vpc_id = self.conn.vpc.find_vpc(
-                self.params['router'], ignore_missing=False
-            ).id
-            net_id = None
-            network = self.conn.vpc.find_subnet(
-                self.params['network'], ignore_missing=True
+            vpc_id = self.resolve_id(
+                self.conn.vpc.find_vpc, self.params['router'],
+                ignore_missing=False
+            )
+            net_id = self.resolve_id(
+                self.conn.vpc.find_subnet, self.params['network']
             )
-            if network:
-                net_id = network.id
-            else:
-                net_id = self.conn.network.find_network(
-                    self.params['network'], ignore_missing=False
-                ).id
+            if not net_id:
+                net_id = self.resolve_id(
+                    self.conn.network.find_network, self.params['network'],
+                    ignore_missing=False
+                )
 
-            security_group_id = self.conn.network.find_security_group(
+            security_group_id = self.resolve_id(
+                self.conn.network.find_security_group,
                 self.params['security_group'], ignore_missing=False
-            ).id
+            )
             attrs = {
                 'flavor': self.params['flavor'],
                 'num_nodes': self.params['num_nodes'],
@@ -15,7 +15,9 @@
 DOCUMENTATION = """
 module: dws_cluster_info
 short_description: Get info about DWS clusters.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.14.4"
 author: "Attila Somogyi (@sattila1999)"
 description:
@@ -290,31 +292,29 @@ EXAMPLES = """
 """
 
 from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import (
-    OTCModule,
+    OTCInfoModule,
 )
 
 
-class DWSClusterInfoModule(OTCModule):
+class DWSClusterInfoModule(OTCInfoModule):
     argument_spec = dict(name=dict())
     module_kwargs = dict(supports_check_mode=True)
 
     otce_min_version = "0.24.1"
 
+    otce_services = ('dws',)
+
     def run(self):
-        data = []
+        data = self.result_list()
         if self.params['name']:
             raw = self.conn.dws.find_cluster(
                 name_or_id=self.params['name'], ignore_missing=True
             )
             if raw:
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.add(raw)
         else:
             for raw in self.conn.dws.clusters():
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.add(raw)
 
         self.exit_json(changed=False, dws_clusters=data)
 
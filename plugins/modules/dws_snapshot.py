@@ -114,6 +114,8 @@ class DwsSnapshotModule(OTCModule):
         supports_check_mode=True,
     )
 
+    otce_services = ('dws',)
+
     class _StateMachine(StateMachine):
         def _create(self, attributes, timeout, wait, **kwargs):
             resource = self.create_function(**attributes)
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: dws_snapshot_info
 short_description: Get DWS snapshot info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.14.4"
 author: "Attila Somogyi (@sattila1999)"
 description:
@@ -71,10 +73,10 @@ EXAMPLES = '''
 '''
 
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class DwsSnapshotInfoModule(OTCModule):
+class DwsSnapshotInfoModule(OTCInfoModule):
 
     argument_spec = dict(
         name=dict(required=False)
@@ -84,8 +86,10 @@ class DwsSnapshotInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('dws',)
+
     def run(self):
-        data = []
+        data = self.result_list()
 
         if self.params['name']:
             # search snapshot by name or id
@@ -93,15 +97,11 @@ class DwsSnapshotInfoModule(OTCModule):
                 name_or_id=self.params['name'], ignore_missing=True
             )
             if raw:
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.add(raw)
 
         else:
             for raw in self.conn.dws.snapshots():
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.add(raw)
 
         self.exit_json(
             changed=False,
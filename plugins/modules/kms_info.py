@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: kms_info
 short_description: Get info about KMS keys.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.12.5"
 author: "Anton Sidelnikov (@anton-sidelnikov)"
 description:
@@ -88,12 +90,12 @@ EXAMPLES = '''
 '''
 
 import re
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 UUID_PATTERN = re.compile(r'^[\da-f]{8}-([\da-f]{4}-){3}[\da-f]{12}$', re.IGNORECASE)
 
 
-class KMSInfoModule(OTCModule):
+class KMSInfoModule(OTCInfoModule):
     argument_spec = dict(
         name=dict(required=False),
         key_state=dict(required=False, no_log=False),
@@ -103,10 +105,11 @@ class KMSInfoModule(OTCModule):
     )
 
     otce_min_version = '0.26.0'
+    otce_services = ('kms',)
 
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
 
         if self.params['key_state']:
@@ -116,22 +119,16 @@ class KMSInfoModule(OTCModule):
             if UUID_PATTERN.match(self.params['name']):
                 raw = self.conn.kms.get_key(self.params['name'])
                 if raw:
-                    dt = raw.to_dict()
-                    dt.pop('location')
-                    data.append(dt)
+                    data.add(raw)
             else:
                 raw = self.conn.kms.find_key(
                     alias=self.params['name'],
                     ignore_missing=True)
                 if raw:
-                    dt = raw.to_dict()
-                    dt.pop('location')
-                    data.append(dt)
+                    data.add(raw)
         else:
             for raw in self.conn.kms.keys(**query):
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.add(raw)
 
         self.exit(
             changed=False,
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: lb_certificate_info
 short_description: Get elb certificate info from OpenTelekomCloud
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.3"
 author: "Anton Sidelnikov (@anton-sidelnikov)"
 description:
@@ -74,10 +76,10 @@ EXAMPLES = '''
   register: lb_cert
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class LoadBalancerCertificateInfoModule(OTCModule):
+class LoadBalancerCertificateInfoModule(OTCInfoModule):
     argument_spec = dict(
         name=dict(required=False)
     )
@@ -86,21 +88,18 @@ class LoadBalancerCertificateInfoModule(OTCModule):
     )
 
     otce_min_version = '0.10.0'
+    otce_services = ('elb',)
 
     def run(self):
-        data = []
+        data = self.result_list()
 
         if self.params['name']:
             raw = self.conn.elb.find_certificate(name_or_id=self.params['name'], ignore_missing=True)
             if raw:
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.add(raw)
         else:
             for raw in self.conn.elb.certificates():
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.add(raw)
 
         self.exit_json(
             changed=False,
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: lb_healthmonitor_info
 short_description: Get health checks info from OpenTelekomCloud
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.3"
 author: "Anton Sidelnikov (@anton-sidelnikov)"
 description:
@@ -140,10 +142,10 @@ EXAMPLES = '''
   register: healthmonitor
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class LoadBalancerHealthMonitorInfoModule(OTCModule):
+class LoadBalancerHealthMonitorInfoModule(OTCInfoModule):
     argument_spec = dict(
         name=dict(required=False),
         delay=dict(required=False, type='int'),
@@ -162,6 +164,8 @@ class LoadBalancerHealthMonitorInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ()
+
     def run(self):
         name_filter = self.params['name']
         delay_filter = self.params['delay']
@@ -174,7 +178,7 @@ class LoadBalancerHealthMonitorInfoModule(OTCModule):
         domain_name_filter = self.params['domain_name']
         http_method_filter = self.params['http_method']
 
-        data = []
+        data = self.result_list()
         args = {}
         if name_filter:
             args['name'] = name_filter
@@ -199,14 +203,10 @@ class LoadBalancerHealthMonitorInfoModule(OTCModule):
 
         if name_filter:
             raw = self.conn.network.find_health_monitor(name_or_id=name_filter)
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
         else:
             for raw in self.conn.network.health_monitors(**args):
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.add(raw)
 
         self.exit_json(
             changed=False,
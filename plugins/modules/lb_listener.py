@@ -206,6 +206,8 @@ class LoadBalancerListenerModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ()
+
     def run(self):
         name_filter = self.params['name']
         description_filter = self.params['description']
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: lb_listener_info
 short_description: Get listener info from OpenTelekomCloud
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.3"
 author: "Anton Sidelnikov (@anton-sidelnikov)"
 description:
@@ -80,10 +82,10 @@ EXAMPLES = '''
   register: lb_lstnr_info
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class LoadBalancerListenerInfoModule(OTCModule):
+class LoadBalancerListenerInfoModule(OTCInfoModule):
     argument_spec = dict(
         name=dict(required=False)
     )
@@ -91,19 +93,17 @@ class LoadBalancerListenerInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ()
+
     def run(self):
-        data = []
+        data = self.result_list()
 
         if self.params['name']:
             raw = self.conn.network.find_listener(name_or_id=self.params['name'])
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
         else:
             for raw in self.conn.network.listeners():
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.add(raw)
 
         self.exit_json(
             changed=False,
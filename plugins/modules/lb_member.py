@@ -131,6 +131,8 @@ class LoadBalancerMemberModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ()
+
     def run(self):
         name_filter = self.params['name']
         address_filter = self.params['address']
@@ -161,8 +163,9 @@ class LoadBalancerMemberModule(OTCModule):
             if protocol_port_filter:
                 attrs['protocol_port'] = protocol_port_filter
             if subnet_filter:
-                subnet = self.conn.network.find_subnet(name_or_id=subnet_filter)
-                attrs['subnet_id'] = subnet.id
+                attrs['subnet_id'] = self.resolve_id(
+                    self.conn.network.find_subnet, subnet_filter,
+                    ignore_missing=False)
 
             if lb_member and lb_pool:
                 mattrs = {}
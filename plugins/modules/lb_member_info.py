@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: lb_member_info
 short_description: Get backend server group member info from OpenTelekomCloud
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.3"
 author: "Anton Sidelnikov (@anton-sidelnikov)"
 description:
@@ -101,10 +103,10 @@ EXAMPLES = '''
   register: lb_mmbr_info
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class LoadBalancerMemberInfoModule(OTCModule):
+class LoadBalancerMemberInfoModule(OTCInfoModule):
     argument_spec = dict(
         name=dict(required=False),
         pool=dict(required=True),
@@ -119,6 +121,8 @@ class LoadBalancerMemberInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ()
+
     def run(self):
         name_filter = self.params['name']
         project_id_filter = self.params['project_id']
@@ -128,7 +132,7 @@ class LoadBalancerMemberInfoModule(OTCModule):
         admin_state_filter = self.params['admin_state_up']
         weight_filter = self.params['weight']
 
-        data = []
+        data = self.result_list()
         args = {}
 
         if name_filter:
@@ -151,14 +155,10 @@ class LoadBalancerMemberInfoModule(OTCModule):
         pool = self.conn.network.find_pool(name_or_id=self.params['pool'])
         if self.params['name']:
             raw = self.conn.network.find_pool_member(pool=pool, name_or_id=name_filter)
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
         else:
             for raw in self.conn.network.pool_members(pool=pool, **args):
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.add(raw)
 
         self.exit_json(
             changed=False,
@@ -164,6 +164,8 @@ class LoadBalancerPoolModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ()
+
     def _dict_hash(self, dictionary: Dict[str, Any]) -> str:
         """MD5 hash of a dictionary."""
 
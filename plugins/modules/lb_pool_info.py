@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: lb_pool_info
 short_description: Get load balancer backend server group info from OpenTelekomCloud
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.3"
 author: "Anton Sidelnikov (@anton-sidelnikov)"
 description:
@@ -80,10 +82,10 @@ EXAMPLES = '''
   register: lb_pool_info
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class LoadBalancerPoolInfoModule(OTCModule):
+class LoadBalancerPoolInfoModule(OTCInfoModule):
     argument_spec = dict(
         name=dict(required=False)
     )
@@ -91,19 +93,17 @@ class LoadBalancerPoolInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ()
+
     def run(self):
-        data = []
+        data = self.result_list()
 
         if self.params['name']:
             raw = self.conn.network.find_pool(name_or_id=self.params['name'])
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
         else:
             for raw in self.conn.network.pools():
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.add(raw)
 
         self.exit_json(
             changed=False,
@@ -131,6 +131,12 @@ loadbalancer:
       description: The associated pool IDs, if any.
       type: list
       sample: [{"id": "27b78d92-cee1-4646-b831-e3b90a7fa714"}, {"id": "befc1fb5-1992-4697-bdb9-eee330989344"}]
+polls:
+  description: Number of status polls done while waiting for the load balancer
+    to become ACTIVE.
+  returned: When I(wait=true) and C(state=present)
+  type: int
+  sample: 7
 '''
 
 EXAMPLES = '''
@@ -164,8 +170,6 @@ EXAMPLES = '''
     delete_public_ip: yes
 '''
 
-import time
-
 from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
 
 
@@ -183,35 +187,24 @@ class LoadBalancerModule(OTCModule):
         supports_check_mode=True
     )
 
-    def _wait_for_lb(self, lb, status, failures, interval=5):
-        """Wait for load balancer to be in a particular provisioning status."""
-        timeout = self.params['timeout']
-
-        total_sleep = 0
-        if failures is None:
-            failures = []
-
-        while total_sleep < timeout:
-            lb = self.conn.network.get_load_balancer(lb.id)
-
-            if lb:
-                if lb:
-                    return None
-            else:
-                if status == "DELETED":
-                    return None
-                else:
-                    self.fail_json(
-                        msg="Load Balancer %s transitioned to DELETED" % lb.id
-                    )
-
-            time.sleep(interval)
-            total_sleep += interval
+    otce_services = ('elb',)
 
-        self.fail_json(
-            msg="Timeout waiting for Load Balancer %s to transition to %s" %
-                (lb.id, status)
-        )
+    def _wait_for_lb(self, lb, status, failures):
+        """Wait for load balancer to be in a particular provisioning status."""
+        try:
+            return self.waiter(
+                self.params['timeout'], 'loadbalancer').wait_for_status(
+                    self.conn.network, lb, status, failures,
+                    attribute='provisioning_status')
+        except self.sdk.exceptions.ResourceNotFound:
+            self.fail_json(
+                msg="Load Balancer %s transitioned to DELETED" % lb.id
+            )
+        except self.sdk.exceptions.ResourceTimeout:
+            self.fail_json(
+                msg="Timeout waiting for Load Balancer %s to transition to %s" %
+                    (lb.id, status)
+            )
 
     def bind_floating_ip(self, lb, public_vip_address, allocate_fip):
         fip = None
@@ -321,7 +314,7 @@ class LoadBalancerModule(OTCModule):
                     id=lb.id
                 )
 
-            self._wait_for_lb(lb, "ACTIVE", ["ERROR"])
+            lb = self._wait_for_lb(lb, "ACTIVE", ["ERROR"])
 
             # Associate public ip to the load balancer VIP. If
             # public_vip_address is provided, use that IP, otherwise, either
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: loadbalancer_info
 short_description: Get load balancer info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.1"
 author: "Artem Goncharov (@gtema)"
 description:
@@ -94,10 +96,10 @@ EXAMPLES = '''
   register: lb_info
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class LoadBalancerInfoModule(OTCModule):
+class LoadBalancerInfoModule(OTCInfoModule):
     argument_spec = dict(
         name=dict(required=False)
     )
@@ -105,6 +107,8 @@ class LoadBalancerInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ()
+
     def run(self):
         if self.params['name']:
             lb = self.conn.network.find_load_balancer(
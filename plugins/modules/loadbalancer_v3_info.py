@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: loadbalancer_v3_info
 short_description: Get load balancer (VLB) from OpenTelekomCloud
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.14.0"
 author: "Polina Gubina (@polina-gubina)"
 description: Get info about Dedicated Load Balancer from the OTC service (VLB).
@@ -302,10 +304,10 @@ EXAMPLES = '''
 '''
 
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class LoadbalancerV3InfoModule(OTCModule):
+class LoadbalancerV3InfoModule(OTCInfoModule):
     argument_spec = dict(
         name_or_id=dict(required=False),
         description=dict(required=False),
@@ -334,15 +336,15 @@ class LoadbalancerV3InfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('vlb', 'vpc')
+
     def run(self):
-        data = []
+        data = self.result_list()
 
         if self.params['name_or_id']:
             raw = self.conn.vlb.find_load_balancer(
                 name_or_id=self.params['name_or_id'])
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
         else:
             kwargs = dict((k, self.params[k])
                           for k in ['description', 'provisioning_status',
@@ -15,7 +15,9 @@
 DOCUMENTATION = """
 module: mrs_cluster_info
 short_description: Get info about MRS clusters.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.14.4"
 author: "Attila Somogyi (@sattila1999)"
 description:
@@ -514,7 +516,7 @@ EXAMPLES = """
 """
 
 from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import (
-    OTCModule,
+    OTCInfoModule,
 )
 
 
@@ -529,7 +531,7 @@ def _normalize_tags(tags):
     return result[:-1]
 
 
-class MRSClusterInfoModule(OTCModule):
+class MRSClusterInfoModule(OTCInfoModule):
     argument_spec = dict(
         name=dict(),
         status=dict(type='str'),
@@ -539,17 +541,16 @@ class MRSClusterInfoModule(OTCModule):
     module_kwargs = dict(supports_check_mode=True)
 
     otce_min_version = '0.24.1'
+    otce_services = ('mrs',)
 
     def run(self):
-        data = []
+        data = self.result_list()
         if self.params['name']:
             raw = self.conn.mrs.find_cluster(
                 name_or_id=self.params['name'], ignore_missing=True
             )
             if raw:
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.add(raw)
         else:
             if self.params['tags']:
                 self.params['tags'] = _normalize_tags(self.params['tags'])
@@ -558,9 +559,7 @@ class MRSClusterInfoModule(OTCModule):
                       if self.params[k] is not None}
 
             for raw in self.conn.mrs.clusters(**kwargs):
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.add(raw)
 
         self.exit_json(changed=False, mrs_clusters=data)
 
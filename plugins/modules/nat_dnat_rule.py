@@ -125,6 +125,12 @@ dnat_rule:
             description: Specifies the status of the NAT gateway.
             type: str
             sample: "ACTIVE"
+polls:
+    description: Number of status polls done while waiting for the DNAT rule to
+        become ACTIVE or to be deleted.
+    returned: When a rule was created or deleted
+    type: int
+    sample: 7
 '''
 
 EXAMPLES = '''
@@ -163,6 +169,8 @@ class NatDnatModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('nat',)
+
     def run(self):
         changed = False
 
@@ -176,7 +184,8 @@ class NatDnatModule(OTCModule):
                 )
                 if dnat_rule:
                     self.conn.nat.delete_dnat_rule(dnat_rule)
-                    self.conn.nat.wait_for_delete_dnat(dnat_rule.id)
+                    self.waiter(180, 'nat_rule').wait_for_delete(
+                        self.conn.nat, dnat_rule)
                     changed = True
                 else:
                     self.exit(
@@ -308,7 +317,8 @@ class NatDnatModule(OTCModule):
                     )
 
             dnat_rule = self.conn.nat.create_dnat_rule(**attrs)
-            dnat_rule = self.conn.nat.wait_for_dnat(dnat_rule)
+            dnat_rule = self.waiter(300, 'nat_rule').wait_for_status(
+                self.conn.nat, dnat_rule, 'ACTIVE', ['INACTIVE'])
             self.exit(changed=True, dnat_rule=dnat_rule.to_dict())
 
         self.exit(changed=changed)
@@ -14,7 +14,9 @@ DOCUMENTATION = '''
 ---
 module: nat_dnat_rule_info
 short_description: Get DNAT rule details
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.4"
 author: "Sebastian Gode (@SebastianGode)"
 description:
@@ -149,10 +151,10 @@ EXAMPLES = '''
   register: dn
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class DNATRuleInfoModule(OTCModule):
+class DNATRuleInfoModule(OTCInfoModule):
     argument_spec = dict(
         admin_state_up=dict(required=False, type='bool'),
         created_at=dict(required=False),
@@ -171,8 +173,10 @@ class DNATRuleInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('nat',)
+
     def run(self):
-        data = []
+        data = self.result_list()
         query = {}
 
         if self.params['rule']:
@@ -246,9 +250,7 @@ class DNATRuleInfoModule(OTCModule):
             query['status'] = self.params['status']
 
         for raw in self.conn.nat.dnat_rules(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
 
         self.exit(
             changed=False,
@@ -139,6 +139,8 @@ class NATGatewayModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('identity', 'nat')
+
     def _system_state_change(self, obj):
         state = self.params['state']
         if state == 'present':
@@ -182,10 +184,10 @@ class NATGatewayModule(OTCModule):
                 # Specs which cannot be modified and playbook fails if
                 # a change is requested
                 if self.params['internal_network']:
-                    nw = self.conn.network.find_network(
-                        name_or_id=self.params['internal_network'],
-                        ignore_missing=True)
-                    if not nw or nw.id != gateway.internal_network_id:
+                    nw_id = self.resolve_id(
+                        self.conn.network.find_network,
+                        self.params['internal_network'])
+                    if nw_id != gateway.internal_network_id:
                         self.exit(
                             changed=False,
                             message=('Existing NAT gateway has different '
@@ -212,10 +214,9 @@ class NATGatewayModule(OTCModule):
                             failed=True
                         )
                 if self.params['router']:
-                    rt = self.conn.network.find_router(
-                        name_or_id=self.params['router'],
-                        ignore_missing=True)
-                    if not rt or rt.id != gateway.router_id:
+                    rt_id = self.resolve_id(
+                        self.conn.network.find_router, self.params['router'])
+                    if rt_id != gateway.router_id:
                         self.exit(
                             changed=False,
                             message=('Existing NAT gateway has different '
@@ -244,11 +245,11 @@ class NATGatewayModule(OTCModule):
             if self.params['description']:
                 attrs['description'] = self.params['description']
 
-            nw = self.conn.network.find_network(
-                name_or_id=self.params['internal_network'],
-                ignore_missing=True)
-            if nw:
-                attrs['internal_network_id'] = nw.id
+            nw_id = self.resolve_id(
+                self.conn.network.find_network,
+                self.params['internal_network'])
+            if nw_id:
+                attrs['internal_network_id'] = nw_id
             else:
                 self.exit(
                     changed=False,
@@ -262,11 +263,10 @@ class NATGatewayModule(OTCModule):
             if self.params['project']:
                 attrs['project_id'] = self.params['project']
 
-            rt = self.conn.network.find_router(
-                name_or_id=self.params['router'],
-                ignore_missing=True)
-            if rt:
-                attrs['router_id'] = rt.id
+            rt_id = self.resolve_id(
+                self.conn.network.find_router, self.params['router'])
+            if rt_id:
+                attrs['router_id'] = rt_id
             else:
                 self.exit(
                     changed=False,
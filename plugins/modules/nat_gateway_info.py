@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: nat_gateway_info
 short_description: Get NAT gateways
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.4"
 author: "Tino Schreiber (@tischrei)"
 description:
@@ -131,10 +133,10 @@ EXAMPLES = '''
 
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class NATGatewayInfoModule(OTCModule):
+class NATGatewayInfoModule(OTCInfoModule):
     argument_spec = dict(
         admin_state_up=dict(required=False, type='bool'),
         created_at=dict(required=False),
@@ -150,9 +152,11 @@ class NATGatewayInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('nat',)
+
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
 
         if self.params['gateway']:
@@ -188,9 +192,7 @@ class NATGatewayInfoModule(OTCModule):
             query['status'] = self.params['status']
 
         for raw in self.conn.nat.gateways(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
 
         self.exit(
             changed=False,
@@ -117,6 +117,12 @@ snat_rule:
             description: Specifies the status of the NAT gateway.
             type: str
             sample: "ACTIVE"
+polls:
+    description: Number of status polls done while waiting for the SNAT rule to
+        become ACTIVE or to be deleted.
+    returned: When a rule was created or deleted
+    type: int
+    sample: 7
 '''
 
 EXAMPLES = '''
@@ -156,6 +162,8 @@ class NatSnatModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('nat',)
+
     def _system_state_change(self, obj):
         state = self.params['state']
         if state == 'present':
@@ -219,7 +227,8 @@ class NatSnatModule(OTCModule):
                     if self.ansible.check_mode:
                         self.exit_json(changed=True)
                     self.conn.nat.delete_snat_rule(snat_rule.id)
-                    self.conn.nat.wait_for_delete_snat(snat_rule.id)
+                    self.waiter(180, 'nat_rule').wait_for_delete(
+                        self.conn.nat, snat_rule)
                     self.exit(changed=True)
                 else:
                     self.exit(
@@ -233,7 +242,8 @@ class NatSnatModule(OTCModule):
                     self.exit_json(changed=True)
                 if rule.id:
                     self.conn.nat.delete_snat_rule(rule.id)
-                    self.conn.nat.wait_for_delete_snat(snat_rule.id)
+                    self.waiter(180, 'nat_rule').wait_for_delete(
+                        self.conn.nat, rule)
                     changed = True
                     break
 
@@ -264,7 +274,8 @@ class NatSnatModule(OTCModule):
                     )
 
             snat_rule = self.conn.nat.create_snat_rule(**attrs)
-            snat_rule = self.conn.nat.wait_for_snat(snat_rule)
+            snat_rule = self.waiter(300, 'nat_rule').wait_for_status(
+                self.conn.nat, snat_rule, 'ACTIVE', ['INACTIVE'])
             self.exit(changed=True, snat_rule=snat_rule.to_dict())
 
         self.exit(changed=changed)
@@ -14,7 +14,9 @@ DOCUMENTATION = '''
 ---
 module: nat_snat_rule_info
 short_description: Get SNAT rule details
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.4"
 author: "Sebastian Gode (@SebastianGode)"
 description:
@@ -134,10 +136,10 @@ EXAMPLES = '''
   register: sn
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class SNATRuleInfoModule(OTCModule):
+class SNATRuleInfoModule(OTCInfoModule):
     argument_spec = dict(
         admin_state_up=dict(required=False, type='bool'),
         cidr=dict(required=False),
@@ -154,9 +156,11 @@ class SNATRuleInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('nat',)
+
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
 
         if self.params['rule']:
@@ -224,9 +228,7 @@ class SNATRuleInfoModule(OTCModule):
             query['status'] = self.params['status']
 
         for raw in self.conn.nat.snat_rules(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
 
         self.exit(
             changed=False,
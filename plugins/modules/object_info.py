@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: object_info
 short_description: Get Swift info.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.8.0"
 author: "Anton Sidelnikov (@anton-sidelnikov)"
 description:
@@ -28,6 +30,34 @@ options:
   object_name:
     description: Name of object in Swift.
     type: str
+  prefix:
+    description:
+      - List only objects whose names start with this prefix.
+    type: str
+  delimiter:
+    description:
+      - Group objects whose names contain this character after the
+        I(prefix) into pseudo directories, returned in I(subdirs) instead
+        of the objects.
+    type: str
+  marker:
+    description:
+      - List only objects whose names sort after this one, i.e. the
+        I(next_marker) of a previous call.
+    type: str
+  limit:
+    description:
+      - Number of objects requested per listing page. Defaults to the
+        maximum of the service.
+    type: int
+  max_items:
+    description:
+      - Stop listing after this number of objects and pseudo directories.
+        Pages are requested one after another, so no further page is
+        requested once it is reached.
+      - To write large listings to a file instead of the result use
+        I(output_file).
+    type: int
 requirements: ["openstacksdk", "otcextensions"]
 '''
 
@@ -95,6 +125,16 @@ swift:
           "transfer_encoding": null
         }
       ]
+    subdirs:
+      description: Pseudo directories of the container.
+        Shows when container and delimiter params are not Null
+      type: list
+      sample: ["photos/", "videos/"]
+    next_marker:
+      description: Marker to continue the listing with in a further call.
+        Shows when the listing stopped at max_items and more entries follow.
+      type: str
+      sample: "photos/2021/my.jpg"
     metadata:
       description: Specifies the object metadata.
         Shows when container and object_name params is not Null
@@ -143,24 +183,98 @@ EXAMPLES = '''
     container: my_container
   register: sw
 
+# Get the first 1000 objects below photos/, pseudo directories grouped
+- opentelekomcloud.cloud.object_info:
+    container: my_container
+    prefix: photos/
+    delimiter: /
+    max_items: 1000
+  register: sw
+
+# Continue with the next 1000 objects
+- opentelekomcloud.cloud.object_info:
+    container: my_container
+    prefix: photos/
+    delimiter: /
+    marker: "{{ sw.swift.next_marker }}"
+    max_items: 1000
+  when: sw.swift.next_marker is defined
+
 - opentelekomcloud.cloud.object_info:
     container: my_container
     object_name: my_object
   register: sw
 '''
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from urllib import parse
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class SwiftInfoModule(OTCModule):
+class SwiftInfoModule(OTCInfoModule):
     argument_spec = dict(
         container=dict(type='str', required=False),
         object_name=dict(type='str', required=False),
+        prefix=dict(type='str', required=False),
+        delimiter=dict(type='str', required=False),
+        marker=dict(type='str', required=False),
+        limit=dict(type='int', required=False),
+        max_items=dict(type='int', required=False),
     )
 
     module_kwargs = dict(
         supports_check_mode=True
     )
 
+    otce_services = ()
+
+    # Page size the service applies to listings without a limit
+    LISTING_LIMIT = 10000
+
+    def _list_objects(self, container):
+        """Yield the entries of a container listing page by page.
+
+        A page is only requested once the previous one was consumed, so the
+        listing ends early if the caller stops iterating. Entries are dicts
+        as returned by the service, pseudo directories have a `subdir` key.
+        `self.listing_truncated` tells afterwards whether the listing stopped
+        at `max_items` while more entries follow.
+        """
+        self.listing_truncated = False
+        params = dict(format='json')
+        for name in ('prefix', 'delimiter'):
+            if self.params[name]:
+                params[name] = self.params[name]
+        marker = self.params['marker']
+        limit = self.params['limit']
+        max_items = self.params['max_items']
+        yielded = 0
+        while max_items is None or yielded < max_items:
+            page_limit = min(limit or self.LISTING_LIMIT, self.LISTING_LIMIT)
+            remaining = None
+            if max_items is not None and max_items - yielded <= page_limit:
+                # Ask for one entry more than needed on the last page, it
+                # tells whether the listing continues without a further call
+                remaining = max_items - yielded
+                page_limit = min(remaining + 1, self.LISTING_LIMIT)
+            params['limit'] = page_limit
+            if marker:
+                params['marker'] = marker
+            response = self.conn.object_store.get(
+                parse.quote(container), params=params,
+                headers={'Accept': 'application/json'})
+            self.sdk.exceptions.raise_from_response(response)
+            page = response.json()
+            if remaining is not None and len(page) >= remaining:
+                self.listing_truncated = (
+                    len(page) > remaining or len(page) == page_limit)
+                page = page[:remaining]
+            for entry in page:
+                yield entry
+            yielded += len(page)
+            if len(page) < page_limit:
+                return
+            marker = page[-1].get('name', page[-1].get('subdir'))
+
     def run(self):
         container = self.params['container']
         object_name = self.params['object_name']
@@ -170,18 +284,28 @@ class SwiftInfoModule(OTCModule):
             self.exit(changed=False, swift=dict(metadata=metadata))
 
         if container:
-            objects = []
-            for raw in self.conn.object_store.objects(container):
-                dt = raw.to_dict()
-                dt.pop('location')
-                objects.append(dt)
-            self.exit(changed=False, swift=dict(objects=objects))
-
-        containers = []
+            from openstack.object_store.v1 import obj
+
+            objects = self.result_list()
+            subdirs = []
+            last = None
+            for entry in self._list_objects(container):
+                if 'subdir' in entry:
+                    subdirs.append(entry['subdir'])
+                    last = entry['subdir']
+                    continue
+                objects.add(obj.Object.existing(container=container, **entry))
+                last = entry['name']
+            swift = dict(objects=objects)
+            if self.params['delimiter']:
+                swift['subdirs'] = subdirs
+            if self.listing_truncated:
+                swift['next_marker'] = last
+            self.exit(changed=False, swift=swift)
+
+        containers = self.result_list()
         for raw in self.conn.object_store.containers():
-            dt = raw.to_dict()
-            dt.pop('location')
-            containers.append(dt)
+            containers.add(raw)
         self.exit(changed=False, swift=dict(containers=containers))
 
 
@@ -118,6 +118,12 @@ backup:
       description: Indicates the backup type.
       type: str
       sample: "manual"
+polls:
+  description: Number of status polls done while waiting for the backup to be
+    COMPLETED or deleted.
+  returned: When I(wait=true) and a backup was created or deleted
+  type: int
+  sample: 7
 '''
 
 EXAMPLES = '''
@@ -182,6 +188,7 @@ class RdsBackupModule(OTCModule):
     )
 
     otce_min_version = '0.7.1'
+    otce_services = ('rds',)
 
     def _system_state_change(self, obj):
         state = self.params['state']
@@ -192,19 +199,18 @@ class RdsBackupModule(OTCModule):
             return True
         return False
 
-    def _wait_for_delete(self, backup, instance, interval, wait):
+    def _wait_for_delete(self, backup, instance, wait):
         """Wait for backup to be deleted"""
-        orig_backup = backup
-        for count in self.sdk.utils.iterate_timeout(
-                timeout=wait,
-                message="Timeout waiting for backup to delete",
-                wait=interval):
-            backup = self.conn.rds.find_backup(name_or_id=backup.name,
-                                               instance=instance)
-            if backup.status.lower() == 'deleting':
-                return orig_backup
-            if backup is None:
+
+        def poll():
+            current = self.conn.rds.find_backup(name_or_id=backup.name,
+                                                instance=instance)
+            if current is None or current.status.lower() == 'deleting':
                 return backup
+            return None
+
+        return self.waiter(wait, 'rds_backup').wait(
+            poll, "Timeout waiting for backup to delete")
 
     def run(self):
         name = self.params['name']
@@ -236,8 +242,10 @@ class RdsBackupModule(OTCModule):
 
                     if self.params['wait']:
                         try:
-                            backup = self.conn.rds.wait_for_backup(backup,
-                                                                   wait=timeout)
+                            backup = self.waiter(
+                                timeout, 'rds_backup').wait_for_status(
+                                    self.conn.rds, backup, 'COMPLETED',
+                                    ['FAILED'])
                         except self.sdk.exceptions.ResourceTimeout:
                             self.fail(msg='Timeout failure waiting for backup '
                                           'with name %s to complete' % name)
@@ -263,7 +271,6 @@ class RdsBackupModule(OTCModule):
                             self._wait_for_delete(
                                 backup=backup,
                                 instance=instance,
-                                interval=10,
                                 wait=timeout
                             )
                         except self.sdk.exceptions.ResourceTimeout:
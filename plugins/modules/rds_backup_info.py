@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: rds_backup_info
 short_description: Get RDS Backup info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.3"
 author: "Irina Pereiaslavskaia (@irina-pereiaslavskaia)"
 description:
@@ -116,10 +118,10 @@ EXAMPLES = '''
   register: rds_backup
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class RdsBackupInfoModule(OTCModule):
+class RdsBackupInfoModule(OTCInfoModule):
     argument_spec = dict(
         instance=dict(type='str',
                       required=True),
@@ -133,13 +135,15 @@ class RdsBackupInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('rds',)
+
     def run(self):
 
         instance_filter = self.params['instance']
         backup_filter = self.params['backup']
         backup_type_filter = self.params['backup_type']
 
-        data = []
+        data = self.result_list()
         query = {}
         if instance_filter:
             instance = self.conn.rds.find_instance(name_or_id=instance_filter)
@@ -155,9 +159,7 @@ class RdsBackupInfoModule(OTCModule):
                       msg='RDS instance is missing')
 
         for raw in self.conn.rds.backups(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
 
         self.exit(
             changed=False,
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: rds_datastore_info
 short_description: Get supported RDS datastore versions
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.1"
 author: "Artem Goncharov (@gtema)"
 description:
@@ -57,10 +59,10 @@ EXAMPLES = '''
 '''
 
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class RdsDatastoreInfoModule(OTCModule):
+class RdsDatastoreInfoModule(OTCInfoModule):
     argument_spec = dict(
         name=dict(required=False),
         datastore=dict(choices=['mysql', 'postgresql', 'sqlserver'],
@@ -70,14 +72,14 @@ class RdsDatastoreInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('rds',)
+
     def run(self):
         datastore = self.params['datastore']
 
-        data = []
+        data = self.result_list()
         for raw in self.conn.rds.datastores(database_name=datastore):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
 
         self.exit_json(
             changed=False,
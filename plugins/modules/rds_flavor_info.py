@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: rds_flavor_info
 short_description: Get RDS flavor info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.1"
 author: "Artem Goncharov (@gtema)"
 description:
@@ -38,6 +40,30 @@ options:
       - Instance mode to filter results
     choices: [single, replica, ha]
     type: str
+  min_vcpus:
+    description:
+      - Return only flavors with at least this number of vCPUs.
+    type: int
+  min_ram:
+    description:
+      - Return only flavors with at least this amount of RAM in GB.
+    type: int
+  availability_zone:
+    description:
+      - Return only flavors available in this availability zone.
+    type: str
+  order_by:
+    description:
+      - Attributes to sort the flavors by, prefix an attribute with C(-)
+        to sort descending.
+    type: list
+    elements: str
+    choices: [vcpus, -vcpus, ram, -ram]
+  limit:
+    description:
+      - Return at most this number of flavors, the first ones according
+        to I(order_by).
+    type: int
 requirements: ["openstacksdk", "otcextensions"]
 '''
 
@@ -75,39 +101,69 @@ EXAMPLES = '''
     datastore: "postgresql"
     version: "10"
   register: rds_flavor_info
+
+# Get the smallest HA flavor with at least 4 vCPUs and 16 GB RAM in an AZ.
+- rds_flavor_info:
+    datastore: "postgresql"
+    version: "10"
+    instance_mode: "ha"
+    min_vcpus: 4
+    min_ram: 16
+    availability_zone: "eu-de-01"
+    order_by: [vcpus, ram]
+    limit: 1
+  register: rds_flavor
 '''
 
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class RdsFlavorModule(OTCModule):
+class RdsFlavorModule(OTCInfoModule):
     argument_spec = dict(
         name=dict(required=False),
         datastore=dict(choices=['mysql', 'postgresql', 'sqlserver']),
         version=dict(required=False),
-        instance_mode=dict(choices=['single', 'replica', 'ha'])
+        instance_mode=dict(choices=['single', 'replica', 'ha']),
+        min_vcpus=dict(type='int'),
+        min_ram=dict(type='int'),
+        availability_zone=dict(),
+        order_by=dict(type='list', elements='str',
+                      choices=['vcpus', '-vcpus', 'ram', '-ram']),
+        limit=dict(type='int'),
     )
     module_kwargs = dict(
         supports_check_mode=True
     )
 
+    otce_services = ('rds',)
+
     def run(self):
         datastore = self.params['datastore']
         version = self.params['version']
         instance_mode_filter = self.params['instance_mode']
 
-        data = []
-        for raw in self.conn.rds.flavors(datastore_name=datastore,
-                                         version_name=version):
-            if (instance_mode_filter
-                    and raw.instance_mode != instance_mode_filter):
-                # Skip result
-                continue
-            dt = raw.to_dict()
-            dt.pop('location')
-            dt.pop('id')
-            data.append(dt)
+        data = self.result_list()
+        catalog = self.catalog(
+            'rds.flavors.%s.%s' % (datastore, version),
+            lambda: self.conn.rds.flavors(datastore_name=datastore,
+                                          version_name=version))
+        query = {}
+        if instance_mode_filter:
+            query['instance_mode'] = instance_mode_filter
+        minimum = {}
+        if self.params['min_vcpus'] is not None:
+            minimum['vcpus'] = self.params['min_vcpus']
+        if self.params['min_ram'] is not None:
+            minimum['ram'] = self.params['min_ram']
+        flavors = catalog.select(
+            attrs=query, minimum=minimum,
+            available_in=self.params['availability_zone'],
+            order_by=self.params['order_by'], limit=self.params['limit'])
+        for flavor in flavors:
+            flavor = dict(flavor)
+            flavor.pop('id', None)
+            data.append(flavor)
 
         self.exit_json(
             changed=False,
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: rds_instance_info
 short_description: Get RDS Instance info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.2"
 author: "Artem Goncharov (@gtema)"
 description:
@@ -67,10 +69,10 @@ EXAMPLES = '''
   register: inst
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class RdsInstanceInfoModule(OTCModule):
+class RdsInstanceInfoModule(OTCInfoModule):
     argument_spec = dict(
         datastore_type=dict(type='str',
                             choices=['postgresql', 'mysql', 'sqlserver']),
@@ -83,9 +85,11 @@ class RdsInstanceInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('rds',)
+
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
         ds_t = self.params['datastore_type']
         inst_type = self.params['instance_type']
@@ -131,10 +135,16 @@ class RdsInstanceInfoModule(OTCModule):
                     rds_instances=[],
                     message=('No router with name or id %s found' %
                              self.params['router']))
+        if self.params['count_only']:
+            from otcextensions.sdk.rds.v3 import instance
+            total = self.api_total(
+                self.conn.rds, instance.Instance, 'total_count', **query)
+            if total is not None:
+                data.count = total
+                self.exit(changed=False, rds_instances=data)
+
         for raw in self.conn.rds.instances(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
 
         self.exit(
             changed=False,
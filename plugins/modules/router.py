@@ -216,11 +216,76 @@ class RouterModule(OTCModule):
         project=dict(default=None)
     )
 
+    otce_services = ()
+
+    def __init__(self):
+        super().__init__()
+        # Port listings per network, filled lazily
+        self._ports_by_ip = {}
+
+    def _network_ports(self, network_id):
+        """Return ports of a network indexed by fixed IP address.
+
+        Every network is listed only once per run.
+        """
+        if network_id not in self._ports_by_ip:
+            by_ip = {}
+            for port in self.conn.list_ports(
+                    filters={'network_id': network_id}):
+                self._add_port(port, by_ip)
+            self._ports_by_ip[network_id] = by_ip
+        return self._ports_by_ip[network_id]
+
+    def _add_port(self, port, by_ip):
+        for fixed_ip in port.get('fixed_ips') or []:
+            by_ip[fixed_ip['ip_address']] = port
+
     def _router_internal_interfaces(self, router):
         for port in self.conn.list_router_interfaces(router, 'internal'):
             if port['device_owner'] in ROUTER_INTERFACE_OWNERS:
                 yield port
 
+    def _interface_diff(self, router, internal_subnet_ids, internal_port_ids):
+        """Compare the internal interfaces of a router with the wanted ones.
+
+        Returns:
+            tuple -- Port ids to detach, subnet ids and port ids to attach.
+        """
+        wanted_subnets = set(internal_subnet_ids)
+        wanted_ports = set(internal_port_ids)
+        attached_subnets = set()
+        attached_ports = set()
+        remove_port_ids = []
+        for port in self._router_internal_interfaces(router):
+            subnet_ids = set(
+                fixed_ip['subnet_id'] for fixed_ip in port.get('fixed_ips') or [])
+            if port['id'] in wanted_ports:
+                attached_ports.add(port['id'])
+            elif subnet_ids & wanted_subnets:
+                attached_subnets |= subnet_ids & wanted_subnets
+            else:
+                remove_port_ids.append(port['id'])
+        add_subnet_ids = [s_id for s_id in internal_subnet_ids
+                          if s_id not in attached_subnets]
+        add_port_ids = [p_id for p_id in internal_port_ids
+                        if p_id not in attached_ports]
+        return remove_port_ids, add_subnet_ids, add_port_ids
+
+    def _update_interfaces(self, router, remove_port_ids, add_subnet_ids,
+                           add_port_ids):
+        """Detach and then attach interfaces one after another.
+
+        Neutron serializes updates of a router, so they are not sent
+        concurrently. Interfaces are detached first, a subnet can only be
+        attached to a router once.
+        """
+        for port_id in remove_port_ids:
+            self.conn.remove_router_interface(router, port_id=port_id)
+        for subnet_id in add_subnet_ids:
+            self.conn.add_router_interface(router, subnet_id=subnet_id)
+        for port_id in add_port_ids:
+            self.conn.add_router_interface(router, port_id=port_id)
+
     def _needs_update(self, router, network, internal_subnet_ids, internal_port_ids, filters=None):
         """Decide if the given router needs an update.
         """
@@ -265,21 +330,8 @@ class RouterModule(OTCModule):
 
         # check internal interfaces
         if self.params['interfaces']:
-            existing_subnet_ids = []
-            for port in self._router_internal_interfaces(router):
-                if 'fixed_ips' in port:
-                    for fixed_ip in port['fixed_ips']:
-                        existing_subnet_ids.append(fixed_ip['subnet_id'])
-
-            for iface in self.params['interfaces']:
-                if isinstance(iface, dict):
-                    for p_id in internal_port_ids:
-                        p = self.conn.get_port(name_or_id=p_id)
-                        if 'fixed_ips' in p:
-                            for fip in p['fixed_ips']:
-                                internal_subnet_ids.append(fip['subnet_id'])
-
-            if set(internal_subnet_ids) != set(existing_subnet_ids):
+            if any(self._interface_diff(
+                    router, internal_subnet_ids, internal_port_ids)):
                 return True
 
         return False
@@ -326,7 +378,6 @@ class RouterModule(OTCModule):
         external_subnet_ids = []
         internal_subnet_ids = []
         internal_port_ids = []
-        existing_port_ips = []
         # if self.params['external_fixed_ips']:
         #     for iface in self.params['external_fixed_ips']:
         #         subnet = self.conn.get_subnet(iface['subnet'])
@@ -353,12 +404,11 @@ class RouterModule(OTCModule):
                     elif not iface['portip']:
                         self.fail(msg='put an ip in portip or  remove it from list to assign default port to router')
                     else:
-                        for existing_port in self.conn.list_ports(filters={'network_id': net.id}):
-                            for fixed_ip in existing_port['fixed_ips']:
-                                if iface['portip'] == fixed_ip['ip_address']:
-                                    internal_port_ids.append(existing_port.id)
-                                    existing_port_ips.append(fixed_ip['ip_address'])
-                        if iface['portip'] not in existing_port_ips:
+                        ports_by_ip = self._network_ports(net.id)
+                        existing_port = ports_by_ip.get(iface['portip'])
+                        if existing_port:
+                            internal_port_ids.append(existing_port['id'])
+                        else:
                             p = self.conn.create_port(network_id=net.id, fixed_ips=[
                                 {
                                     'ip_address': iface['portip'],
@@ -366,6 +416,7 @@ class RouterModule(OTCModule):
                                 }
                             ])
                             if p:
+                                self._add_port(p, ports_by_ip)
                                 internal_port_ids.append(p.id)
 
         return external_subnet_ids, internal_subnet_ids, internal_port_ids
@@ -413,11 +464,9 @@ class RouterModule(OTCModule):
                 if project_id:
                     kwargs['project_id'] = project_id
                 router = self.conn.create_router(**kwargs)
-                for int_s_id in subnet_internal_ids:
-                    self.conn.add_router_interface(router, subnet_id=int_s_id)
-                # add interface by port id as well
-                for int_p_id in internal_portids:
-                    self.conn.add_router_interface(router, port_id=int_p_id)
+                self.invalidate_resolved('router', 'vpc')
+                self._update_interfaces(
+                    router, [], subnet_internal_ids, internal_portids)
                 changed = True
             else:
                 if self._needs_update(router, net, subnet_internal_ids, internal_portids, filters):
@@ -426,25 +475,17 @@ class RouterModule(OTCModule):
 
                     # Protect against update_router() not actually
                     # updating the router.
-                    if not updated_router:
-                        changed = False
+                    changed = bool(updated_router)
 
-                    # On a router update, if any internal interfaces were supplied,
-                    # just detach all existing internal interfaces and attach the new.
+                    # On a router update, only attach missing and detach
+                    # obsolete internal interfaces, unchanged ones are kept.
                     if internal_portids or subnet_internal_ids:
                         router = updated_router
-                        ports = self._router_internal_interfaces(router)
-                        for port in ports:
-                            self.conn.remove_router_interface(router, port_id=port['id'])
-                    if internal_portids:
-                        external_ids, subnet_internal_ids, internal_portids = self._validate_subnets(filters)
-                        for int_p_id in internal_portids:
-                            self.conn.add_router_interface(router, port_id=int_p_id)
-                        changed = True
-                    if subnet_internal_ids:
-                        for s_id in subnet_internal_ids:
-                            self.conn.add_router_interface(router, subnet_id=s_id)
-                        changed = True
+                        diff = self._interface_diff(
+                            router, subnet_internal_ids, internal_portids)
+                        if any(diff):
+                            self._update_interfaces(router, *diff)
+                            changed = True
 
             self.exit(changed=changed, router=router, id=router['id'])
 
@@ -454,11 +495,12 @@ class RouterModule(OTCModule):
             else:
                 # We need to detach all internal interfaces on a router before
                 # we will be allowed to delete it.
-                ports = self._router_internal_interfaces(router)
-                router_id = router['id']
-                for port in ports:
-                    self.conn.remove_router_interface(router, port_id=port['id'])
-                self.conn.delete_router(router_id)
+                self._update_interfaces(
+                    router,
+                    [port['id'] for port in self._router_internal_interfaces(router)],
+                    [], [])
+                self.conn.delete_router(router['id'])
+                self.invalidate_resolved('router', 'vpc')
                 self.exit_json(changed=True)
 
 
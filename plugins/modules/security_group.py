@@ -48,11 +48,16 @@ options:
      elements: dict
      description:
        - list of security group rules
+       - Only rules missing in the group are created, all of them with a
+         single request.
+       - Rules are compared by direction, ethertype, protocol, port range
+         and remote prefix or group.
    exclusive:
      type: bool
      default: false
      description:
-       - Deletes existing rules if true
+       - Deletes existing rules which are not part of
+         I(security_group_rules) if true
 requirements:
     - "python >= 3.6"
     - "openstacksdk"
@@ -102,6 +107,8 @@ EXAMPLES = '''
         "protocol": "icmp"
 '''
 
+import ipaddress
+
 from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
 
 
@@ -116,6 +123,111 @@ class SecurityGroupModule(OTCModule):
         exclusive=dict(type='bool', default=False)
     )
 
+    otce_services = ()
+
+    # Attributes identifying a rule, with the defaults neutron applies
+    rule_key_attributes = (
+        ('direction', 'ingress'),
+        ('ethertype', 'IPv4'),
+        ('protocol', None),
+        ('port_range_min', None),
+        ('port_range_max', None),
+        ('remote_ip_prefix', None),
+        ('remote_group_id', None),
+        ('remote_address_group_id', None),
+    )
+
+    @staticmethod
+    def _normalize_prefix(prefix):
+        """Return a prefix the way neutron reports it.
+
+        Host bits are dropped and a prefix matching any address is treated
+        like an unset one.
+        """
+        try:
+            network = ipaddress.ip_network(str(prefix), strict=False)
+        except ValueError:
+            return prefix
+        if network.prefixlen == 0:
+            return None
+        return str(network)
+
+    def _rule_key(self, rule):
+        """Build a comparable key of a desired or existing rule."""
+        key = []
+        for attr, default in self.rule_key_attributes:
+            value = rule.get(attr)
+            if value is None and attr == 'ethertype':
+                # Named ether_type on SDK resources
+                value = rule.get('ether_type')
+            if value is None:
+                value = default
+            if attr.startswith('port_range') and value is not None:
+                try:
+                    value = int(value)
+                except (TypeError, ValueError):
+                    self.fail_json(
+                        msg='Invalid %s %r in security group rule'
+                            % (attr, value))
+                if value == -1:
+                    # Nova style "any port", neutron stores None
+                    value = None
+            elif attr == 'remote_ip_prefix' and value is not None:
+                value = self._normalize_prefix(value)
+            elif attr == 'protocol' and value is not None:
+                value = str(value).lower()
+                if value == 'any':
+                    value = None
+            key.append(value)
+        return tuple(key)
+
+    def _reconcile_rules(self, secgroup, security_group_rules, exclusive):
+        """Create missing and, if exclusive, delete obsolete rules.
+
+        Returns:
+            tuple -- Whether rules changed and the rules of the group.
+        """
+        desired = {}
+        for rule in security_group_rules or []:
+            desired.setdefault(self._rule_key(rule), rule)
+
+        kept = []
+        obsolete = []
+        for rule in self.conn.network.security_group_rules(
+                security_group_id=secgroup.id):
+            key = self._rule_key(rule)
+            if key in desired:
+                desired.pop(key)
+                kept.append(rule)
+            elif exclusive:
+                obsolete.append(rule)
+            else:
+                kept.append(rule)
+
+        for rule in obsolete:
+            self.conn.network.delete_security_group_rule(
+                security_group_rule=rule.id)
+
+        created = []
+        if desired:
+            data = []
+            for key in desired:
+                attrs = dict(
+                    (attr, value) for (attr, _), value
+                    in zip(self.rule_key_attributes, key)
+                    if value is not None)
+                if desired[key].get('description'):
+                    attrs['description'] = desired[key]['description']
+                if desired[key].get('project_id'):
+                    # Sent as tenant_id like create_security_group_rule does
+                    attrs['tenant_id'] = desired[key]['project_id']
+                attrs['security_group_id'] = secgroup.id
+                data.append(attrs)
+            created = list(
+                self.conn.network.create_security_group_rules(data))
+
+        return bool(obsolete or created), kept + created
+
     def _needs_update(self, secgroup):
         """Check for differences in the updatable values.
 
@@ -160,7 +272,6 @@ class SecurityGroupModule(OTCModule):
             filters = None
 
         secgroup = self.conn.get_security_group(name, filters=filters)
-        sg_rules = None
 
         if self.ansible.check_mode:
             self.exit(changed=self._system_state_change(secgroup))
@@ -173,6 +284,7 @@ class SecurityGroupModule(OTCModule):
                     kwargs['project_id'] = project_id
                 secgroup = self.conn.create_security_group(name, description,
                                                            **kwargs)
+                self.invalidate_resolved('security_group')
                 changed = True
             else:
                 if self._needs_update(secgroup):
@@ -180,26 +292,13 @@ class SecurityGroupModule(OTCModule):
                         secgroup['id'], description=description)
                     changed = True
 
-            if exclusive:
-                # delete security group rules if any exists
-                sg_rules = self.conn.network.security_group_rules(
-                    security_group_id=secgroup.id)
-                if sg_rules:
-                    for rule in sg_rules:
-                        self.conn.network.delete_security_group_rule(
-                            security_group_rule=rule.id)
-
-            if security_group_rules is not None:
-                # create rules
-                for rule in security_group_rules:
-                    self.conn.create_security_group_rule(name, **rule)
-                sg_rules = self.conn.network.security_group_rules(
-                    security_group_id=secgroup.id)
-                # prepare sg rules data
-                for raw in sg_rules:
-                    dt = raw.to_dict()
-                    data.append(dt)
-                changed = True
+            if exclusive or security_group_rules is not None:
+                rules_changed, sg_rules = self._reconcile_rules(
+                    secgroup, security_group_rules, exclusive)
+                changed = changed or rules_changed
+                if security_group_rules is not None:
+                    # prepare sg rules data
+                    data = [raw.to_dict() for raw in sg_rules]
 
             self.exit(
                 changed=changed, id=secgroup['id'],
@@ -209,6 +308,7 @@ class SecurityGroupModule(OTCModule):
         if state == 'absent':
             if secgroup:
                 self.conn.delete_security_group(secgroup['id'])
+                self.invalidate_resolved('security_group')
                 changed = True
             self.exit(changed=changed)
 
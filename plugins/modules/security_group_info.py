@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: security_group_info
 short_description: Lists security groups
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.1.2"
 author: "Tino Schreiber (@tischrei)"
 description:
@@ -109,10 +111,10 @@ EXAMPLES = '''
   register: sg
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class SecurityGroupInfoModule(OTCModule):
+class SecurityGroupInfoModule(OTCInfoModule):
     argument_spec = dict(
         description=dict(required=False),
         name=dict(required=False),
@@ -122,9 +124,11 @@ class SecurityGroupInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ()
+
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
 
         if self.params['name']:
@@ -147,9 +151,7 @@ class SecurityGroupInfoModule(OTCModule):
             query['project_id'] = self.params['project_id']
 
         for raw in self.conn.network.security_groups(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
 
         self.exit(
             changed=False,
@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: server_group_info
 short_description: Lists server groups
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.5.0"
 author: "Tino Schreiber (@tischrei)"
 description:
@@ -70,23 +72,23 @@ EXAMPLES = '''
   register: server_groups
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class ServerGroupInfoModule(OTCModule):
+class ServerGroupInfoModule(OTCInfoModule):
     argument_spec = {}
     module_kwargs = dict(
         supports_check_mode=True
     )
 
+    otce_services = ()
+
     def run(self):
 
-        data = []
+        data = self.result_list()
 
         for raw in self.conn.compute.server_groups():
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
 
         self.exit(
             changed=False,
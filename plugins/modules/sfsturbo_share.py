@@ -116,6 +116,12 @@ share:
       status:
         description: Specifies the status of the SFS Turbo file system.
         type: str
+polls:
+    description: Number of status polls done while waiting for the share to be
+        created, extended or to apply the security group.
+    returned: When the share was created or changed
+    type: int
+    sample: 7
 '''
 
 EXAMPLES = '''
@@ -159,19 +165,16 @@ class StateMachineShare(StateMachine):
 
     def _create(self, attributes, timeout, wait, **kwargs):
         resource = self.create_function(**attributes)
-        wait_function = getattr(self.session, 'wait_for_share')
         if wait:
-            resource = wait_function(resource)
+            resource = self.waiter(
+                timeout, 'sfsturbo_share').wait_for_status(
+                    self.session, resource, '200', ['300', '303'])
         return resource
 
     def _update(self, resource, timeout, update, wait, **kwargs):
         resource_attributes = update.get('resource_attributes')
         extend_capacity = getattr(self.session, 'extend_capacity')
         change_security_group = getattr(self.session, 'change_security_group')
-        wait_extend_capacity = getattr(
-            self.session, 'wait_for_extend_capacity')
-        wait_change_sec_group = getattr(
-            self.session, 'wait_for_change_security_group')
         if resource_attributes.get('size'):
             if resource_attributes.get('size') != int(float(
                     resource.avail_capacity)) and \
@@ -179,11 +182,14 @@ class StateMachineShare(StateMachine):
                     resource.avail_capacity)):
                 resource = extend_capacity(resource,
                                            resource_attributes['size'])
-                wait_extend_capacity(resource, wait=timeout)
+                self.waiter(timeout, 'sfsturbo_share').wait_for_status(
+                    self.session, resource, '221', ['321'],
+                    attribute='sub_status')
         if resource_attributes.get('security_group_id'):
             resource = change_security_group(
                 resource, resource_attributes['security_group_id'])
-            wait_change_sec_group(resource, wait=timeout)
+            self.waiter(timeout, 'sfsturbo_share').wait_for_status(
+                self.session, resource, '232', attribute='sub_status')
         return resource
 
     def _build_update(self, resource, attributes, updateable_attributes,
@@ -234,11 +240,14 @@ class SfsTurboShareModule(OTCModule):
         supports_check_mode=True,
     )
 
+    otce_services = ('sfsturbo',)
+
     def run(self):
         sm = StateMachineShare(connection=self.conn,
                                service_name='sfsturbo',
                                type_name='share',
-                               sdk=self.sdk)
+                               sdk=self.sdk,
+                               waiter=self.waiter)
         kwargs = dict((k, self.params[k])
                       for k in ['state', 'timeout']
                       if self.params[k] is not None)
@@ -201,6 +201,12 @@ subnet:
                     "opt_name": "ntp"
                 }
             ]
+polls:
+    description: Number of status polls done while waiting for the VPC to be OK
+        and the subnet to become ACTIVE, or for the subnet to be deleted.
+    returned: When the subnet was created, updated or deleted
+    type: int
+    sample: 7
 '''
 
 import copy
@@ -231,6 +237,8 @@ class SubnetModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('vpc',)
+
     _update_fields = {'dns_list', 'primary_dns', 'secondary_dns', 'extra_dhcp_opts'}
     _update_forbidden = {'cidr', 'gateway_ip'}
 
@@ -249,12 +257,11 @@ class SubnetModule(OTCModule):
 
         if state == 'present':
             if subnet is None:
-                self.sdk.resource.wait_for_status(
-                    self.conn.vpc,
-                    vpc, 'OK',
-                    None, 1, 5
-                )
+                self.waiter(5, 'vpc').wait_for_status(
+                    self.conn.vpc, vpc, 'OK')
                 subnet = self.conn.vpc.create_subnet(**data)
+                # A VPC subnet is a network as well
+                self.invalidate_resolved('subnet', 'network')
             elif has_changes:
                 err_fields = {}
                 for field in self._update_forbidden:
@@ -274,16 +281,15 @@ class SubnetModule(OTCModule):
                     name=subnet.name,
                     **update_data,
                 )
-            subnet = self.sdk.resource.wait_for_status(
-                self.conn.vpc,
-                subnet, 'ACTIVE',
-                None, 2, 20
-            )
+            subnet = self.waiter(20, 'subnet').wait_for_status(
+                self.conn.vpc, subnet, 'ACTIVE')
             self.exit(changed=has_changes, subnet=subnet)
         elif state == 'absent':
             if subnet:
                 self.conn.vpc.delete_subnet(subnet, ignore_missing=True)
-                self.sdk.resource.wait_for_delete(self.conn.vpc, subnet, 2, 60)
+                self.invalidate_resolved('subnet', 'network')
+                self.waiter(60, 'subnet').wait_for_delete(
+                    self.conn.vpc, subnet)
             self.exit(changed=has_changes)
 
     def _changed(self, state, expected):
@@ -317,24 +323,12 @@ class SubnetModule(OTCModule):
         name = self.params['name']
         vpc_id = self.params['vpc']
 
-        try:
-            # first, try to find subnet by ID
-            return self.conn.vpc.get_subnet(name)
-        except (self.sdk.exceptions.ResourceNotFound,
-                # in case id is not a UUID (e.g. us subnet name):
-                self.sdk.exceptions.BadRequestException):
-            subnets = self.conn.vpc.subnets(vpc_id=vpc_id)
-            subnets = [s for s in subnets if s.name == name and s.vpc_id == vpc_id]
-            if len(subnets) == 0:
-                return None
-            if len(subnets) > 1:
-                self.fail(
-                    msg=(
-                        f'More than one subnet with name {name} is found '
-                        f'in vpc {vpc_id}. Please use ID instead.'
-                    )
-                )
-            return subnets[0]
+        # The subnet API filters by VPC only, names are matched locally
+        return self.find_by_name_or_id(
+            self.conn.vpc.get_subnet,
+            lambda name: self.conn.vpc.subnets(vpc_id=vpc_id),
+            name, kind='subnet',
+            match=lambda subnet: subnet.vpc_id == vpc_id)
 
 
 def _total_dns_list(obj: dict) -> set:
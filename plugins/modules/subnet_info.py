@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: subnet_info
 short_description: Get subnet info from OpenTelekomCloud
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.11.1"
 author: "Polina Gubina(@polina-gubina)"
 description:
@@ -99,10 +101,10 @@ EXAMPLES = '''
   register: subnet_info
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class SubnetInfoModule(OTCModule):
+class SubnetInfoModule(OTCInfoModule):
     argument_spec = dict(
         name_or_id=dict(required=False),
         vpc=dict(required=False)
@@ -112,23 +114,21 @@ class SubnetInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('vpc',)
+
     def run(self):
-        data = []
+        data = self.result_list()
 
         if self.params['name_or_id']:
             raw = self.conn.vpc.find_subnet(name_or_id=self.params['name_or_id'])
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
         else:
             query = {}
             if self.params['vpc']:
                 vpc = self.conn.vpc.find_vpc(name_or_id=self.params['vpc'])
                 query['vpc_id'] = vpc.id
             for raw in self.conn.vpc.subnets(**query):
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.add(raw)
 
         self.exit_json(
             changed=False,
@@ -155,12 +155,8 @@ class SwrDomainMachine(StateMachine):
         if resource_attributes:
             resource = self.update_function(**resource_attributes)
         if wait:
-            resource = self.sdk.resource.wait_for_status(self.session,
-                                                         resource,
-                                                         status='active',
-                                                         failures=['error'],
-                                                         wait=timeout,
-                                                         attribute='status')
+            resource = self.waiter(timeout, 'swr').wait_for_status(
+                self.session, resource, 'active', ['error'])
 
         return resource
 
@@ -204,6 +200,8 @@ class SwrDomainModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('swr',)
+
     def run(self):
         service_name = "swr"
         type_name = "domain"
@@ -224,7 +222,8 @@ class SwrDomainModule(OTCModule):
                               sdk=self.sdk,
                               service_name=service_name,
                               type_name=type_name,
-                              crud_functions=crud)
+                              crud_functions=crud,
+                              waiter=self.waiter)
         kwargs = {'state': self.params['state'],
                   'attributes': dict((k, self.params[k]) for k in
                                      ['namespace', 'repository', 'access_domain', 'permit', 'deadline', 'description']
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: swr_domain_info
 short_description: Get SWR domain info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.14.2"
 author: "Ziukina Valeriia (@RusselSand)"
 description:
@@ -103,10 +105,10 @@ EXAMPLES = '''
   register: swr_domain_info
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class SwrOrganisationInfoModule(OTCModule):
+class SwrOrganisationInfoModule(OTCInfoModule):
     argument_spec = dict(
         namespace=dict(required=True),
         repository=dict(required=True),
@@ -116,6 +118,8 @@ class SwrOrganisationInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('swr',)
+
     def run(self):
         if self.params['domain']:
             domains = self.conn.swr.get_domain(self.params['namespace'],
@@ -119,6 +119,8 @@ class SwrOrganizationModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('swr',)
+
     def run(self):
         service_name = "swr"
         type_name = "organization"
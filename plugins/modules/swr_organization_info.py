@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: swr_organization_info
 short_description: Get SWR organisations info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.14.2"
 author: "Ziukina Valeriia (@RusselSand)"
 description:
@@ -59,10 +61,10 @@ EXAMPLES = '''
   register: swr_organization_info
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class SwrOrganisationInfoModule(OTCModule):
+class SwrOrganisationInfoModule(OTCInfoModule):
     argument_spec = dict(
         namespace=dict(required=False)
     )
@@ -70,6 +72,8 @@ class SwrOrganisationInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('swr',)
+
     def run(self):
         if self.params['namespace']:
             orgs = self.conn.swr.get_organization(self.params['namespace'])
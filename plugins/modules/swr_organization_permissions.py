@@ -112,24 +112,17 @@ class SwrOrgPermissionMachine(StateMachine):
     def _update(self, attributes, timeout, wait, **kwargs):
         resource = self.update_function(**attributes)
         if wait:
-            resource = self.sdk.resource.wait_for_status(self.session,
-                                                         resource,
-                                                         status='active',
-                                                         failures=['error'],
-                                                         wait=timeout,
-                                                         attribute='status')
+            resource = self.waiter(timeout, 'swr').wait_for_status(
+                self.session, resource, 'active', ['error'])
         return resource
 
     def _delete(self, resource, attributes, timeout, wait, **kwargs):
         self.delete_function(namespace=attributes['namespace'],
                              user_ids=[attributes['permissions'][0]['user_id']])
         if wait:
-            for count in self.sdk.utils.iterate_timeout(
-                    timeout=timeout,
-                    message="Timeout waiting for resource to be absent"
-            ):
-                if self._find(attributes) is None:
-                    break
+            self.waiter(timeout, 'swr').wait(
+                lambda: True if self._find(attributes) is None else None,
+                "Timeout waiting for resource to be absent")
 
     def _find(self, attributes, **kwargs):
         permissions = self.list_function(
@@ -166,6 +159,8 @@ class SwrRepoPermissionModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('swr',)
+
     def run(self):
         service_name = "swr"
         type_name = "organization_permissions"
@@ -186,7 +181,8 @@ class SwrRepoPermissionModule(OTCModule):
                                      sdk=self.sdk,
                                      service_name=service_name,
                                      type_name=type_name,
-                                     crud_functions=crud)
+                                     crud_functions=crud,
+                                     waiter=self.waiter)
         kwargs = {'state': self.params['state'],
                   'attributes': dict((k, self.params[k]) for k in
                                      ['namespace']
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: swr_organization_permissions_info
 short_description: Get SWR organization permissions info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.14.2"
 author: "Ziukina Valeriia (@RusselSand)"
 description:
@@ -63,10 +65,10 @@ EXAMPLES = '''
   register: swr_organization_permissions
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class SwrOrgPermissionInfoModule(OTCModule):
+class SwrOrgPermissionInfoModule(OTCInfoModule):
     argument_spec = dict(
         namespace=dict(required=True),
         user_name=dict(required=False)
@@ -75,6 +77,8 @@ class SwrOrgPermissionInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('swr',)
+
     def run(self):
         permissions = self.conn.swr.organization_permissions(namespace=self.params['namespace'])
         all_auth = list()
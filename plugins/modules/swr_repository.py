@@ -117,24 +117,17 @@ class SwrRepositoryMachine(StateMachine):
         self.delete_function(attributes['namespace'], attributes['repository'])
 
         if wait:
-            for count in self.sdk.utils.iterate_timeout(
-                    timeout=timeout,
-                    message="Timeout waiting for resource to be absent"
-            ):
-                if self._find(attributes) is None:
-                    break
+            self.waiter(timeout, 'swr').wait(
+                lambda: True if self._find(attributes) is None else None,
+                "Timeout waiting for resource to be absent")
 
     def _update(self, resource, timeout, update, wait, **kwargs):
         resource_attributes = update.get('resource_attributes')
         if resource_attributes:
             resource = self.update_function(**resource_attributes)
         if wait:
-            resource = self.sdk.resource.wait_for_status(self.session,
-                                                         resource,
-                                                         status='active',
-                                                         failures=['error'],
-                                                         wait=timeout,
-                                                         attribute='status')
+            resource = self.waiter(timeout, 'swr').wait_for_status(
+                self.session, resource, 'active', ['error'])
 
         return resource
 
@@ -162,6 +155,8 @@ class SwrRepositoryModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('swr',)
+
     def run(self):
         service_name = "swr"
         type_name = "repository"
@@ -182,7 +177,8 @@ class SwrRepositoryModule(OTCModule):
                                   sdk=self.sdk,
                                   service_name=service_name,
                                   type_name=type_name,
-                                  crud_functions=crud)
+                                  crud_functions=crud,
+                                  waiter=self.waiter)
         kwargs = {'state': self.params['state'],
                   'attributes': dict((k, self.params[k]) for k in
                                      ['namespace', 'repository', 'category', 'is_public', 'description']
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: swr_repository_info
 short_description: Get SWR repositories info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.14.2"
 author: "Ziukina Valeriia (@RusselSand)"
 description:
@@ -160,10 +162,10 @@ EXAMPLES = '''
   register: swr_repository_info
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class SwrRepositoryInfoModule(OTCModule):
+class SwrRepositoryInfoModule(OTCInfoModule):
     argument_spec = dict(
         namespace=dict(required=False),
         repository=dict(required=False),
@@ -179,6 +181,8 @@ class SwrRepositoryInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('swr',)
+
     def run(self):
         if self.params['namespace'] and self.params['repository']:
             repos = self.conn.swr.get_repository(
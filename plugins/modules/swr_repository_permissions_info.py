@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: swr_repository_permissions_info
 short_description: Get SWR repository permissions info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.14.2"
 author: "Ziukina Valeriia (@RusselSand)"
 description:
@@ -72,10 +74,10 @@ EXAMPLES = '''
   register: swr_repository_permissions
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class SwrRepoPermissionInfoModule(OTCModule):
+class SwrRepoPermissionInfoModule(OTCInfoModule):
     argument_spec = dict(
         namespace=dict(required=True),
         repository=dict(required=True),
@@ -85,6 +87,8 @@ class SwrRepoPermissionInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('swr',)
+
     def run(self):
         permissions = self.conn.swr.repository_permissions(namespace=self.params['namespace'],
                                                            repository=self.params['repository'])
@@ -77,10 +77,36 @@ options:
      choices: [replace, set]
      default: replace
      type: str
+   resources:
+     description:
+       - List of resources to tag in one run, instead of a single resource.
+       - Resources are resolved with one listing per resource type and
+         updated concurrently.
+     type: list
+     elements: dict
+     suboptions:
+       type:
+         description:
+           - Type of the resource.
+         choices: [server, floating_ip, network, port, router,
+                   security_group, security_group_rule, subnet, trunk]
+         type: str
+         required: true
+       name_or_id:
+         description:
+           - Name or id of the resource.
+         type: str
+         required: true
+   parallelism:
+     description:
+       - Maximum number of resources updated at the same time when
+         C(resources) is used.
+     default: 4
+     type: int
 notes:
     - One and only one of C(server), C(floating_ip), C(network), C(port),
       C(router), C(security_group), C(security_group_rule), C(subnet),
-      C(trunk) should be set.
+      C(trunk), C(resources) should be set.
 requirements:
     - "python >= 2.7"
     - "openstacksdk"
@@ -125,18 +151,78 @@ EXAMPLES = '''
     state: present
     tags:
       - new_tag1
+
+- name: ensure a tag on many ports and a network at once
+  opentelekomcloud.cloud.tag:
+    resources:
+      - type: port
+        name_or_id: port1
+      - type: port
+        name_or_id: port2
+      - type: network
+        name_or_id: "{{ network_name }}"
+    mode: set
+    tags:
+      - new_tag
 '''
 
 RETURN = '''
 tags:
     description: Present tags on the instance.
-    returned: success
+    returned: success and C(resources) is not set
     type: list
     sample: ["tag1", "tag2"]
+resources:
+    description: Result for every resource given in C(resources).
+    returned: success and C(resources) is set
+    type: complex
+    contains:
+        type:
+            description: Type of the resource.
+            type: str
+            sample: port
+        name_or_id:
+            description: Name or id the resource was given with.
+            type: str
+            sample: port1
+        id:
+            description: Id of the resource.
+            type: str
+            sample: 0f4e9b5a-6a4b-4d8a-9cbe-1f7a5b0b2a43
+        changed:
+            description: Whether the tags of the resource were changed.
+            type: bool
+            sample: true
+        tags:
+            description: Tags of the resource after the run.
+            type: list
+            sample: ["tag1", "tag2"]
+api_calls:
+    description: Number of API requests done by the run.
+    returned: success and C(resources) is set
+    type: int
+    sample: 4
 '''
 
+import concurrent.futures
+
 from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
 
+# Resource type -> (service, list function, url prefix, microversion)
+RESOURCE_TYPES = {
+    'server': ('compute', 'servers', '/servers', '2.26'),
+    'floating_ip': ('network', 'ips', '/floatingips', None),
+    'network': ('network', 'networks', '/networks', None),
+    'port': ('network', 'ports', '/ports', None),
+    'router': ('network', 'routers', '/routers', None),
+    'security_group': (
+        'network', 'security_groups', '/security-groups', None),
+    'security_group_rule': (
+        'network', 'security_group_rules', '/security-group-rules', None),
+    'subnet': ('network', 'subnets', '/subnets', None),
+    'trunk': ('network', 'trunks', '/trunks', None),
+}
+
 
 class TagModule(OTCModule):
 
@@ -152,12 +238,26 @@ class TagModule(OTCModule):
         trunk=dict(default=None),
         state=dict(default='present', choices=['absent', 'present']),
         tags=dict(default=[], elements='str', type='list'),
-        mode=dict(default='replace', choices=['replace', 'set'])
+        mode=dict(default='replace', choices=['replace', 'set']),
+        resources=dict(
+            type='list', elements='dict',
+            options=dict(
+                type=dict(required=True, choices=list(RESOURCE_TYPES)),
+                name_or_id=dict(required=True),
+            )),
+        parallelism=dict(default=4, type='int'),
     )
     module_kwargs = dict(
+        mutually_exclusive=[
+            ('resources', 'server', 'floating_ip', 'network', 'port',
+             'router', 'security_group_rule', 'security_group', 'subnet',
+             'trunk'),
+        ],
         supports_check_mode=True
     )
 
+    otce_services = ()
+
     @staticmethod
     def _get_tags_url(url_prefix, instance):
         """Construct direct REST query URL for tags"""
@@ -166,27 +266,15 @@ class TagModule(OTCModule):
             % {'url_prefix': url_prefix, 'instance': instance.id}
         )
 
-    @staticmethod
-    def _get_tag_url(url_prefix, instance, tag):
-        """Construct direct REST query URL for individual tag"""
-        return (
-            '%(url_prefix)s/%(instance)s/tags/%(tag)s'
-            % {
-                'url_prefix': url_prefix,
-                'instance': instance.id,
-                'tag': tag
-            }
-        )
-
-    def fetch_tags(self, url_prefix, microver, instance):
+    def fetch_tags(self, endpoint, url_prefix, microver, instance):
         """Get current tags"""
         result = None
         try:
-            inst = instance.fetch_tags(self.conn)
+            inst = instance.fetch_tags(endpoint)
             result = inst.tags
         except AttributeError:
             # Try a low-level access if SDK version is old
-            response = self.conn.get(
+            response = endpoint.get(
                 self._get_tags_url(url_prefix, instance),
                 microversion=microver)
 
@@ -197,16 +285,16 @@ class TagModule(OTCModule):
 
         return result
 
-    def replace_tags(self, url_prefix, microver, instance, tags):
+    def replace_tags(self, endpoint, url_prefix, microver, instance, tags):
         """Replace all tags at once"""
         result = None
         try:
-            inst = instance.set_tags(self.conn, tags)
+            inst = instance.set_tags(endpoint, tags)
             result = inst.tags
         except AttributeError:
             # Try a low-level access if SDK version is old
             data = {'tags': tags}
-            response = self.conn.put(
+            response = endpoint.put(
                 self._get_tags_url(url_prefix, instance),
                 json=data, microversion=microver)
             if response.content and response.status_code < 400:
@@ -216,39 +304,130 @@ class TagModule(OTCModule):
                     msg='API returned something bad %s' % response.reason)
         return result
 
-    def set_tags(self, url_prefix, microver, instance, tags):
-        """Set tag on a server one by one"""
-        try:
-            for tag in tags:
-                instance.add_tag(self.conn, tag)
-        except AttributeError:
-            # Try a low-level access if SDK version is old
-            for tag in tags:
-                response = self.conn.put(
-                    self._get_tag_url(url_prefix, instance, tag),
-                    microversion=microver)
-                if response.status_code not in [201, 204]:
+    def set_tags(self, endpoint, url_prefix, microver, instance,
+                 current_tags, tags):
+        """Add missing tags with a single replace of all tags"""
+        desired = list(current_tags) + [
+            tag for tag in tags if tag not in current_tags]
+        return self.replace_tags(
+            endpoint, url_prefix, microver, instance, desired)
+
+    def delete_tags(self, endpoint, url_prefix, microver, instance,
+                    current_tags, tags):
+        """Remove tags with a single replace of all tags"""
+        desired = [tag for tag in current_tags if tag not in tags]
+        return self.replace_tags(
+            endpoint, url_prefix, microver, instance, desired)
+
+    @staticmethod
+    def _desired_tags(current_tags, new_tags, state, mode):
+        """Return the tags a resource should end up with"""
+        if state == 'absent':
+            return [tag for tag in current_tags if tag not in new_tags]
+        if mode == 'set':
+            return list(current_tags) + [
+                tag for tag in new_tags if tag not in current_tags]
+        return list(new_tags)
+
+    @staticmethod
+    def _listed_tags(instance):
+        """Return the tags of a listed resource or None if not listed
+
+        The SDK defaults `tags` to an empty list, so only the attributes
+        present in the listing body tell whether the tags are known.
+        """
+        if 'tags' not in instance._body.attributes:
+            return None
+        return instance.tags or []
+
+    def _resolve_resources(self, targets):
+        """Resolve targets with one listing per resource type"""
+        indexes = {}
+        resolved = []
+        for target in targets:
+            res_type = target['type']
+            if res_type not in indexes:
+                service, list_function = RESOURCE_TYPES[res_type][:2]
+                by_id = {}
+                by_name = {}
+                for item in getattr(getattr(self.conn, service),
+                                    list_function)():
+                    by_id[item.id] = item
+                    name = getattr(item, 'name', None)
+                    if name:
+                        by_name.setdefault(name, []).append(item)
+                indexes[res_type] = (by_id, by_name)
+            by_id, by_name = indexes[res_type]
+            name_or_id = target['name_or_id']
+            instance = by_id.get(name_or_id)
+            if instance is None:
+                matches = by_name.get(name_or_id, [])
+                if len(matches) > 1:
+                    self.fail_json(
+                        msg='More than one %s with name %s found'
+                            % (res_type, name_or_id))
+                if not matches:
                     self.fail_json(
-                        msg='API returned something bad %s' % response.reason)
-        return self.fetch_tags(url_prefix, microver, instance)
+                        msg='Instance %s can not be found' % name_or_id)
+                instance = matches[0]
+            resolved.append((target, instance))
+        return resolved
 
-    def delete_tags(self, url_prefix, microver, instance, tags):
-        """Set tag on a resource one by one"""
+    def _tag_resources(self, targets, new_tags, state, mode):
+        """Tag many resources, changed ones are updated concurrently"""
+        api_calls = []
+
+        def count(response, *args, **kwargs):
+            api_calls.append(response.request.method)
+
+        hooks = self.conn.session.session.hooks['response']
+        hooks.append(count)
         try:
-            for tag in tags:
-                instance.remove_tag(self.conn, tag)
-        except AttributeError:
-            # Try a low-level access if SDK version is old
-            for tag in tags:
-                response = self.conn.delete(
-                    self._get_tag_url(url_prefix, instance, tag),
-                    microversion=microver)
-                if response.status_code not in [204, 404]:
-                    self.fail_json(
-                        msg='API returned something bad %s' % response.reason)
-        return self.fetch_tags(url_prefix, microver, instance)
+            results = []
+            pending = []
+            for target, instance in self._resolve_resources(targets):
+                service, _, url_prefix, microver = \
+                    RESOURCE_TYPES[target['type']]
+                endpoint = getattr(self.conn, service)
+                current_tags = self._listed_tags(instance)
+                if current_tags is None:
+                    # Not part of the listing, i.e. old compute microversion
+                    current_tags = self.fetch_tags(
+                        endpoint, url_prefix, microver, instance)
+                desired = self._desired_tags(
+                    current_tags, new_tags, state, mode)
+                changed = set(desired) != set(current_tags)
+                result = dict(
+                    type=target['type'], name_or_id=target['name_or_id'],
+                    id=instance.id, changed=changed, tags=desired)
+                results.append(result)
+                if changed and not self.ansible.check_mode:
+                    pending.append((result, endpoint, url_prefix, microver,
+                                    instance, desired))
+
+            if pending:
+                workers = max(1, min(self.params['parallelism'],
+                                     len(pending)))
+                with concurrent.futures.ThreadPoolExecutor(workers) as pool:
+                    futures = [
+                        (result, pool.submit(self.replace_tags, *args))
+                        for result, *args in pending]
+                    for result, future in futures:
+                        result['tags'] = future.result()
+        finally:
+            hooks.remove(count)
+
+        self.exit_json(
+            changed=any(result['changed'] for result in results),
+            resources=results,
+            api_calls=len(api_calls))
 
     def run(self):
+        if self.params['resources']:
+            self._tag_resources(
+                self.params['resources'], self.params['tags'] or [],
+                self.params['state'], self.params['mode'])
+
         server = self.params['server']
         floating_ip = self.params['floating_ip']
         network = self.params['network']
@@ -316,7 +495,7 @@ class TagModule(OTCModule):
 
         if instance:
             current_tags = self.fetch_tags(
-                self, endpoint, url_prefix, microver, instance)
+                endpoint, url_prefix, microver, instance)
             if state == 'present':
                 if mode == 'replace' and set(current_tags) != set(new_tags):
                     # Any of the tags mismatch
@@ -338,16 +517,15 @@ class TagModule(OTCModule):
             if state == 'present':
                 if mode == 'replace':
                     tags = self.replace_tags(
-                        self, endpoint, url_prefix, microver,
-                        instance, new_tags)
+                        endpoint, url_prefix, microver, instance, new_tags)
                 elif mode == 'set':
                     tags = self.set_tags(
-                        self, endpoint, url_prefix, microver,
-                        instance, new_tags)
+                        endpoint, url_prefix, microver, instance,
+                        current_tags, new_tags)
             elif state == 'absent':
                 tags = self.delete_tags(
-                    self, endpoint, url_prefix, microver,
-                    instance, new_tags)
+                    endpoint, url_prefix, microver, instance,
+                    current_tags, new_tags)
 
             self.exit_json(
                 changed=changed,
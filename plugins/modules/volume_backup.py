@@ -91,6 +91,12 @@ backup:
             description: Name given to the load balancer.
             type: str
             sample: "elb_test"
+polls:
+    description: Number of status polls done while waiting for the backup to
+        become available or to be deleted.
+    returned: When I(wait=true) and a backup was created or deleted
+    type: int
+    sample: 7
 '''
 
 EXAMPLES = '''
@@ -129,6 +135,8 @@ class VolumeBackupModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ()
+
     def _system_state_change(self, obj):
         state = self.params['state']
         if state == 'present':
@@ -139,57 +147,31 @@ class VolumeBackupModule(OTCModule):
         return False
 
     def find_backup(self, backup):
-        res = None
-        try:
-            res = self.conn.block_storage.get_backup(backup)
-        except self.sdk.exceptions.ResourceNotFound:
-            pass
-        if not res:
-            objs = list(self.conn.block_storage.backups(
-                name=backup))
-            if len(objs) == 1:
-                res = objs[0]
-            elif len(objs) > 1:
-                self.fail_json(msg='More than one backup with name %s '
-                               'found' % backup)
-        return res
+        return self.find_by_name_or_id(
+            self.conn.block_storage.get_backup,
+            lambda name: self.conn.block_storage.backups(name=name),
+            backup, kind='backup')
 
     def find_volume(self, volume):
-        res = None
-        try:
-            res = self.conn.block_storage.get_volume(volume)
-        except self.sdk.exceptions.ResourceNotFound:
-            pass
+        res = self.find_by_name_or_id(
+            self.conn.block_storage.get_volume,
+            lambda name: self.conn.block_storage.volumes(
+                details=False, name=name),
+            volume, kind='volume')
         if not res:
-            objs = list(self.conn.block_storage.volumes(
-                details=False, name=volume))
-            if len(objs) == 1:
-                res = objs[0]
-            elif len(objs) > 1:
-                self.fail_json(msg='More than one volume with name %s '
-                               'found' % volume)
-            else:
-                self.fail_json(msg='No volume with name %s '
-                               'can be found in cloud.' % volume)
+            self.fail_json(msg='No volume with name %s '
+                           'can be found in cloud.' % volume)
         return res
 
     def find_snapshot(self, snapshot):
-        res = None
-        try:
-            res = self.conn.block_storage.get_snapshot(snapshot)
-        except self.sdk.exceptions.ResourceNotFound:
-            pass
+        res = self.find_by_name_or_id(
+            self.conn.block_storage.get_snapshot,
+            lambda name: self.conn.block_storage.snapshots(
+                details=False, name=name),
+            snapshot, kind='snapshot')
         if not res:
-            objs = list(self.conn.block_storage.snapshots(
-                details=False, name=snapshot))
-            if len(objs) == 1:
-                res = objs[0]
-            elif len(objs) > 1:
-                self.fail_json(msg='More than one snapshot with name %s '
-                               'found' % snapshot)
-            else:
-                self.fail_json(msg='No snapshot with name %s '
-                               'can be found in cloud.' % snapshot)
+            self.fail_json(msg='No snapshot with name %s '
+                           'can be found in cloud.' % snapshot)
         return res
 
     def run(self):
@@ -256,10 +238,10 @@ class VolumeBackupModule(OTCModule):
                     )
                 else:
                     try:
-                        backup = self.conn.block_storage.wait_for_status(
-                            backup,
-                            status='available',
-                            wait=timeout)
+                        backup = self.waiter(
+                            timeout, 'volume_backup').wait_for_status(
+                                self.conn.block_storage, backup,
+                                'available', ['error'])
                         self.exit_json(
                             changed=True,
                             volume_backup=backup.to_dict(),
@@ -288,10 +270,8 @@ class VolumeBackupModule(OTCModule):
                 self.conn.block_storage.delete_backup(backup)
                 if self.params['wait']:
                     try:
-                        self.conn.block_storage.wait_for_delete(
-                            backup,
-                            interval=2,
-                            wait=timeout)
+                        self.waiter(timeout, 'volume_backup').wait_for_delete(
+                            self.conn.block_storage, backup)
                     except self.sdk.exceptions.ResourceTimeout:
                         self.fail_json(
                             msg='Timeout failure waiting for backup '
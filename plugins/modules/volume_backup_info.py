@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: volume_backup_info
 short_description: Get Backups
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.3"
 author: "Vladimir Hasko (@vladimirhasko)"
 description:
@@ -57,10 +59,10 @@ EXAMPLES = '''
   register: backup
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class VolumeBackupInfoModule(OTCModule):
+class VolumeBackupInfoModule(OTCInfoModule):
     argument_spec = dict(
         name=dict(required=False),
         volume=dict(required=False)
@@ -69,11 +71,13 @@ class VolumeBackupInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ()
+
     def run(self):
         name_filter = self.params['name']
         volume = self.params['volume']
 
-        data = []
+        data = self.result_list()
         attrs = {}
 
         if name_filter:
@@ -82,9 +86,7 @@ class VolumeBackupInfoModule(OTCModule):
             attrs['volume_id'] = self.conn.block_storage.find_volume(volume)
 
         for raw in self.conn.block_storage.backups(**attrs):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
 
         self.exit_json(
             changed=False,
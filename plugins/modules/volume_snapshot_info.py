@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: volume_snapshot_info
 short_description: Get information about volume snapshots
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.3"
 author: "Anton Sidelnikov (@anton-sidelnikov)"
 description:
@@ -89,10 +91,10 @@ EXAMPLES = '''
   register: data
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class VolumeSnapshotInfoModule(OTCModule):
+class VolumeSnapshotInfoModule(OTCInfoModule):
     argument_spec = dict(
         details=dict(default=True, type='bool'),
         name=dict(required=False),
@@ -105,6 +107,8 @@ class VolumeSnapshotInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ()
+
     def run(self):
 
         details_filter = self.params['details']
@@ -112,7 +116,7 @@ class VolumeSnapshotInfoModule(OTCModule):
         volume_filter = self.params['volume']
         status_filter = self.params['status']
 
-        data = []
+        data = self.result_list()
         query = {}
         if details_filter:
             query['details'] = details_filter
@@ -124,9 +128,7 @@ class VolumeSnapshotInfoModule(OTCModule):
             query['status'] = status_filter.lower()
 
         for raw in self.conn.block_storage.snapshots(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
 
         self.exit_json(
             changed=False,
@@ -149,6 +149,8 @@ class VpcModule(OTCModule):
         enable_shared_snat=dict(type='bool', required=False)
     )
 
+    otce_services = ('vpc',)
+
     def run(self):
 
         query = {}
@@ -172,6 +174,8 @@ class VpcModule(OTCModule):
         if state == 'present':
             if not vpc:
                 new_vpc = self.conn.vpc.create_vpc(**query)
+                # A VPC is a router as well
+                self.invalidate_resolved('vpc', 'router')
                 if routes or enable_shared_snat is not None:
                     query_update = {}
                     if routes:
@@ -189,6 +193,8 @@ class VpcModule(OTCModule):
                     attrs['enable_shared_snat'] = enable_shared_snat
                 if attrs:
                     updated_vpc = self.conn.vpc.update_vpc(vpc=vpc.id, **attrs)
+                    if 'name' in attrs:
+                        self.invalidate_resolved('vpc', 'router')
                     self.exit_json(changed=True, vpc=updated_vpc)
                 else:
                     self.exit(changed=False, vpc=vpc)
@@ -196,6 +202,7 @@ class VpcModule(OTCModule):
             if vpc:
                 if not self.ansible.check_mode:
                     self.conn.vpc.delete_vpc(vpc.id)
+                    self.invalidate_resolved('vpc', 'router')
                 self.exit(changed=True)
             else:
                 self.exit(changed=False)
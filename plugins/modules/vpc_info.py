@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: vpc_info
 short_description: Get vpc info from OpenTelekomCloud
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.11.1"
 author: "Polina Gubina(@polina-gubina)"
 description:
@@ -69,10 +71,10 @@ EXAMPLES = '''
   register: vpc_info
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class VpcInfoModule(OTCModule):
+class VpcInfoModule(OTCInfoModule):
     argument_spec = dict(
         name_or_id=dict(required=False)
     )
@@ -81,19 +83,17 @@ class VpcInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('vpc',)
+
     def run(self):
-        data = []
+        data = self.result_list()
 
         if self.params['name_or_id']:
             raw = self.conn.vpc.find_vpc(name_or_id=self.params['name_or_id'])
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
         else:
             for raw in self.conn.vpc.vpcs():
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.add(raw)
 
         self.exit_json(
             changed=False,
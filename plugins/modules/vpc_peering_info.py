@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: vpc_peering_info
 short_description: Get information about vpc peerings
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.4"
 author: "Polina Gubina (@polina-gubina)"
 description:
@@ -91,10 +93,10 @@ EXAMPLES = '''
   register: vpc_peering
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class VPCPeeringInfoModule(OTCModule):
+class VPCPeeringInfoModule(OTCInfoModule):
     argument_spec = dict(
         name=dict(required=False),
         status=dict(required=False, choices=['pending_acceptance', 'rejected', 'expired', 'deleted', 'active']),
@@ -105,6 +107,8 @@ class VPCPeeringInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('vpc',)
+
     def run(self):
 
         name_filter = self.params['name']
@@ -112,7 +116,7 @@ class VPCPeeringInfoModule(OTCModule):
         project_id_filter = self.params['project_id']
         router = self.params['router']
 
-        data = []
+        data = self.result_list()
         query = {}
         if name_filter:
             query['name'] = name_filter
@@ -125,9 +129,7 @@ class VPCPeeringInfoModule(OTCModule):
             query['vpc_id'] = router_obj['id']
 
         for raw in self.conn.vpc.peerings(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
 
         self.exit_json(
             changed=False,
@@ -125,6 +125,8 @@ class VPCPeeringModeModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('vpc',)
+
     def run(self):
         name = self.params['name']
 
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: vpc_route_info
 short_description: Get information about vpc routes info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.2.0"
 author: "Polina Gubina (@polina-gubina)"
 description:
@@ -85,10 +87,10 @@ EXAMPLES = '''
 '''
 
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class VPCRouteInfoModule(OTCModule):
+class VPCRouteInfoModule(OTCInfoModule):
     argument_spec = dict(
         id=dict(required=False),
         project_id=dict(required=False),
@@ -100,6 +102,8 @@ class VPCRouteInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('vpc',)
+
     def run(self):
 
         id_filter = self.params['id']
@@ -108,7 +112,7 @@ class VPCRouteInfoModule(OTCModule):
         destination_filter = self.params['destination']
         type_filter = self.params['type']
 
-        data = []
+        data = self.result_list()
         query = {}
         if id_filter:
             query['id'] = id_filter
@@ -124,9 +128,7 @@ class VPCRouteInfoModule(OTCModule):
             query['type'] = type_filter
 
         for raw in self.conn.vpc.routes(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
 
         self.exit_json(
             changed=False,
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: vpn_service_info
 short_description: Query VPN services.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.5.0"
 author: "Irina Pereiaslavskaia (@irina-pereiaslavskaia)"
 description:
@@ -116,10 +118,10 @@ EXAMPLES = '''
   register: vpn_services
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class VpnServicesInfoModule(OTCModule):
+class VpnServicesInfoModule(OTCInfoModule):
     argument_spec = dict(
         admin_state_up=dict(type='bool', required=False),
         description=dict(type='str', required=False),
@@ -139,6 +141,8 @@ class VpnServicesInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ()
+
     def run(self):
         admin_state_up = self.params['admin_state_up']
         description = self.params['description']
@@ -150,7 +154,7 @@ class VpnServicesInfoModule(OTCModule):
         project_id = self.params['project_id']
         vpn_service = self.params['vpn_service']
 
-        data = []
+        data = self.result_list()
         query = {}
         if vpn_service:
             vpn = self.conn.network.find_vpn_service(name_or_id=vpn_service)
@@ -190,9 +194,7 @@ class VpnServicesInfoModule(OTCModule):
             query['status'] = status.upper()
 
         for raw in self.conn.network.vpn_services(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.add(raw)
 
         self.exit(
             changed=False,
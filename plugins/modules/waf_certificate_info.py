@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: waf_certificate_info
 short_description: Get WAF certificate info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.3"
 author: "Artem Goncharov (@gtema)"
 description:
@@ -56,10 +58,10 @@ EXAMPLES = '''
   register: cert
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class WafCertificateInfoModule(OTCModule):
+class WafCertificateInfoModule(OTCInfoModule):
     argument_spec = dict(
         name=dict(required=False),
     )
@@ -68,23 +70,20 @@ class WafCertificateInfoModule(OTCModule):
     )
 
     otce_min_version = '0.8.0'
+    otce_services = ('waf',)
 
     def run(self):
 
-        data = []
+        data = self.result_list()
 
         if self.params['name']:
             raw = self.conn.waf.find_certificate(
                 self.params['name'], ignore_missing=True)
             if raw:
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.add(raw)
         else:
             for raw in self.conn.waf.certificates():
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.add(raw)
 
         self.exit(
             changed=False,
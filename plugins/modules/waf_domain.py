@@ -139,6 +139,7 @@ class WafDomainModule(OTCModule):
         supports_check_mode=True
     )
     otce_min_version = '0.9.0'
+    otce_services = ('waf',)
 
     def _check_server_client_protocol(self, server: list):
         for srv in server:
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: waf_domain_info
 short_description: Get WAF domain info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.3"
 author: "Anton Sidelnikov (@anton-sidelnikov)"
 description:
@@ -76,10 +78,10 @@ EXAMPLES = '''
   register: domain
 '''
 
-from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCInfoModule
 
 
-class WafDomainInfoModule(OTCModule):
+class WafDomainInfoModule(OTCInfoModule):
     argument_spec = dict(
         name=dict(required=False)
     )
@@ -88,23 +90,20 @@ class WafDomainInfoModule(OTCModule):
     )
 
     otce_min_version = '0.9.0'
+    otce_services = ('waf',)
 
     def run(self):
-        data = []
+        data = self.result_list()
 
         if self.params['name']:
             raw = self.conn.waf.find_domain(name_or_id=self.params['name'], ignore_missing=True)
             if raw:
                 if not raw.server:
                     raw = self.conn.waf.get_domain(raw.id)
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.add(raw)
         else:
             for raw in self.conn.waf.domains():
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.add(raw)
 
         self.exit(
             changed=False,
@@ -0,0 +1,83 @@
+import http.server
+import os
+import shutil
+import stat
+import tempfile
+import threading
+import time
+
+from unittest import TestCase
+
+import requests
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils import (
+    broker
+)
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        body = b'{"path": "%s"}' % self.path.encode('ascii')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class BrokerTest(TestCase):
+
+    def setUp(self):
+        # Unix socket paths are limited to about 100 characters
+        self.tmp = tempfile.mkdtemp(dir='/tmp')
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+        self.path = os.path.join(self.tmp, 'broker', 'broker.sock')
+
+        self.http = http.server.HTTPServer(('127.0.0.1', 0), Handler)
+        self.addCleanup(self.http.server_close)
+        thread = threading.Thread(target=self.http.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self.addCleanup(self.http.shutdown)
+        self.url = 'http://127.0.0.1:%d' % self.http.server_port
+        self.config = dict(auth_type='none', auth=dict(endpoint=self.url),
+                           region_name='test')
+
+    def _wait_for_shutdown(self, timeout=15):
+        deadline = time.time() + timeout
+        while os.path.exists(self.path) and time.time() < deadline:
+            time.sleep(0.1)
+        return not os.path.exists(self.path)
+
+    def test_round_trip(self):
+        """Ensure the broker starts, proxies a request and exits when idle"""
+        client = broker.start_broker(self.path, idle_timeout=1)
+        self.assertTrue(client.available())
+        mode = stat.S_IMODE(os.stat(self.path).st_mode)
+        self.assertEqual(mode & 0o077, 0)
+
+        adapter = broker.BrokerAdapter(client, 'key', self.config)
+        request = requests.Request('GET', self.url + '/v1/things').prepare()
+        response = adapter.send(request, timeout=10)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'path': '/v1/things'})
+        self.assertEqual(response.headers['content-type'],
+                         'application/json')
+
+        # A running broker is reused
+        self.assertEqual(
+            broker.start_broker(self.path, idle_timeout=1).path, self.path)
+
+        self.assertTrue(self._wait_for_shutdown())
+        self.assertFalse(client.available())
+
+    def test_error_reply(self):
+        """Ensure failures in the broker are raised in the client"""
+        client = broker.start_broker(self.path, idle_timeout=1)
+        with self.assertRaises(broker.BrokerError):
+            client.call(dict(op='unknown', key='key', config=self.config))
+        self.assertTrue(self._wait_for_shutdown())
@@ -0,0 +1,309 @@
+import os
+import shutil
+import stat
+import tempfile
+
+from unittest import TestCase, mock
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils import (
+    cache
+)
+
+
+class CacheTestCase(TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+        self.path = os.path.join(self.tmp, 'kind', 'key.json')
+        self.now = 1000.0
+        patcher = mock.patch.object(cache.time, 'time', lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class ConfigCacheKeyTest(TestCase):
+
+    def _cloud_region(self, region='eu-de', parent=None, **auth):
+        config = dict(auth=auth)
+        if parent:
+            config['parent_cache_key'] = parent
+        cloud_region = mock.Mock(config=config)
+        cloud_region.get_region_name.return_value = region
+        return cloud_region
+
+    def test_key(self):
+        """Ensure the key depends on identity, project and region only"""
+        key = cache.config_cache_key(self._cloud_region(
+            auth_url='https://iam', username='user', password='secret',
+            project_name='project'))
+        self.assertEqual(key, cache.config_cache_key(self._cloud_region(
+            auth_url='https://iam', username='user', password='other',
+            project_name='project')))
+        self.assertNotEqual(key, cache.config_cache_key(self._cloud_region(
+            auth_url='https://iam', username='other', password='secret',
+            project_name='project')))
+        self.assertNotEqual(key, cache.config_cache_key(self._cloud_region(
+            region='eu-nl', auth_url='https://iam', username='user',
+            password='secret', project_name='project')))
+
+    def test_token_scopes(self):
+        """Ensure token scopes of different users get different keys"""
+        def key(token, parent):
+            return cache.config_cache_key(self._cloud_region(
+                parent=parent, auth_url='https://iam', token=token,
+                project_id='project'))
+
+        self.assertEqual(key('t1', 'user1'), key('t2', 'user1'))
+        self.assertNotEqual(key('t1', 'user1'), key('t1', 'user2'))
+        self.assertNotEqual(key('t1', 'user1'), key('t1', None))
+
+
+class FileCacheTest(CacheTestCase):
+
+    def test_round_trip(self):
+        """Ensure a saved document is loaded and readable by the owner only"""
+        file_cache = cache.FileCache(self.path)
+        self.assertIsNone(file_cache.load())
+        file_cache.save({'a': [1, 2]})
+        self.assertEqual(file_cache.load(), {'a': [1, 2]})
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o600)
+        self.assertEqual(
+            stat.S_IMODE(os.stat(os.path.dirname(self.path)).st_mode)
+            & 0o077, 0)
+        self.assertEqual(os.listdir(os.path.dirname(self.path)),
+                         ['key.json'])
+
+    def test_broken(self):
+        """Ensure a broken document is treated as missing"""
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, 'w') as fp:
+            fp.write('{"a": ')
+        self.assertIsNone(cache.FileCache(self.path).load())
+
+    def test_remove(self):
+        """Ensure removing works whether the document exists or not"""
+        file_cache = cache.FileCache(self.path)
+        file_cache.remove()
+        file_cache.save({})
+        file_cache.remove()
+        self.assertFalse(os.path.exists(self.path))
+
+
+class FakeDiscover(object):
+
+    def __init__(self, versions):
+        self.versions = versions
+
+    def raw_version_data(self, **kwargs):
+        return self.versions
+
+
+class DiscoveryCacheTest(CacheTestCase):
+
+    def test_ttl(self):
+        """Ensure only documents younger than the TTL are served"""
+        cache.FileCache(self.path).save({
+            'https://old': dict(fetched_at=self.now - 100, versions=[1]),
+            'https://new': dict(fetched_at=self.now - 10, versions=[2]),
+            'https://broken': 'broken',
+        })
+        discovery = cache.DiscoveryCache(cache.FileCache(self.path), 50)
+        self.assertIsNone(discovery.get('https://old'))
+        self.assertIsNone(discovery.get('https://broken'))
+        disc = discovery.get('https://new')
+        self.assertEqual(disc._url, 'https://new')
+        self.assertEqual(disc._data, [2])
+        # Served from memory afterwards
+        self.assertIs(discovery.get('https://new'), disc)
+        self.assertEqual((discovery.hits, discovery.misses), (1, 2))
+
+    def test_save(self):
+        """Ensure fetched documents are added to the stored ones"""
+        file_cache = cache.FileCache(self.path)
+        file_cache.save({
+            'https://a': dict(fetched_at=self.now, versions=['a'])})
+        discovery = cache.DiscoveryCache(file_cache, 50)
+        discovery.get('https://a')
+        discovery.save()
+        self.assertEqual(list(file_cache.load()), ['https://a'])
+
+        self.assertIsNone(discovery.get('https://b'))
+        discovery['https://b'] = FakeDiscover(['b'])
+        self.now += 5
+        discovery.save()
+        self.assertEqual(file_cache.load(), {
+            'https://a': dict(fetched_at=self.now - 5, versions=['a']),
+            'https://b': dict(fetched_at=self.now, versions=['b']),
+        })
+
+
+class ResolverCacheTest(CacheTestCase):
+
+    def test_ttl(self):
+        """Ensure mappings older than the TTL are dropped"""
+        cache.FileCache(self.path).save({
+            'network.router': {
+                'old': dict(id='1', fetched_at=self.now - 100),
+                'new': dict(id='2', fetched_at=self.now - 10)},
+            'network.broken': 'broken',
+        })
+        resolver = cache.ResolverCache(cache.FileCache(self.path), 50)
+        self.assertIsNone(resolver.get('network.router', 'old'))
+        self.assertEqual(resolver.get('network.router', 'new'), '2')
+        self.assertIsNone(resolver.get('network.broken', 'new'))
+        self.assertEqual((resolver.hits, resolver.misses), (1, 2))
+
+    def test_save_merges(self):
+        """Ensure mappings stored by concurrent runs are kept"""
+        file_cache = cache.FileCache(self.path)
+        resolver = cache.ResolverCache(file_cache, 50)
+        resolver.set('network.router', 'a', '1')
+        cache.FileCache(self.path).save({
+            'network.router': {'b': dict(id='2', fetched_at=self.now)},
+            'vpc.vpc': {'c': dict(id='3', fetched_at=self.now)}})
+        resolver.save()
+        stored = cache.ResolverCache(file_cache, 50)
+        self.assertEqual(stored.get('network.router', 'a'), '1')
+        self.assertEqual(stored.get('network.router', 'b'), '2')
+        self.assertEqual(stored.get('vpc.vpc', 'c'), '3')
+
+    def test_invalidate(self):
+        """Ensure invalidation drops a kind of all services on save"""
+        file_cache = cache.FileCache(self.path)
+        file_cache.save({
+            'vpc.subnet': {'a': dict(id='1', fetched_at=self.now)},
+            'network.subnet': {'b': dict(id='2', fetched_at=self.now)},
+            'network.router': {'c': dict(id='3', fetched_at=self.now)}})
+        resolver = cache.ResolverCache(file_cache, 50)
+        resolver.set('network.subnet', 'd', '4')
+        resolver.invalidate('subnet')
+        self.assertIsNone(resolver.get('vpc.subnet', 'a'))
+        self.assertIsNone(resolver.get('network.subnet', 'd'))
+
+        # Stored by a concurrent run before this one saves
+        file_cache.save(dict(file_cache.load(), **{
+            'vpc.subnet': {'e': dict(id='5', fetched_at=self.now)}}))
+        resolver.set('network.subnet', 'f', '6')
+        resolver.save()
+        self.assertEqual(file_cache.load(), {
+            'network.router': {'c': dict(id='3', fetched_at=self.now)},
+            'network.subnet': {'f': dict(id='6', fetched_at=self.now)}})
+
+    def test_save_unchanged(self):
+        """Ensure runs only reading mappings do not write the file"""
+        resolver = cache.ResolverCache(cache.FileCache(self.path), 50)
+        resolver.get('network.router', 'a')
+        resolver.save()
+        self.assertFalse(os.path.exists(self.path))
+
+
+FLAVORS = [
+    dict(id='1', name='s.small', vcpus='2', ram=4,
+         az_status={'az1': 'normal', 'az2': 'sellout'}),
+    dict(id='2', name='s.large', vcpus='8', ram=32,
+         az_status={'az1': 'normal', 'az2': 'normal'}),
+    dict(id='3', name='s.medium', vcpus='4', ram=None,
+         az_status={'az2': 'normal'}),
+    dict(id='4', name='s.large', vcpus='4', ram=16, az_status=None),
+]
+
+
+class CatalogTest(TestCase):
+
+    def test_find(self):
+        """Ensure entries are found by one or several attributes"""
+        catalog = cache.Catalog(FLAVORS)
+        self.assertEqual([entry['id'] for entry in catalog.find(
+            name='s.large')], ['2', '4'])
+        self.assertEqual([entry['id'] for entry in catalog.find(
+            name='s.large', vcpus='4')], ['4'])
+        self.assertEqual(catalog.find(name='s.tiny'), [])
+        self.assertEqual(len(catalog.find()), 4)
+
+    def test_lookup(self):
+        """Ensure IDs take precedence over names"""
+        catalog = cache.Catalog(FLAVORS + [dict(id='s.small', name='x')])
+        self.assertEqual(catalog.lookup('3'), [FLAVORS[2]])
+        self.assertEqual(catalog.lookup('s.small')[0]['name'], 'x')
+        self.assertEqual(len(catalog.lookup('s.large')), 2)
+        self.assertEqual(catalog.lookup('missing'), [])
+
+
+class CatalogCacheTest(CacheTestCase):
+
+    def test_ttl(self):
+        """Ensure catalogs older than the TTL are not served"""
+        cache.FileCache(self.path).save({
+            'old': dict(fetched_at=self.now - 100, entries=FLAVORS),
+            'new': dict(fetched_at=self.now - 10, entries=FLAVORS[:1]),
+        })
+        catalogs = cache.CatalogCache(cache.FileCache(self.path), 50)
+        self.assertIsNone(catalogs.get('old'))
+        catalog = catalogs.get('new')
+        self.assertTrue(catalog.cached)
+        self.assertEqual(catalog.entries, FLAVORS[:1])
+        self.assertIs(catalogs.get('new'), catalog)
+        self.assertEqual((catalogs.hits, catalogs.misses), (1, 1))
+
+    def test_save_merges(self):
+        """Ensure fetched catalogs replace stored ones on save"""
+        file_cache = cache.FileCache(self.path)
+        file_cache.save({
+            'a': dict(fetched_at=self.now - 10, entries=[]),
+            'b': dict(fetched_at=self.now - 10, entries=[])})
+        catalogs = cache.CatalogCache(file_cache, 50)
+        catalog = catalogs.set('b', FLAVORS)
+        self.assertFalse(catalog.cached)
+        self.assertIs(catalogs.get('b'), catalog)
+        catalogs.save()
+        self.assertEqual(file_cache.load(), {
+            'a': dict(fetched_at=self.now - 10, entries=[]),
+            'b': dict(fetched_at=self.now, entries=FLAVORS)})
+
+    def test_save_unchanged(self):
+        """Ensure runs only reading catalogs do not write the file"""
+        catalogs = cache.CatalogCache(cache.FileCache(self.path), 50)
+        catalogs.get('a')
+        catalogs.save()
+        self.assertFalse(os.path.exists(self.path))
+
+
+class CatalogSelectTest(TestCase):
+
+    def _ids(self, **kwargs):
+        return [entry['id']
+                for entry in cache.Catalog(FLAVORS).select(**kwargs)]
+
+    def test_no_constraints(self):
+        """Ensure all entries are returned in catalog order"""
+        self.assertEqual(self._ids(), ['1', '2', '3', '4'])
+
+    def test_attrs(self):
+        """Ensure entries have to equal all attributes"""
+        self.assertEqual(self._ids(attrs=dict(name='s.large')), ['2', '4'])
+
+    def test_minimum(self):
+        """Ensure numeric strings compare as numbers, missing values fail"""
+        self.assertEqual(self._ids(minimum=dict(vcpus=4)), ['2', '3', '4'])
+        self.assertEqual(self._ids(minimum=dict(vcpus=4, ram=0)),
+                         ['2', '4'])
+
+    def test_available_in(self):
+        """Ensure entries have to be in status normal in the zone"""
+        self.assertEqual(self._ids(available_in='az1'), ['1', '2'])
+        self.assertEqual(self._ids(available_in='az2'), ['2', '3'])
+
+    def test_order_by_nan_last(self):
+        """Ensure entries without a value go last in both directions"""
+        self.assertEqual(self._ids(order_by=['ram']), ['1', '4', '2', '3'])
+        self.assertEqual(self._ids(order_by=['-ram']), ['2', '4', '1', '3'])
+        self.assertEqual(self._ids(order_by=['vcpus', '-ram']),
+                         ['1', '4', '3', '2'])
+
+    def test_limit(self):
+        """Ensure the limit applies after sorting"""
+        self.assertEqual(
+            self._ids(minimum=dict(vcpus=4), order_by=['vcpus'], limit=2),
+            ['3', '4'])
+        self.assertEqual(self._ids(limit=0), [])
@@ -0,0 +1,466 @@
+import json
+import shutil
+import tempfile
+
+from unittest import TestCase, mock
+
+import openstack
+import requests
+
+from openstack import proxy, resource
+
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_bytes
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils import (
+    otc
+)
+
+
+def set_module_args(args):
+    """prepare arguments so that they will be picked up during module creation"""
+    args = json.dumps({'ANSIBLE_MODULE_ARGS': args})
+    basic._ANSIBLE_ARGS = to_bytes(args)
+
+
+def exit_json(*args, **kwargs):
+    """function to patch over exit_json; package return data into an exception"""
+    if 'changed' not in kwargs:
+        kwargs['changed'] = False
+    raise AnsibleExitJson(kwargs)
+
+
+def fail_json(*args, **kwargs):
+    """function to patch over fail_json; package return data into an exception"""
+    kwargs['failed'] = True
+    raise AnsibleFailJson(kwargs)
+
+
+class AnsibleExitJson(Exception):
+    """Exception class to be raised by module.exit_json and caught by the test case"""
+    pass
+
+
+class AnsibleFailJson(Exception):
+    """Exception class to be raised by module.fail_json and caught by the test case"""
+    pass
+
+
+class FakeModule(otc.OTCModule):
+
+    def run(self):
+        pass
+
+
+class FakeInfoModule(otc.OTCInfoModule):
+
+    def run(self):
+        pass
+
+
+class FakeResource(dict):
+    """Resource serialized by to_dict like SDK resources"""
+
+    def to_dict(self):
+        return dict(self)
+
+
+class ModuleTestCase(TestCase):
+
+    def setUp(self):
+        self.mock_module_helper = mock.patch.multiple(
+            basic.AnsibleModule,
+            exit_json=exit_json,
+            fail_json=fail_json)
+        self.mock_module_helper.start()
+        self.addCleanup(self.mock_module_helper.stop)
+        self.conn = mock.MagicMock()
+
+    def module(self, module_class=FakeInfoModule, **params):
+        set_module_args(params)
+        with mock.patch.object(
+                module_class, 'openstack_cloud_from_module',
+                return_value=(openstack, self.conn)):
+            return module_class()
+
+
+class ProjectFieldsTest(TestCase):
+
+    def test_fields(self):
+        """Ensure only the selected, possibly nested, attributes are kept"""
+        item = dict(id='1', name='a', status='ACTIVE',
+                    flavor=dict(id='f', name='s2', ram=4),
+                    nodes=[dict(id='n1', role='master'),
+                           dict(id='n2', role='slave'), 'other'])
+        self.assertEqual(
+            otc.project_fields(
+                item, ['id', 'flavor.name', 'flavor.ram', 'nodes.role',
+                       'missing', 'status.nested']),
+            dict(id='1', flavor=dict(name='s2', ram=4),
+                 nodes=[dict(role='master'), dict(role='slave'), 'other']))
+
+    def test_drop_none(self):
+        """Ensure keys without value are dropped recursively"""
+        self.assertEqual(
+            otc.drop_none(dict(a=None, b=dict(c=None, d=1),
+                               e=[dict(f=None, g=0)])),
+            dict(b=dict(d=1), e=[dict(g=0)]))
+
+
+class ResultListTest(ModuleTestCase):
+
+    def test_add(self):
+        """Ensure resources are serialized without location"""
+        data = otc.ResultList(lambda item: item)
+        data.add(FakeResource(id='1', location='loc', name='a'))
+        data.add(FakeResource(id='2', location='loc', name='b'),
+                 drop=('location', 'name'))
+        self.assertEqual(data, [dict(id='1', name='a'), dict(id='2')])
+        self.assertEqual(data.count, 2)
+
+    def test_shape(self):
+        """Ensure fields and compact apply while resources are appended"""
+        data = self.module(fields=['id', 'name'], compact=True).result_list()
+        data.add(FakeResource(id='1', name=None, status='ACTIVE'))
+        data.extend([dict(id='2', name='b')])
+        self.assertEqual(data, [dict(id='1'), dict(id='2', name='b')])
+
+    def test_ids_only(self):
+        """Ensure only IDs are returned without serializing resources"""
+        data = self.module(ids_only=True).result_list()
+        resource = mock.Mock()
+        resource.get.return_value = '1'
+        data.add(resource)
+        resource.to_dict.assert_not_called()
+        self.assertEqual(data, ['1'])
+
+    def test_plain_lists(self):
+        """Ensure plain resource lists in the result are shaped on exit"""
+        module = self.module(fields=['id'])
+        with self.assertRaises(AnsibleExitJson) as result:
+            module.exit_json(changed=False,
+                             items=[dict(id='1', name='a')],
+                             nested=dict(items=[dict(id='2', name='b')]),
+                             names=['a'])
+        result = result.exception.args[0]
+        self.assertEqual(result['items'], [dict(id='1')])
+        # Only lists created by result_list are shaped in nested dicts
+        self.assertEqual(result['nested'],
+                         dict(items=[dict(id='2', name='b')]))
+        self.assertEqual(result['names'], ['a'])
+
+
+class Thing(resource.Resource):
+    base_path = '/things'
+    resources_key = 'things'
+    allow_list = True
+
+    _query_mapping = resource.QueryParameters(
+        'name', status='server_status')
+
+    name = resource.Body('name')
+
+
+class CannedAdapter(requests.adapters.BaseAdapter):
+    """Transport adapter answering every request with the same body"""
+
+    def __init__(self, body):
+        super().__init__()
+        self.body = body
+        self.urls = []
+
+    def send(self, request, **kwargs):
+        self.urls.append(request.url)
+        response = requests.Response()
+        response.status_code = 200
+        response.headers['Content-Type'] = 'application/json'
+        response._content = json.dumps(self.body).encode('utf-8')
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+
+class CountTest(ModuleTestCase):
+
+    def _proxy(self, body):
+        # Proxies only keep a weak reference to their connection
+        self.sdk_conn = openstack.connect(
+            auth_type='none', auth=dict(endpoint='http://svc/v1'),
+            region_name='test')
+        adapter = CannedAdapter(body)
+        self.sdk_conn.session.session.mount('http://', adapter)
+        return proxy.Proxy(session=self.sdk_conn.session,
+                           service_type='thing',
+                           endpoint_override='http://svc/v1'), adapter
+
+    def test_api_total(self):
+        """Ensure the total is read from a single resource page"""
+        service, adapter = self._proxy(dict(things=[dict(id='1')],
+                                            total_count=42))
+        module = self.module(count_only=True)
+        self.assertEqual(module.api_total(
+            service, Thing, 'total_count', status='ok', name='a',
+            limit=50), 42)
+        self.assertEqual(
+            adapter.urls,
+            ['http://svc/v1/things?limit=1&name=a&server_status=ok'])
+        self.assertEqual(module.api_total(
+            service, Thing, 'total_count', base_path='/other'), 42)
+        self.assertEqual(adapter.urls[-1], 'http://svc/v1/other?limit=1')
+        self.assertEqual(service.session.session.hooks['response'], [])
+
+    def test_api_total_paging(self):
+        """Ensure paging parameters do not narrow the total"""
+        service, adapter = self._proxy(dict(things=[dict(id='1')],
+                                            total_count=42))
+        self.assertEqual(self.module(count_only=True).api_total(
+            service, Thing, 'total_count', limit=5, marker='m', offset=10),
+            42)
+        self.assertEqual(adapter.urls, ['http://svc/v1/things?limit=1'])
+
+    def test_api_total_missing(self):
+        """Ensure APIs not reporting a total return None"""
+        service, _ = self._proxy(dict(things=[], total_count='many'))
+        self.assertIsNone(self.module(count_only=True).api_total(
+            service, Thing, 'total_count'))
+
+    def test_count_only(self):
+        """Ensure resources are only counted"""
+        module = self.module(count_only=True)
+        data = module.result_list()
+        data.add(FakeResource(id='1'))
+        data.extend([dict(id='2')])
+        with self.assertRaises(AnsibleExitJson) as result:
+            module.exit_json(changed=False, things=data)
+        result = result.exception.args[0]
+        self.assertNotIn('things', result)
+        self.assertEqual(result['counts'], dict(things=2))
+
+
+class RegionInfoModule(otc.OTCInfoModule):
+
+    def run(self):
+        if self.conn.region == 'bad':
+            self.fail_json(msg='broken')
+        if self.conn.region == 'crash':
+            raise KeyError('missing')
+        data = self.result_list()
+        data.add(FakeResource(id=self.conn.region))
+        self.exit_json(changed=False, things=data)
+
+
+class MergeResultsTest(ModuleTestCase):
+
+    def test_merge_results(self):
+        """Ensure lists are joined, dicts merged and counts summed"""
+        self.assertEqual(
+            otc.merge_results([
+                dict(changed=False, items=[1], counts=dict(items=1),
+                     nested=dict(a=[1], b='first'), msg='first'),
+                dict(changed=True, items=[2, 3], counts=dict(items=2),
+                     nested=dict(a=[2], b='second'), msg='second'),
+                dict(changed=False, items=[], counts=dict(other=4)),
+            ]),
+            dict(changed=True, items=[1, 2, 3],
+                 counts=dict(items=3, other=4),
+                 nested=dict(a=[1, 2], b='first'), msg='first'))
+
+    def _run(self, regions):
+        module = self.module(RegionInfoModule, regions=regions)
+        module.connect = lambda **kwargs: mock.Mock(
+            region=kwargs['region_name'])
+        module.connect_kwargs = dict(cloud='otc')
+        return module
+
+    def test_regions(self):
+        """Ensure every region is queried and results are annotated"""
+        with self.assertRaises(AnsibleExitJson) as result:
+            self._run(['eu-de', 'eu-nl'])()
+        self.assertEqual(
+            result.exception.args[0]['things'],
+            [dict(id='eu-de', region='eu-de'),
+             dict(id='eu-nl', region='eu-nl')])
+
+    def test_region_failure(self):
+        """Ensure a failing region fails the module naming the region"""
+        with self.assertRaises(AnsibleFailJson) as result:
+            self._run(['eu-de', 'bad'])()
+        self.assertEqual(result.exception.args[0]['msg'],
+                         'region bad: broken')
+
+    def test_region_exception(self):
+        """Ensure unexpected errors of a region fail the module"""
+        with self.assertRaises(AnsibleFailJson) as result:
+            self._run(['eu-de', 'crash'])()
+        result = result.exception.args[0]
+        self.assertEqual(result['msg'], "region crash: KeyError: 'missing'")
+        self.assertIn('Traceback', result['exception'])
+
+    def test_region_connect_error(self):
+        """Ensure a region which can not be connected fails the module"""
+        module = self._run(['eu-de', 'eu-nl'])
+
+        def connect(**kwargs):
+            if kwargs['region_name'] == 'eu-nl':
+                raise OSError('unreachable')
+            return mock.Mock(region=kwargs['region_name'])
+
+        module.connect = connect
+        with self.assertRaises(AnsibleFailJson) as result:
+            module()
+        self.assertEqual(result.exception.args[0]['msg'],
+                         'region eu-nl: OSError: unreachable')
+
+
+class ProjectScopesTest(ModuleTestCase):
+
+    def test_project_scopes(self):
+        """Ensure project scopes are keyed by the module connection"""
+        response = mock.Mock(status_code=200)
+        response.json.return_value = dict(projects=[
+            dict(id='p1', name='eu-de_one'), dict(id='p2', name='eu-de_two')])
+        self.conn.identity.get.return_value = response
+        self.conn.auth_token = 'token'
+        self.conn.config.get_auth.return_value.auth_url = 'https://iam'
+        module = self.module()
+        with mock.patch.object(otc, 'config_cache_key',
+                               return_value='parent') as key:
+            scopes = module.project_scopes(['eu-de_one', 'p2'])
+        key.assert_called_once_with(self.conn.config)
+        self.assertEqual(scopes, [
+            (dict(project='eu-de_one'),
+             dict(auth_type='v3token', parent_cache_key='parent',
+                  auth=dict(auth_url='https://iam', token='token',
+                            project_id='p1'))),
+            (dict(project='eu-de_two'),
+             dict(auth_type='v3token', parent_cache_key='parent',
+                  auth=dict(auth_url='https://iam', token='token',
+                            project_id='p2'))),
+        ])
+
+    def test_unknown_project(self):
+        """Ensure projects not available to the user fail the module"""
+        response = mock.Mock(status_code=200)
+        response.json.return_value = dict(projects=[])
+        self.conn.identity.get.return_value = response
+        self.conn.config.config = dict(auth={})
+        self.conn.config.get_region_name.return_value = 'eu-de'
+        with self.assertRaises(AnsibleFailJson):
+            self.module().project_scopes(['other'])
+
+
+class CatalogInfoModule(otc.OTCInfoModule):
+
+    listed = 0
+
+    def run(self):
+        region = self.conn.region
+
+        def list_flavors():
+            CatalogInfoModule.listed += 1
+            return [FakeResource(id=region)]
+
+        data = self.result_list()
+        for entry in self.catalog('flavors', list_flavors).entries:
+            data.append(entry)
+        self.exit_json(changed=False, flavors=data)
+
+
+class RegionCatalogTest(ModuleTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+        CatalogInfoModule.listed = 0
+
+    def _connect(self, **kwargs):
+        conn = mock.Mock(region=kwargs['region_name'])
+        conn.config.config = dict(auth={})
+        conn.config.get_region_name.return_value = kwargs['region_name']
+        return conn
+
+    def _run(self):
+        module = self.module(
+            CatalogInfoModule, regions=['eu-de', 'eu-nl'],
+            catalog_cache=True, cache_dir=self.tmp)
+        module.connect = self._connect
+        module.connect_kwargs = {}
+        with self.assertRaises(AnsibleExitJson) as result:
+            module()
+        return result.exception.args[0]['flavors']
+
+    def test_catalog_per_region(self):
+        """Ensure every region run uses the catalog cache of its region"""
+        expected = [dict(id='eu-de', region='eu-de'),
+                    dict(id='eu-nl', region='eu-nl')]
+        self.assertEqual(self._run(), expected)
+        self.assertEqual(CatalogInfoModule.listed, 2)
+        self.assertEqual(self._run(), expected)
+        self.assertEqual(CatalogInfoModule.listed, 2)
+
+
+class FindByNameOrIdTest(ModuleTestCase):
+
+    uuid = '8b6c2f5e-44e1-4f52-a6c5-0e5d2f7c1a90'
+
+    def _resource(self, id, name):
+        resource = mock.Mock(id=id)
+        resource.name = name
+        return resource
+
+    def _find(self, name_or_id, get, listing, match=None):
+        module = self.module(FakeModule)
+        return module.find_by_name_or_id(
+            get, lambda name: iter(listing), name_or_id, 'subnet', match)
+
+    def test_id(self):
+        """Ensure UUIDs are fetched without listing"""
+        resource = self._resource(self.uuid, 'a')
+        get = mock.Mock(return_value=resource)
+        list_resources = mock.Mock()
+        self.assertIs(self.module(FakeModule).find_by_name_or_id(
+            get, list_resources, self.uuid), resource)
+        get.assert_called_once_with(self.uuid)
+        list_resources.assert_not_called()
+
+    def test_name(self):
+        """Ensure names are looked up in the listing only"""
+        resource = self._resource(self.uuid, 'a')
+        get = mock.Mock()
+        self.assertIs(self._find(
+            'a', get, [self._resource('x', 'ab'), resource]), resource)
+        get.assert_not_called()
+
+    def test_unknown_id(self):
+        """Ensure IDs rejected with 404 or 400 fall back to the listing"""
+        resource = self._resource('x', self.uuid)
+        for error in (openstack.exceptions.ResourceNotFound,
+                      openstack.exceptions.BadRequestException):
+            get = mock.Mock(side_effect=error('nope'))
+            self.assertIs(self._find(self.uuid, get, [resource]), resource)
+        get = mock.Mock(side_effect=openstack.exceptions.BadRequestException)
+        self.assertIsNone(self._find(self.uuid.replace('-', ''), get, []))
+
+    def test_match(self):
+        """Ensure resources failing the additional check are skipped"""
+        first = self._resource('1', 'a')
+        second = self._resource('2', 'a')
+        self.assertIs(self._find(
+            'a', mock.Mock(), [first, second],
+            match=lambda resource: resource.id == '2'), second)
+
+    def test_second_match(self):
+        """Ensure the listing stops at the second match and fails"""
+        listing = iter([self._resource('1', 'a'), self._resource('2', 'a'),
+                        self._resource('3', 'b')])
+        with self.assertRaises(AnsibleFailJson) as result:
+            self._find('a', mock.Mock(), listing)
+        self.assertEqual(
+            result.exception.args[0]['msg'],
+            'More than one subnet with name a found, please use the ID '
+            'instead')
+        self.assertEqual([resource.id for resource in listing], ['3'])
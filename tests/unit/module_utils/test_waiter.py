@@ -0,0 +1,236 @@
+import types
+
+from unittest import TestCase, mock
+
+from openstack import exceptions
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils import (
+    waiter
+)
+
+
+class FakeClock(object):
+    """Clock advanced by sleep instead of waiting"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeResource(object):
+
+    def __init__(self, id, statuses, name=None):
+        self.id = id
+        self.name = name
+        self.statuses = list(statuses)
+        self.fetch_kwargs = []
+
+    def fetch(self, session, skip_cache=False):
+        self.fetch_kwargs.append(dict(skip_cache=skip_cache))
+        status = self.statuses.pop(0) if len(self.statuses) > 1 \
+            else self.statuses[0]
+        if status is None:
+            raise exceptions.ResourceNotFound('gone')
+        return types.SimpleNamespace(id=self.id, name=self.name,
+                                     status=status)
+
+
+class PlainResource(object):
+    """Resource whose fetch does not know skip_cache"""
+
+    id = 'plain'
+    name = None
+
+    def fetch(self, session):
+        return types.SimpleNamespace(id=self.id, name=None, status='active')
+
+
+class WaiterTest(TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch.multiple(
+            waiter.time, time=self.clock.time, sleep=self.clock.sleep)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # No jitter
+        patcher = mock.patch.object(
+            waiter.random, 'uniform', lambda a, b: (a + b) / 2.0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_backoff(self):
+        """Ensure the interval grows exponentially up to the cap"""
+        polls = iter([None] * 6 + ['done'])
+        w = waiter.Waiter(600, 'cce_job')
+        self.assertEqual(w.wait(lambda: next(polls)), 'done')
+        self.assertEqual(self.clock.sleeps, [5, 10, 20, 40, 60, 60, 60])
+        self.assertEqual(w.polls, 7)
+
+    def test_immediate_first_poll(self):
+        """Ensure profiles with a first delay of 0 poll right away"""
+        polls = iter([None, 'done'])
+        w = waiter.Waiter(60, 'vpc')
+        self.assertEqual(w.wait(lambda: next(polls)), 'done')
+        self.assertEqual(self.clock.sleeps, [0, 1])
+
+    def test_timeout(self):
+        """Ensure the wait fails once the timeout expired"""
+        w = waiter.Waiter(10)
+        with self.assertRaises(exceptions.ResourceTimeout) as e:
+            w.wait(lambda: None, 'too slow')
+        self.assertEqual(str(e.exception), 'too slow')
+        self.assertEqual(sum(self.clock.sleeps), 10)
+
+    def test_retry_after(self):
+        """Ensure throttled polls are retried after the requested delay"""
+        response = mock.Mock(status_code=429, headers={'Retry-After': '7'})
+        throttled = exceptions.HttpException(response=response)
+        results = [throttled, 'done']
+
+        def poll():
+            result = results.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        self.assertEqual(waiter.Waiter(60).wait(poll), 'done')
+        self.assertEqual(self.clock.sleeps, [1, 7])
+
+    def test_http_error(self):
+        """Ensure errors without Retry-After are raised"""
+        def poll():
+            raise exceptions.HttpException(
+                response=mock.Mock(status_code=500, headers={}))
+
+        with self.assertRaises(exceptions.HttpException):
+            waiter.Waiter(60).wait(poll)
+
+    def test_wait_for_status(self):
+        """Ensure status is compared case insensitive without cache"""
+        resource = FakeResource('id', ['BUILD', 'BUILD', 'ACTIVE'])
+        current = waiter.Waiter(60).wait_for_status(
+            None, resource, 'active', ['ERROR'])
+        self.assertEqual(current.status, 'ACTIVE')
+        self.assertEqual(resource.fetch_kwargs,
+                         [dict(skip_cache=True)] * 3)
+
+    def test_wait_for_status_reached(self):
+        """Ensure a resource already in the status is not polled"""
+        resource = types.SimpleNamespace(id='id', name=None, status='ACTIVE')
+        w = waiter.Waiter(60, 'volume_backup')
+        self.assertIs(
+            w.wait_for_status(None, resource, 'active', ['error']), resource)
+        self.assertEqual(self.clock.sleeps, [])
+        self.assertEqual(w.polls, 0)
+
+    def test_wait_for_status_failed(self):
+        """Ensure a resource already in a failure status fails the wait"""
+        resource = types.SimpleNamespace(id='id', name=None, status='ERROR')
+        with self.assertRaises(exceptions.ResourceFailure):
+            waiter.Waiter(60).wait_for_status(
+                None, resource, 'active', ['error'])
+        self.assertEqual(self.clock.sleeps, [])
+
+    def test_wait_for_status_plain_fetch(self):
+        """Ensure resources without skip_cache can be waited for"""
+        current = waiter.Waiter(60).wait_for_status(
+            None, PlainResource(), 'active')
+        self.assertEqual(current.id, 'plain')
+
+    def test_wait_for_status_failure(self):
+        """Ensure a failure status fails the wait right away"""
+        resource = FakeResource('id', ['BUILD', 'error'], name='res')
+        with self.assertRaises(exceptions.ResourceFailure) as e:
+            waiter.Waiter(60).wait_for_status(
+                None, resource, 'ACTIVE', ['ERROR'])
+        self.assertIn('res transitioned to failure state error',
+                      str(e.exception))
+
+    def test_wait_for_status_timeout(self):
+        """Ensure a resource stuck in a status times out"""
+        resource = FakeResource('id', ['BUILD'])
+        with self.assertRaises(exceptions.ResourceTimeout):
+            waiter.Waiter(30).wait_for_status(None, resource, 'ACTIVE')
+
+    def test_wait_for_all_status(self):
+        """Ensure finished resources are not fetched again"""
+        fast = FakeResource('fast', ['ACTIVE'])
+        slow = FakeResource('slow', ['BUILD', 'BUILD', 'ACTIVE'])
+        done = waiter.Waiter(60).wait_for_all_status(
+            None, [slow, fast], 'ACTIVE')
+        self.assertEqual([resource.id for resource in done],
+                         ['slow', 'fast'])
+        self.assertEqual(len(fast.fetch_kwargs), 1)
+        self.assertEqual(len(slow.fetch_kwargs), 3)
+        self.assertEqual(waiter.Waiter(60).wait_for_all_status(
+            None, [], 'ACTIVE'), [])
+
+    def test_wait_for_all_status_reached(self):
+        """Ensure resources already in the status are not fetched"""
+        ready = types.SimpleNamespace(id='ready', name=None, status='ACTIVE')
+        slow = FakeResource('slow', ['BUILD', 'ACTIVE'])
+        done = waiter.Waiter(60).wait_for_all_status(
+            None, [ready, slow], 'ACTIVE')
+        self.assertEqual([resource.id for resource in done],
+                         ['ready', 'slow'])
+        self.assertIs(done[0], ready)
+        self.assertEqual(len(slow.fetch_kwargs), 2)
+        self.clock.sleeps = []
+        self.assertEqual(waiter.Waiter(60).wait_for_all_status(
+            None, [ready], 'ACTIVE'), [ready])
+        self.assertEqual(self.clock.sleeps, [])
+
+    def test_wait_for_list_status(self):
+        """Ensure one listing per poll checks all resources"""
+        listings = [
+            [mock.Mock(id='a', lifecycle_state='PENDING'),
+             mock.Mock(id='b', lifecycle_state='INSERVICE')],
+            [mock.Mock(id='a', lifecycle_state='INSERVICE'),
+             mock.Mock(id='b', lifecycle_state='INSERVICE'),
+             mock.Mock(id='c', lifecycle_state='ERROR')],
+        ]
+        found = waiter.Waiter(60).wait_for_list_status(
+            lambda: listings.pop(0), ['a', 'b'], 'INSERVICE', ['ERROR'],
+            attribute='lifecycle_state')
+        self.assertEqual(sorted(resource.id for resource in found),
+                         ['a', 'b'])
+
+    def test_wait_for_list_status_failure(self):
+        """Ensure a watched resource in failure status fails the wait"""
+        listing = [types.SimpleNamespace(id='a', name='a', status='ERROR')]
+        with self.assertRaises(exceptions.ResourceFailure):
+            waiter.Waiter(60).wait_for_list_status(
+                lambda: listing, ['a'], 'ACTIVE', ['error'])
+
+    def test_wait_for_list_delete(self):
+        """Ensure the wait ends once no watched resource is listed"""
+        listings = [[mock.Mock(id='a'), mock.Mock(id='b')],
+                    [mock.Mock(id='b')],
+                    [mock.Mock(id='c')]]
+        self.assertEqual(
+            sorted(waiter.Waiter(60).wait_for_list_delete(
+                lambda: listings.pop(0), ['a', 'b'])),
+            ['a', 'b'])
+        self.assertEqual(listings, [])
+
+    def test_wait_for_delete(self):
+        """Ensure the wait ends once the resource is not found"""
+        resource = FakeResource('id', ['DELETING', None])
+        self.assertIs(
+            waiter.Waiter(60).wait_for_delete(None, resource), resource)
+        self.assertEqual(resource.fetch_kwargs,
+                         [dict(skip_cache=True)] * 2)
+
+    def test_wait_for_delete_timeout(self):
+        """Ensure a resource which is never deleted times out"""
+        resource = FakeResource('id', ['DELETING'])
+        with self.assertRaises(exceptions.ResourceTimeout):
+            waiter.Waiter(10).wait_for_delete(None, resource)
@@ -0,0 +1,72 @@
+import json
+import types
+
+from unittest import TestCase, mock
+
+import openstack
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_bytes
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils import (
+    waiter
+)
+from ansible_collections.opentelekomcloud.cloud.plugins.modules import (
+    as_instance
+)
+
+
+def set_module_args(args):
+    """prepare arguments so that they will be picked up during module creation"""
+    args = json.dumps({'ANSIBLE_MODULE_ARGS': args})
+    basic._ANSIBLE_ARGS = to_bytes(args)
+
+
+def group(status):
+    return types.SimpleNamespace(id='g', name='group', status=status)
+
+
+class ASInstanceTest(TestCase):
+
+    def setUp(self):
+        self.conn = mock.MagicMock()
+        self.module = as_instance.ASInstanceModule
+        self.module.openstack_cloud_from_module = \
+            mock.MagicMock(return_value=(openstack, self.conn))
+        set_module_args({'scaling_group': 'group',
+                         'scaling_instances': ['a']})
+        self.sleeps = []
+        patcher = mock.patch.object(
+            waiter.time, 'sleep', self.sleeps.append)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.submitted = []
+        self.conn.auto_scaling.batch_instance_action.side_effect = \
+            lambda group, instances, **kwargs: self.submitted.append(
+                (group.status, instances))
+
+    def test_batches_wait_for_group(self):
+        """Ensure every batch after the first waits for the group"""
+        self.conn.auto_scaling.get_group.side_effect = [
+            group('SCALING'), group('INSERVICE'), group('INSERVICE')]
+        self.module()._batch_instances_action(
+            [['a'], ['b'], ['c']], group('INSERVICE'), 60, 'add')
+        self.assertEqual(self.submitted, [
+            ('INSERVICE', ['a']), ('INSERVICE', ['b']), ('INSERVICE', ['c'])])
+        self.assertEqual(self.conn.auto_scaling.get_group.call_count, 3)
+        self.assertEqual(len(self.sleeps), 3)
+
+    def test_single_batch_group_inservice(self):
+        """Ensure a single batch is submitted without polling the group"""
+        self.module()._batch_instances_action(
+            [['a']], group('INSERVICE'), 60, 'add')
+        self.assertEqual(self.submitted, [('INSERVICE', ['a'])])
+        self.conn.auto_scaling.get_group.assert_not_called()
+        self.assertEqual(self.sleeps, [])
+
+    def test_group_error(self):
+        """Ensure a group in error state fails the remaining batches"""
+        self.conn.auto_scaling.get_group.return_value = group('ERROR')
+        with self.assertRaises(openstack.exceptions.ResourceFailure):
+            self.module()._batch_instances_action(
+                [['a'], ['b']], group('SCALING'), 60, 'add')
+        self.assertEqual(self.submitted, [])
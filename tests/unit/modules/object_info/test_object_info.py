@@ -0,0 +1,83 @@
+import json
+
+from unittest import TestCase, mock
+
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_bytes
+
+from ansible_collections.opentelekomcloud.cloud.plugins.modules import (
+    object_info
+)
+
+
+def set_module_args(args):
+    """prepare arguments so that they will be picked up during module creation"""
+    args = json.dumps({'ANSIBLE_MODULE_ARGS': args})
+    basic._ANSIBLE_ARGS = to_bytes(args)
+
+
+class ObjectInfoTest(TestCase):
+
+    def setUp(self):
+        self.conn = mock.MagicMock()
+        self.module = object_info.SwiftInfoModule
+        self.module.openstack_cloud_from_module = \
+            mock.MagicMock(return_value=(self.conn, self.conn))
+        self.requests = []
+
+    def _list(self, objects, **params):
+        """List a container of `objects` entries, returning the names"""
+        names = ['obj%03d' % i for i in range(objects)]
+
+        def get(url, params, headers):
+            self.requests.append(dict(params))
+            start = names.index(params['marker']) + 1 \
+                if 'marker' in params else 0
+            page = names[start:start + params['limit']]
+            return mock.Mock(status_code=200, json=lambda: [
+                dict(name=name) for name in page])
+
+        self.conn.object_store.get.side_effect = get
+        set_module_args(dict(params, container='c'))
+        module = self.module()
+        listed = [entry['name'] for entry in module._list_objects('c')]
+        return listed, module.listing_truncated
+
+    def test_list_no_limit(self):
+        """Ensure a short page ends the listing without extra request"""
+        listed, truncated = self._list(3)
+        self.assertEqual(len(listed), 3)
+        self.assertFalse(truncated)
+        self.assertEqual(self.requests, [dict(format='json', limit=10000)])
+
+    def test_list_limit(self):
+        """Ensure pages of `limit` entries are requested until exhausted"""
+        listed, truncated = self._list(5, limit=2)
+        self.assertEqual(len(listed), 5)
+        self.assertFalse(truncated)
+        self.assertEqual([r.get('marker') for r in self.requests],
+                         [None, 'obj001', 'obj003'])
+
+    def test_list_max_items_exhausted(self):
+        """Ensure a short last page reaching max_items is not truncated"""
+        listed, truncated = self._list(4, limit=3, max_items=4)
+        self.assertEqual(len(listed), 4)
+        self.assertFalse(truncated)
+        self.assertEqual([r['limit'] for r in self.requests], [3, 2])
+
+    def test_list_max_items_truncated(self):
+        """Ensure a listing stopped on a full page is truncated"""
+        listed, truncated = self._list(10, limit=3, max_items=4)
+        self.assertEqual(listed, ['obj000', 'obj001', 'obj002', 'obj003'])
+        self.assertTrue(truncated)
+        self.assertEqual(len(self.requests), 2)
+
+    def test_list_max_items_single_page(self):
+        """Ensure one request decides whether more entries follow"""
+        listed, truncated = self._list(5, max_items=5)
+        self.assertEqual(len(listed), 5)
+        self.assertFalse(truncated)
+        listed, truncated = self._list(6, max_items=5)
+        self.assertEqual(len(listed), 5)
+        self.assertTrue(truncated)
+        self.assertEqual([r['limit'] for r in self.requests], [6, 6])
@@ -121,6 +121,14 @@ class RdsInstanceTest(TestCase):
             client_key=None,
             api_timeout=None,
             sdk_log_path=None,
+            auth_cache=False,
+            cache_dir=None,
+            discovery_cache=False,
+            resolve_cache=False,
+            catalog_cache=False,
+            cache_ttl=3600,
+            broker=False,
+            broker_idle_timeout=600,
             availability_zone=None,
             backup_keepdays=None,
             backup_timeframe=None,
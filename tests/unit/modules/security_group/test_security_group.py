@@ -0,0 +1,112 @@
+import json
+
+from unittest import TestCase, mock
+
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_bytes
+
+from ansible_collections.opentelekomcloud.cloud.plugins.modules import (
+    security_group
+)
+
+
+def set_module_args(args):
+    """prepare arguments so that they will be picked up during module creation"""
+    args = json.dumps({'ANSIBLE_MODULE_ARGS': args})
+    basic._ANSIBLE_ARGS = to_bytes(args)
+
+
+def fail_json(*args, **kwargs):
+    """function to patch over fail_json; package return data into an exception"""
+    kwargs['failed'] = True
+    raise AnsibleFailJson(kwargs)
+
+
+class AnsibleFailJson(Exception):
+    """Exception class to be raised by module.fail_json and caught by the test case"""
+    pass
+
+
+class SecurityGroupTest(TestCase):
+
+    def setUp(self):
+        self.conn = mock.MagicMock()
+        self.module = security_group.SecurityGroupModule
+        self.module.openstack_cloud_from_module = \
+            mock.MagicMock(return_value=(self.conn, self.conn))
+        self.module.fail_json = fail_json
+        set_module_args({'name': 'test'})
+        self.secgroup = mock.MagicMock(id='sg')
+
+    def _reconcile(self, existing, desired, exclusive=False):
+        self.conn.network.security_group_rules.return_value = existing
+        self.conn.network.create_security_group_rules.side_effect = \
+            lambda data: data
+        return self.module()._reconcile_rules(
+            self.secgroup, desired, exclusive)
+
+    def test_rule_key_any_port(self):
+        """Ensure -1 ports compare equal to the None neutron stores"""
+        module = self.module()
+        self.assertEqual(
+            module._rule_key({'protocol': 'tcp', 'port_range_min': -1,
+                              'port_range_max': '-1'}),
+            module._rule_key({'protocol': 'tcp', 'port_range_min': None,
+                              'port_range_max': None}))
+
+    def test_rule_key_remote_ip_prefix(self):
+        """Ensure catch-all and host prefixes are normalized"""
+        module = self.module()
+        self.assertEqual(
+            module._rule_key({'remote_ip_prefix': '0.0.0.0/0'}),
+            module._rule_key({}))
+        self.assertEqual(
+            module._rule_key({'ethertype': 'IPv6',
+                              'remote_ip_prefix': '::/0'}),
+            module._rule_key({'ethertype': 'IPv6'}))
+        self.assertEqual(
+            module._rule_key({'remote_ip_prefix': '10.0.0.1/24'}),
+            module._rule_key({'remote_ip_prefix': '10.0.0.0/24'}))
+
+    def test_reconcile_any_port_unchanged(self):
+        """Ensure an existing all ports rule is not created again"""
+        existing = {'direction': 'ingress', 'ether_type': 'IPv4',
+                    'protocol': 'tcp', 'port_range_min': None,
+                    'port_range_max': None, 'remote_ip_prefix': None}
+        changed, rules = self._reconcile(
+            [existing],
+            [{'protocol': 'tcp', 'port_range_min': -1,
+              'port_range_max': -1, 'remote_ip_prefix': '0.0.0.0/0'}],
+            exclusive=True)
+        self.assertFalse(changed)
+        self.assertEqual(rules, [existing])
+        self.conn.network.create_security_group_rules.assert_not_called()
+        self.conn.network.delete_security_group_rule.assert_not_called()
+
+    def test_reconcile_create_payload(self):
+        """Ensure -1 ports and catch-all prefixes are not sent"""
+        changed, rules = self._reconcile(
+            [],
+            [{'protocol': 'udp', 'port_range_min': -1,
+              'port_range_max': -1, 'remote_ip_prefix': '0.0.0.0/0'}])
+        self.assertTrue(changed)
+        self.conn.network.create_security_group_rules.assert_called_once_with(
+            [{'direction': 'ingress', 'ethertype': 'IPv4',
+              'protocol': 'udp', 'security_group_id': 'sg'}])
+
+    def test_reconcile_create_project(self):
+        """Ensure the project of a rule is sent as tenant_id"""
+        self._reconcile(
+            [], [{'protocol': 'tcp', 'port_range_min': 22,
+                  'port_range_max': 22, 'project_id': 'other'}])
+        self.conn.network.create_security_group_rules.assert_called_once_with(
+            [{'direction': 'ingress', 'ethertype': 'IPv4',
+              'protocol': 'tcp', 'port_range_min': 22, 'port_range_max': 22,
+              'tenant_id': 'other', 'security_group_id': 'sg'}])
+
+    def test_rule_key_invalid_port(self):
+        """Ensure a port which is no number fails the module"""
+        with self.assertRaises(AnsibleFailJson) as e:
+            self.module()._rule_key({'protocol': 'tcp',
+                                     'port_range_min': 'ssh'})
+        self.assertIn('port_range_min', e.exception.args[0]['msg'])
@@ -0,0 +1,70 @@
+import json
+
+from unittest import TestCase, mock
+
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_bytes
+import openstack
+from openstack.network.v2 import port
+
+from ansible_collections.opentelekomcloud.cloud.plugins.modules import tag
+
+
+def exit_json(*args, **kwargs):
+    """function to patch over exit_json; package return data into an exception"""
+    if 'changed' not in kwargs:
+        kwargs['changed'] = False
+    raise AnsibleExitJson(kwargs)
+
+
+class AnsibleExitJson(Exception):
+    """Exception class to be raised by module.exit_json and caught by the test case"""
+    pass
+
+
+def set_module_args(args):
+    """prepare arguments so that they will be picked up during module creation"""
+    args = json.dumps({'ANSIBLE_MODULE_ARGS': args})
+    basic._ANSIBLE_ARGS = to_bytes(args)
+
+
+class TagTest(TestCase):
+
+    def setUp(self):
+        self.conn = mock.MagicMock()
+        self.module = tag.TagModule
+        self.module.openstack_cloud_from_module = \
+            mock.MagicMock(return_value=(openstack, self.conn))
+        self.module.exit_json = exit_json
+        self.conn.network.ports.return_value = [
+            port.Port.existing(id='listed', name='listed', tags=['old']),
+            port.Port.existing(id='unlisted', name='unlisted'),
+        ]
+        patcher = mock.patch.object(
+            port.Port, 'fetch_tags',
+            side_effect=lambda session: mock.Mock(tags=['old']))
+        self.fetch_tags = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _run(self, **params):
+        set_module_args(dict(
+            params, _ansible_check_mode=True,
+            resources=[dict(type='port', name_or_id='listed'),
+                       dict(type='port', name_or_id='unlisted')]))
+        with self.assertRaises(AnsibleExitJson) as result:
+            self.module()()
+        return result.exception.args[0]['resources']
+
+    def test_listing_without_tags(self):
+        """Ensure tags missing in the listing are fetched"""
+        resources = self._run(tags=['new'], mode='set')
+        self.assertEqual(self.fetch_tags.call_count, 1)
+        self.assertEqual([r['tags'] for r in resources],
+                         [['old', 'new'], ['old', 'new']])
+
+    def test_listing_without_tags_unchanged(self):
+        """Ensure fetched tags matching the desired ones are unchanged"""
+        resources = self._run(tags=['old'])
+        self.assertEqual([r['changed'] for r in resources], [False, False])
+        resources = self._run(tags=['old'], state='absent')
+        self.assertEqual([r['changed'] for r in resources], [True, True])
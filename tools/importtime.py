@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Report the import time of every module of the collection.
+
+Every module under plugins/modules is imported in a fresh interpreter with
+`python -X importtime`. The cumulative import time of the module itself and
+the total of all imports done by the interpreter are reported, slowest
+module first.
+
+    python tools/importtime.py [--max-ms 200] [module ...]
+"""
+
+import argparse
+import glob
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+
+NAMESPACE = 'opentelekomcloud'
+NAME = 'cloud'
+IMPORTTIME_RE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|\s+(\S+)$')
+
+
+def collection_root():
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def prepare_collections_path(root):
+    """Return a path containing ansible_collections/<namespace>/<name>.
+
+    Returns a tuple of the path and whether it is a temporary directory.
+    """
+    parts = root.split(os.sep)
+    if parts[-3:] == ['ansible_collections', NAMESPACE, NAME]:
+        return os.sep.join(parts[:-3]), False
+    path = tempfile.mkdtemp()
+    namespace_dir = os.path.join(path, 'ansible_collections', NAMESPACE)
+    os.makedirs(namespace_dir)
+    os.symlink(root, os.path.join(namespace_dir, NAME))
+    return path, True
+
+
+def measure(python, collections_path, module):
+    """Import a module and return its cumulative and the total time in us."""
+    name = 'ansible_collections.{0}.{1}.plugins.modules.{2}'.format(
+        NAMESPACE, NAME, module)
+    env = dict(os.environ, PYTHONPATH=collections_path)
+    proc = subprocess.run(
+        [python, '-X', 'importtime', '-c', 'import ' + name],
+        env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        universal_newlines=True)
+    if proc.returncode:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    cumulative = 0
+    total = 0
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_RE.match(line)
+        if not match:
+            continue
+        total += int(match.group(1))
+        if match.group(3) == name:
+            cumulative = int(match.group(2))
+    return cumulative, total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        'modules', nargs='*',
+        help='Modules to measure, all modules by default.')
+    parser.add_argument(
+        '--python', default=sys.executable,
+        help='Interpreter to measure with.')
+    parser.add_argument(
+        '--max-ms', type=float,
+        help='Exit with an error if a module import takes longer.')
+    args = parser.parse_args()
+
+    root = collection_root()
+    modules = args.modules or sorted(
+        os.path.basename(path)[:-3]
+        for path in glob.glob(os.path.join(root, 'plugins', 'modules', '*.py'))
+        if not path.endswith('__init__.py'))
+
+    collections_path, temporary = prepare_collections_path(root)
+    results = []
+    failed = []
+    try:
+        for module in modules:
+            try:
+                cumulative, total = measure(
+                    args.python, collections_path, module)
+            except RuntimeError as e:
+                failed.append(module)
+                print('{0}: {1}'.format(module, e), file=sys.stderr)
+                continue
+            results.append((cumulative, total, module))
+    finally:
+        if temporary:
+            shutil.rmtree(collections_path)
+
+    print('{0:>12} {1:>12}  {2}'.format('module ms', 'total ms', 'module'))
+    for cumulative, total, module in sorted(results, reverse=True):
+        print('{0:>12.1f} {1:>12.1f}  {2}'.format(
+            cumulative / 1000.0, total / 1000.0, module))
+
+    slow = [module for cumulative, _, module in results
+            if args.max_ms is not None and cumulative / 1000.0 > args.max_ms]
+    if slow:
+        print('Slower than {0} ms: {1}'.format(args.max_ms, ', '.join(slow)),
+              file=sys.stderr)
+    return 1 if slow or failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())